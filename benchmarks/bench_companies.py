@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Compare the old linear company lookups against the normalized index.
+
+Usage:
+    python benchmarks/bench_companies.py
+
+Each round looks up the company names a typical board page contains: a
+mix of curated companies, differently written curated names and
+companies that are not in the list.
+"""
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from jobminer.companies import (ESTABLISHED_COMPANIES, CompanyMatcher,  # noqa: E402
+                                get_company_info, get_company_names,
+                                is_established_company)
+from jobminer.models import Company  # noqa: E402
+
+NAMES = [
+    "Snowflake", "Delivery Hero", "stripe", "Stripe, Inc.", "AWS",
+    "Acme Corp", "Tiny Startup GmbH", "Datadog (Remote)", "Amazon Web Services (AWS)", "Unknown",
+]
+LARGE_LIST = 5000
+ROUNDS = 5
+LOOKUPS = 20_000
+
+
+def linear_is_established(company_name: str) -> bool:
+    company_names_lower = [name.lower() for name in get_company_names()]
+    return company_name.lower() in company_names_lower
+
+
+def linear_company_info(company_name: str):
+    for company_data in ESTABLISHED_COMPANIES:
+        if company_data["name"].lower() == company_name.lower():
+            return Company(**company_data)
+    return None
+
+
+def linear_lookup(name: str):
+    """What each scraper did per listing before the index."""
+    if linear_is_established(name):
+        return linear_company_info(name)
+    return None
+
+
+def indexed_lookup(name: str):
+    if is_established_company(name):
+        return get_company_info(name)
+    return None
+
+
+def measure(func) -> tuple[float, int]:
+    """Best-of-N lookups per second and number of matched names."""
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for i in range(LOOKUPS):
+            func(NAMES[i % len(NAMES)])
+        best = min(best, time.perf_counter() - start)
+    matched = sum(func(name) is not None for name in NAMES)
+    return LOOKUPS / best, matched
+
+
+def cold_fuzzy_match_ms() -> float:
+    """Mean time of an uncached fuzzy match against a large company list."""
+    rng = random.Random(0)
+    words = ["".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 9)))
+             for _ in range(LARGE_LIST)]
+    suffixes = ["Labs", "Software", "Technologies", "Systems", "Inc", ""]
+    synthetic = [f"{word.title()} {rng.choice(suffixes)}".strip() for word in words]
+    matcher = CompanyMatcher({name: name for name in get_company_names() + synthetic})
+    # Misspelled names with board noise, none of which match exactly
+    queries = [f"{name[:-1]} (Remote)" for name in synthetic[::5]]
+    start = time.perf_counter()
+    for query in queries:
+        matcher.match(query)
+    return (time.perf_counter() - start) * 1000 / len(queries)
+
+
+def main():
+    indexed_lookup(NAMES[0])  # Build the index outside the timing
+    print(f"{'lookup':<10} {'lookups/s':>12} {'matched':>8}")
+    for label, func in (("linear", linear_lookup), ("indexed", indexed_lookup)):
+        rate, matched = measure(func)
+        print(f"{label:<10} {rate:>12,.0f} {matched:>5}/{len(NAMES)}")
+    print(f"\nuncached fuzzy match against {LARGE_LIST:,} names: {cold_fuzzy_match_ms():.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Compare ways of loading and saving the stored job history.
+
+Usage:
+    python benchmarks/bench_job_loading.py           # 100,000 jobs
+    python benchmarks/bench_job_loading.py 20000
+
+The history is synthetic: Greenhouse-style jobs with a company, a short
+description and an LLM analysis, written in the stored JSON format.
+"""
+import json
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from jobminer.companies import get_company_info  # noqa: E402
+from jobminer.models import JOB_LIST_ADAPTER, Job, dump_jobs, load_jobs  # noqa: E402
+
+DEFAULT_JOBS = 100_000
+
+
+def make_history(count: int) -> bytes:
+    start = datetime(2024, 1, 1)
+    company = get_company_info("Stripe")
+    jobs = [
+        Job(
+            title=f"Senior Data Engineer {i}",
+            company="Stripe",
+            company_info=company,
+            url=f"https://boards.greenhouse.io/stripe/jobs/{i}",
+            location="Remote - US",
+            is_remote=True,
+            description="Build and operate the data platform. " * 10,
+            posted_date=start + timedelta(minutes=i),
+            relevance_score=0.8,
+            llm_analysis="Strong match for a senior data engineering role.",
+            scraped_at=start + timedelta(minutes=i),
+        )
+        for i in range(count)
+    ]
+    return dump_jobs(jobs)
+
+
+def load_per_job(raw: bytes):
+    """Previous loader: json.load, then one Job(**data) per record."""
+    return [Job(**job_data) for job_data in json.loads(raw)]
+
+
+def load_constructed(raw: bytes):
+    """No validation at all; fields stay plain JSON types."""
+    return [Job.model_construct(**job_data) for job_data in json.loads(raw)]
+
+
+def load_batched_python(raw: bytes):
+    return JOB_LIST_ADAPTER.validate_python(json.loads(raw))
+
+
+def dump_per_job(jobs):
+    """Previous writer: model_dump per job, then json.dumps."""
+    return json.dumps([job.model_dump(mode="json") for job in jobs], indent=2, default=str)
+
+
+def measure(func, arg):
+    """Wall time (s) and peak traced memory (MiB) of one call."""
+    start = time.perf_counter()
+    func(arg)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    func(arg)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_JOBS
+    raw = make_history(count)
+    jobs = load_jobs(raw)
+    print(f"{count:,} jobs, {len(raw) / 1024 / 1024:.0f} MiB of JSON\n")
+    print(f"{'operation':<40} {'seconds':>8} {'peak MiB':>9}")
+    cases = [
+        ("load: json + Job(**data) (before)", load_per_job, raw),
+        ("load: json + model_construct", load_constructed, raw),
+        ("load: json + TypeAdapter.validate_python", load_batched_python, raw),
+        ("load: TypeAdapter.validate_json (after)", load_jobs, raw),
+        ("save: model_dump + json.dumps (before)", dump_per_job, jobs),
+        ("save: TypeAdapter.dump_json (after)", dump_jobs, jobs),
+    ]
+    for label, func, arg in cases:
+        seconds, peak = measure(func, arg)
+        print(f"{label:<40} {seconds:>8.2f} {peak:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Measure LLM scoring throughput against the stand-in server.
+
+Usage:
+    python benchmarks/bench_llm.py                       # both backends, default grid
+    python benchmarks/bench_llm.py --backend ollama --jobs 500 \\
+        --workers 1,4,8 --batch-sizes 1,8 --latency-ms 400 --error-rate 0.02
+
+Each combination of backend, ``LLM_WORKERS`` and ``LLM_BATCH_SIZE`` scores
+the same synthetic jobs through ``batch_analyze`` against a fresh
+``benchmarks/llm_server.py`` instance (verdict cache off), and reports
+jobs/sec, call latency percentiles and retries. Needs the ``ollama``
+and/or ``openai`` packages; backends whose package is missing are skipped.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from benchmarks.llm_server import StandInLLMServer  # noqa: E402
+from jobminer.config import settings  # noqa: E402
+from jobminer.llm_filter import OllamaFilter, OpenAICompatibleFilter, build_user_criteria  # noqa: E402
+from jobminer.models import Job  # noqa: E402
+
+TITLES = ["Senior Data Engineer", "Staff Software Engineer", "Solutions Architect", "Product Designer"]
+
+
+def make_jobs(count: int):
+    return [
+        Job(
+            title=f"{TITLES[i % len(TITLES)]} {i}",
+            company="Stripe",
+            url=f"https://boards.greenhouse.io/stripe/jobs/{i}",
+            location="Remote - US",
+            is_remote=True,
+            description="Build and operate the data platform with Python, Spark and Kafka. " * 8,
+        )
+        for i in range(count)
+    ]
+
+
+def make_filter(backend: str, server: StandInLLMServer):
+    if backend == "ollama":
+        settings.ollama_model = server.model
+        return OllamaFilter(base_url=server.url)
+    return OpenAICompatibleFilter(api_key="bench", base_url=f"{server.url}/v1", model=server.model)
+
+
+def run(backend: str, workers: int, batch_size: int, args) -> dict:
+    settings.llm_workers = workers
+    settings.llm_batch_size = batch_size
+    with StandInLLMServer(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                          tokens_per_second=args.tokens_per_second, error_rate=args.error_rate,
+                          rate_limit_rate=args.rate_limit_rate, seed=1) as server:
+        llm = make_filter(backend, server)
+        jobs = make_jobs(args.jobs)
+        start = time.perf_counter()
+        llm.batch_analyze(jobs, build_user_criteria())
+        elapsed = time.perf_counter() - start
+
+    stats = llm.stats.snapshot()
+    return {
+        "jobs/s": args.jobs / elapsed,
+        "calls": stats.calls,
+        "p50": stats.p50_latency_ms,
+        "p95": stats.p95_latency_ms,
+        "p99": stats.p99_latency_ms,
+        "retries": stats.rate_limited + stats.batch_fallbacks,
+        "unscored": sum(1 for job in jobs if job.relevance_score is None),
+    }
+
+
+def parse_ints(value: str):
+    return [int(part) for part in value.split(",") if part]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM scoring throughput benchmark")
+    parser.add_argument("--backend", choices=["ollama", "openai", "both"], default="both")
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--workers", type=parse_ints, default=[1, 4, 8])
+    parser.add_argument("--batch-sizes", type=parse_ints, default=[1, 8])
+    parser.add_argument("--latency-ms", type=float, default=100.0)
+    parser.add_argument("--jitter-ms", type=float, default=20.0)
+    parser.add_argument("--tokens-per-second", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    settings.llm_cache_enabled = False
+    settings.llm_backoff_base = 0.05
+    backends = ["ollama", "openai"] if args.backend == "both" else [args.backend]
+
+    print(f"{args.jobs} jobs, {args.latency_ms:.0f} ms latency, "
+          f"{args.error_rate:.0%} errors, {args.rate_limit_rate:.0%} rate limited")
+    print(f"{'backend':<8} {'workers':>7} {'batch':>5} {'jobs/s':>8} {'calls':>6} "
+          f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'retries':>7} {'unscored':>8}")
+    for backend in backends:
+        try:
+            __import__(backend)
+        except ImportError:
+            print(f"{backend:<8} skipped: pip install {backend}")
+            continue
+        for workers in args.workers:
+            for batch_size in args.batch_sizes:
+                row = run(backend, workers, batch_size, args)
+                print(f"{backend:<8} {workers:>7} {batch_size:>5} {row['jobs/s']:>8.1f} {row['calls']:>6} "
+                      f"{row['p50']:>8.0f} {row['p95']:>8.0f} {row['p99']:>8.0f} "
+                      f"{row['retries']:>7} {row['unscored']:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Compare full html.parser trees against strained lxml parsing on board pages.
+
+Usage:
+    python benchmarks/bench_parsing.py                      # bundled pages
+    python benchmarks/bench_parsing.py page.html:li:feature # captured pages
+
+Bundled pages are the test fixtures with their listings repeated so they
+are about the size of a live category page.
+"""
+import re
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from jobminer.scrapers.parsing import parse_listings  # noqa: E402
+
+FIXTURES = Path(__file__).resolve().parents[1] / "tests" / "fixtures"
+BUNDLED = [
+    ("wwr_programming.html", "li", "feature"),
+    ("remotive_software_dev.html", "li", "job-tile"),
+]
+REPEAT = 300
+ROUNDS = 5
+
+
+def inflate(markup: str, name: str, class_: str) -> str:
+    """Repeat every listing element so the page has realistic size."""
+    pattern = re.compile(rf'<{name} class="[^"]*\b{class_}\b[^"]*">.*?</{name}>', re.S)
+    listings = "\n".join(pattern.findall(markup))
+    return pattern.sub("", markup, count=0).replace("</ul>", listings * REPEAT + "</ul>", 1)
+
+
+def full_parse(markup: bytes, name: str, class_: str):
+    return BeautifulSoup(markup, "html.parser").find_all(name, class_=class_)
+
+
+def measure(func, markup: bytes, name: str, class_: str):
+    """Best-of-N wall time (ms) and peak traced memory (KiB) of one parse."""
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        count = len(func(markup, name, class_))
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    func(markup, name, class_)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best * 1000, peak / 1024, count
+
+
+def load_pages(argv):
+    if argv:
+        for spec in argv:
+            path, name, class_ = spec.rsplit(":", 2)
+            yield Path(path).name, Path(path).read_bytes(), name, class_
+        return
+    for filename, name, class_ in BUNDLED:
+        markup = inflate((FIXTURES / filename).read_text(), name, class_)
+        yield filename, markup.encode("utf-8"), name, class_
+
+
+def main():
+    print(f"{'page':<30} {'size KiB':>9} {'parser':<18} {'listings':>8} {'ms':>9} {'peak KiB':>10}")
+    for label, markup, name, class_ in load_pages(sys.argv[1:]):
+        for parser_name, func in (("html.parser full", full_parse), ("lxml strained", parse_listings)):
+            ms, peak, count = measure(func, markup, name, class_)
+            print(f"{label:<30} {len(markup) / 1024:>9.0f} {parser_name:<18} {count:>8} {ms:>9.1f} {peak:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
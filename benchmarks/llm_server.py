@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Stand-in LLM server for benchmarks and tests.
+
+Speaks enough of the Ollama API (``/api/generate``, ``/api/tags``) and
+the OpenAI chat completions API (``/v1/chat/completions``,
+``/v1/models``) for ``OllamaFilter`` and ``OpenAICompatibleFilter``.
+Answers are valid verdicts for the single- and multi-job prompts, so the
+whole scoring path runs without a model: jobs with "Engineer" in the
+title score 0.8, others 0.2.
+
+Usage:
+    python benchmarks/llm_server.py --port 11500 --latency-ms 300 --error-rate 0.05
+
+Then point the scraper at it, e.g. ``OLLAMA_BASE_URL=http://127.0.0.1:11500``
+or ``OPENAI_BASE_URL=http://127.0.0.1:11500/v1``.
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+
+_TITLE_RE = re.compile(r"^- Title: (.*)$", re.MULTILINE)
+_BATCH_RE = re.compile(r"Analyze these (\d+) job postings")
+
+
+class StandInLLMServer:
+    """
+    Threaded HTTP server imitating an Ollama or OpenAI-compatible backend.
+
+    Args:
+        port: Port to listen on; 0 picks a free one
+        model: Model name reported and accepted
+        latency_ms: Fixed delay before each answer (time to first token)
+        jitter_ms: Random extra delay, uniform between 0 and this
+        tokens_per_second: Generation speed; adds completion tokens / speed
+        error_rate: Fraction of requests answered with 500
+        rate_limit_rate: Fraction of requests answered with 429
+        retry_after: ``Retry-After`` seconds sent with 429s
+        seed: Seed for the random errors and jitter
+    """
+
+    def __init__(self, port: int = 0, model: str = "stand-in", latency_ms: float = 0.0,
+                 jitter_ms: float = 0.0, tokens_per_second: float = 0.0, error_rate: float = 0.0,
+                 rate_limit_rate: float = 0.0, retry_after: float = 0.1, seed: Optional[int] = None):
+        self.model = model
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.tokens_per_second = tokens_per_second
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.requests = 0
+        self.errors = 0
+        self.rate_limited = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), _handler(self))
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StandInLLMServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, kwargs={"poll_interval": 0.05},
+                                        name="llm-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """Serve in the calling thread until interrupted."""
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StandInLLMServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def outcome(self) -> Optional[int]:
+        """Status code of an injected failure for the next request, or None."""
+        with self._lock:
+            self.requests += 1
+            roll = self._random.random()
+            if roll < self.rate_limit_rate:
+                self.rate_limited += 1
+                return 429
+            if roll < self.rate_limit_rate + self.error_rate:
+                self.errors += 1
+                return 500
+            return None
+
+    def delay(self, completion_tokens: int) -> float:
+        """Seconds to wait before answering."""
+        with self._lock:
+            jitter = self._random.uniform(0, self.jitter_ms) if self.jitter_ms else 0.0
+        seconds = (self.latency_ms + jitter) / 1000
+        if self.tokens_per_second:
+            seconds += completion_tokens / self.tokens_per_second
+        return seconds
+
+
+def verdict_text(prompt: str) -> str:
+    """JSON answer to a single- or multi-job scoring prompt."""
+    titles = _TITLE_RE.findall(prompt)
+    verdicts = [(0.8, f"Stand-in verdict: {title} looks relevant") if "engineer" in title.lower()
+                else (0.2, f"Stand-in verdict: {title} looks unrelated") for title in titles] or [(0.2, "No job")]
+    if _BATCH_RE.search(prompt):
+        return json.dumps({"results": [
+            {"id": number, "score": score, "analysis": analysis}
+            for number, (score, analysis) in enumerate(verdicts, start=1)
+        ]})
+    score, analysis = verdicts[0]
+    return json.dumps({"score": score, "analysis": analysis})
+
+
+def count_tokens(text: str) -> int:
+    return len(text) // 4 + 1
+
+
+def _handler(server: StandInLLMServer):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True  # Headers and body are written separately
+
+        def log_message(self, format, *args):
+            pass  # Keep benchmark output readable
+
+        def do_GET(self):
+            if self.path == "/api/tags":
+                self._send(200, {"models": [{"name": server.model, "model": server.model}]})
+            elif self.path == "/v1/models":
+                self._send(200, {"object": "list", "data": [{"id": server.model, "object": "model"}]})
+            else:
+                self._send(404, {"error": "not found"})
+
+        def do_POST(self):
+            body = self._read_json()
+            if self.path == "/api/generate":
+                self._answer(body.get("prompt", ""), self._ollama_response)
+            elif self.path == "/v1/chat/completions":
+                messages = body.get("messages") or [{}]
+                self._answer(messages[-1].get("content", ""), self._openai_response)
+            else:
+                self._send(404, {"error": "not found"})
+
+        def _answer(self, prompt: str, build):
+            failure = server.outcome()
+            if failure == 429:
+                self._send(429, {"error": {"message": "Rate limit reached", "type": "rate_limit"}},
+                           {"Retry-After": str(server.retry_after)})
+                return
+            text = verdict_text(prompt)
+            prompt_tokens, completion_tokens = count_tokens(prompt), count_tokens(text)
+            time.sleep(server.delay(completion_tokens))
+            if failure == 500:
+                self._send(500, {"error": {"message": "Internal error", "type": "server_error"}})
+                return
+            self._send(200, *build(text, prompt_tokens, completion_tokens))
+
+        def _ollama_response(self, text: str, prompt_tokens: int,
+                             completion_tokens: int) -> Tuple[Dict[str, Any], Dict[str, str]]:
+            return {
+                "model": server.model,
+                "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "response": text,
+                "done": True,
+                "done_reason": "stop",
+                "prompt_eval_count": prompt_tokens,
+                "eval_count": completion_tokens,
+            }, {}
+
+        def _openai_response(self, text: str, prompt_tokens: int,
+                             completion_tokens: int) -> Tuple[Dict[str, Any], Dict[str, str]]:
+            return {
+                "id": f"chatcmpl-{server.requests}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": server.model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": text},
+                    "finish_reason": "stop",
+                }],
+                "usage": {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": prompt_tokens + completion_tokens,
+                },
+            }, {"x-ratelimit-remaining-requests": "1000", "x-ratelimit-reset-requests": "1s"}
+
+        def _read_json(self) -> Dict[str, Any]:
+            length = int(self.headers.get("Content-Length") or 0)
+            try:
+                return json.loads(self.rfile.read(length) or b"{}")
+            except ValueError:
+                return {}
+
+        def _send(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+            data = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--port", type=int, default=11500)
+    parser.add_argument("--model", default="stand-in")
+    parser.add_argument("--latency-ms", type=float, default=200.0)
+    parser.add_argument("--jitter-ms", type=float, default=50.0)
+    parser.add_argument("--tokens-per-second", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = StandInLLMServer(
+        port=args.port, model=args.model, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        tokens_per_second=args.tokens_per_second, error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+    )
+    print(f"Stand-in LLM server on {server.url} (Ollama) and {server.url}/v1 (OpenAI)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,11 @@
 """Database of well-established companies matching the criteria."""
-from typing import Dict, List
+import math
+import re
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Sequence, Set, Tuple
 
+from jobminer.config import settings
 from jobminer.models import Company
 
 # Curated list of well-established tech companies (200+ employees, 5+ years, stable growth)
@@ -11,7 +16,7 @@ ESTABLISHED_COMPANIES: List[Dict] = [
     {"name": "Google", "employee_count": 190000, "founded_year": 1998, "is_public": True, "industry": "Technology"},
     {"name": "Meta", "employee_count": 86000, "founded_year": 2004, "is_public": True, "industry": "Social Media"},
     {"name": "Apple", "employee_count": 164000, "founded_year": 1976, "is_public": True, "industry": "Technology"},
-    {"name": "Netflix", "employee_count": 13000, "founded_year": 1997, "is_public": True, "industry": "Streaming"},
+    {"name": "Netflix", "employee_count": 13000, "founded_year": 1997, "is_public": True, "industry": "Streaming", "ats": "lever", "ats_slug": "netflix"},
     {"name": "Adobe", "employee_count": 29000, "founded_year": 1982, "is_public": True, "industry": "Software"},
     {"name": "Salesforce", "employee_count": 80000, "founded_year": 1999, "is_public": True, "industry": "CRM/Cloud"},
     {"name": "Oracle", "employee_count": 164000, "founded_year": 1977, "is_public": True, "industry": "Database/Cloud"},
@@ -22,63 +27,64 @@ ESTABLISHED_COMPANIES: List[Dict] = [
     {"name": "SAP", "employee_count": 112000, "founded_year": 1972, "is_public": True, "industry": "Enterprise Software"},
 
     # Cloud & Infrastructure
-    {"name": "Snowflake", "employee_count": 6800, "founded_year": 2012, "is_public": True, "industry": "Data Cloud"},
-    {"name": "Databricks", "employee_count": 5000, "founded_year": 2013, "is_public": False, "industry": "Data/AI"},
-    {"name": "MongoDB", "employee_count": 4100, "founded_year": 2007, "is_public": True, "industry": "Database"},
-    {"name": "Confluent", "employee_count": 3000, "founded_year": 2014, "is_public": True, "industry": "Data Streaming"},
-    {"name": "HashiCorp", "employee_count": 2100, "founded_year": 2012, "is_public": True, "industry": "Cloud Infrastructure"},
-    {"name": "GitLab", "employee_count": 2200, "founded_year": 2014, "is_public": True, "industry": "DevOps"},
+    {"name": "Snowflake", "employee_count": 6800, "founded_year": 2012, "is_public": True, "industry": "Data Cloud", "ats": "greenhouse", "ats_slug": "snowflake"},
+    {"name": "Databricks", "employee_count": 5000, "founded_year": 2013, "is_public": False, "industry": "Data/AI", "ats": "greenhouse", "ats_slug": "databricks"},
+    {"name": "MongoDB", "employee_count": 4100, "founded_year": 2007, "is_public": True, "industry": "Database", "ats": "greenhouse", "ats_slug": "mongodb"},
+    {"name": "Confluent", "employee_count": 3000, "founded_year": 2014, "is_public": True, "industry": "Data Streaming", "ats": "greenhouse", "ats_slug": "confluent"},
+    {"name": "HashiCorp", "employee_count": 2100, "founded_year": 2012, "is_public": True, "industry": "Cloud Infrastructure", "ats": "greenhouse", "ats_slug": "hashicorp"},
+    {"name": "GitLab", "employee_count": 2200, "founded_year": 2014, "is_public": True, "industry": "DevOps", "ats": "greenhouse", "ats_slug": "gitlab"},
     {"name": "Atlassian", "employee_count": 11000, "founded_year": 2002, "is_public": True, "industry": "Software"},
-    {"name": "Elastic", "employee_count": 3500, "founded_year": 2012, "is_public": True, "industry": "Search/Analytics"},
-    {"name": "Cloudflare", "employee_count": 3500, "founded_year": 2009, "is_public": True, "industry": "CDN/Security"},
-    {"name": "Datadog", "employee_count": 6500, "founded_year": 2010, "is_public": True, "industry": "Monitoring"},
+    {"name": "Elastic", "employee_count": 3500, "founded_year": 2012, "is_public": True, "industry": "Search/Analytics", "ats": "greenhouse", "ats_slug": "elastic"},
+    {"name": "Cloudflare", "employee_count": 3500, "founded_year": 2009, "is_public": True, "industry": "CDN/Security", "ats": "greenhouse", "ats_slug": "cloudflare"},
+    {"name": "Datadog", "employee_count": 6500, "founded_year": 2010, "is_public": True, "industry": "Monitoring", "ats": "greenhouse", "ats_slug": "datadog"},
 
     # Financial Technology
-    {"name": "Stripe", "employee_count": 8000, "founded_year": 2010, "is_public": False, "industry": "Payments"},
+    {"name": "Stripe", "employee_count": 8000, "founded_year": 2010, "is_public": False, "industry": "Payments", "ats": "greenhouse", "ats_slug": "stripe"},
     {"name": "Square", "employee_count": 13000, "founded_year": 2009, "is_public": True, "industry": "FinTech"},
     {"name": "PayPal", "employee_count": 30000, "founded_year": 1998, "is_public": True, "industry": "Payments"},
     {"name": "Adyen", "employee_count": 3800, "founded_year": 2006, "is_public": True, "industry": "Payments"},
-    {"name": "Plaid", "employee_count": 1000, "founded_year": 2013, "is_public": False, "industry": "FinTech"},
+    {"name": "Plaid", "employee_count": 1000, "founded_year": 2013, "is_public": False, "industry": "FinTech", "ats": "lever", "ats_slug": "plaid"},
 
     # E-commerce & Marketplace
     {"name": "Shopify", "employee_count": 11600, "founded_year": 2006, "is_public": True, "industry": "E-commerce"},
     {"name": "eBay", "employee_count": 13200, "founded_year": 1995, "is_public": True, "industry": "E-commerce"},
-    {"name": "Etsy", "employee_count": 2600, "founded_year": 2005, "is_public": True, "industry": "E-commerce"},
+    {"name": "Etsy", "employee_count": 2600, "founded_year": 2005, "is_public": True, "industry": "E-commerce", "ats": "greenhouse", "ats_slug": "etsy"},
     {"name": "Wayfair", "employee_count": 16800, "founded_year": 2002, "is_public": True, "industry": "E-commerce"},
 
     # Cybersecurity
     {"name": "CrowdStrike", "employee_count": 8500, "founded_year": 2011, "is_public": True, "industry": "Cybersecurity"},
     {"name": "Palo Alto Networks", "employee_count": 13800, "founded_year": 2005, "is_public": True, "industry": "Cybersecurity"},
-    {"name": "Okta", "employee_count": 6000, "founded_year": 2009, "is_public": True, "industry": "Identity/Security"},
-    {"name": "Zscaler", "employee_count": 6500, "founded_year": 2007, "is_public": True, "industry": "Cloud Security"},
+    {"name": "Okta", "employee_count": 6000, "founded_year": 2009, "is_public": True, "industry": "Identity/Security", "ats": "greenhouse", "ats_slug": "okta"},
+    {"name": "Zscaler", "employee_count": 6500, "founded_year": 2007, "is_public": True, "industry": "Cloud Security", "ats": "greenhouse", "ats_slug": "zscaler"},
     {"name": "Fortinet", "employee_count": 11000, "founded_year": 2000, "is_public": True, "industry": "Cybersecurity"},
 
     # Communication & Collaboration
     {"name": "Slack", "employee_count": 3000, "founded_year": 2009, "is_public": False, "industry": "Collaboration"},
     {"name": "Zoom", "employee_count": 8400, "founded_year": 2011, "is_public": True, "industry": "Video Conferencing"},
-    {"name": "Twilio", "employee_count": 9000, "founded_year": 2008, "is_public": True, "industry": "Communications API"},
+    {"name": "Twilio", "employee_count": 9000, "founded_year": 2008, "is_public": True, "industry": "Communications API", "ats": "greenhouse", "ats_slug": "twilio"},
     {"name": "DocuSign", "employee_count": 7500, "founded_year": 2003, "is_public": True, "industry": "Document Management"},
 
     # SaaS & Business Software
     {"name": "ServiceNow", "employee_count": 22000, "founded_year": 2003, "is_public": True, "industry": "Enterprise SaaS"},
     {"name": "Workday", "employee_count": 18000, "founded_year": 2005, "is_public": True, "industry": "HR/Finance SaaS"},
-    {"name": "HubSpot", "employee_count": 7900, "founded_year": 2006, "is_public": True, "industry": "Marketing Software"},
+    {"name": "HubSpot", "employee_count": 7900, "founded_year": 2006, "is_public": True, "industry": "Marketing Software", "ats": "greenhouse", "ats_slug": "hubspot"},
     {"name": "Zendesk", "employee_count": 6000, "founded_year": 2007, "is_public": True, "industry": "Customer Service"},
     {"name": "Splunk", "employee_count": 7500, "founded_year": 2003, "is_public": True, "industry": "Data Analytics"},
     {"name": "Tableau", "employee_count": 5000, "founded_year": 2003, "is_public": False, "industry": "Analytics"},
-    {"name": "Asana", "employee_count": 1600, "founded_year": 2008, "is_public": True, "industry": "Project Management"},
+    {"name": "Asana", "employee_count": 1600, "founded_year": 2008, "is_public": True, "industry": "Project Management", "ats": "greenhouse", "ats_slug": "asana"},
 
     # Ride-sharing & Transportation
+    {"name": "Airbnb", "employee_count": 6900, "founded_year": 2008, "is_public": True, "industry": "Travel", "ats": "greenhouse", "ats_slug": "airbnb"},
     {"name": "Uber", "employee_count": 32800, "founded_year": 2009, "is_public": True, "industry": "Transportation"},
-    {"name": "Lyft", "employee_count": 4000, "founded_year": 2012, "is_public": True, "industry": "Transportation"},
+    {"name": "Lyft", "employee_count": 4000, "founded_year": 2012, "is_public": True, "industry": "Transportation", "ats": "greenhouse", "ats_slug": "lyft"},
 
     # Gaming
-    {"name": "Roblox", "employee_count": 2400, "founded_year": 2004, "is_public": True, "industry": "Gaming"},
-    {"name": "Unity", "employee_count": 7700, "founded_year": 2004, "is_public": True, "industry": "Gaming Engine"},
+    {"name": "Roblox", "employee_count": 2400, "founded_year": 2004, "is_public": True, "industry": "Gaming", "ats": "greenhouse", "ats_slug": "roblox"},
+    {"name": "Unity", "employee_count": 7700, "founded_year": 2004, "is_public": True, "industry": "Gaming Engine", "ats": "greenhouse", "ats_slug": "unity3d"},
 
     # AI & Machine Learning
-    {"name": "Scale AI", "employee_count": 800, "founded_year": 2016, "is_public": False, "industry": "AI/ML"},
-    {"name": "DataRobot", "employee_count": 1000, "founded_year": 2012, "is_public": False, "industry": "AI/ML"},
+    {"name": "Scale AI", "employee_count": 800, "founded_year": 2016, "is_public": False, "industry": "AI/ML", "ats": "greenhouse", "ats_slug": "scaleai"},
+    {"name": "DataRobot", "employee_count": 1000, "founded_year": 2012, "is_public": False, "industry": "AI/ML", "ats": "greenhouse", "ats_slug": "datarobot"},
 
     # Traditional Companies with Strong Tech Divisions
     {"name": "Capital One", "employee_count": 55000, "founded_year": 1994, "is_public": True, "industry": "Financial Services"},
@@ -89,11 +95,55 @@ ESTABLISHED_COMPANIES: List[Dict] = [
     {"name": "Mastercard", "employee_count": 24000, "founded_year": 1966, "is_public": True, "industry": "Payments"},
 
     # European Tech Companies
-    {"name": "Spotify", "employee_count": 9800, "founded_year": 2006, "is_public": True, "industry": "Music Streaming"},
+    {"name": "Spotify", "employee_count": 9800, "founded_year": 2006, "is_public": True, "industry": "Music Streaming", "ats": "lever", "ats_slug": "spotify"},
     {"name": "Booking.com", "employee_count": 23000, "founded_year": 1996, "is_public": True, "industry": "Travel"},
-    {"name": "Delivery Hero", "employee_count": 42000, "founded_year": 2011, "is_public": True, "industry": "Food Delivery"},
+    {"name": "Delivery Hero", "employee_count": 42000, "founded_year": 2011, "is_public": True, "industry": "Food Delivery", "ats": "greenhouse", "ats_slug": "deliveryhero"},
 ]
 
+# Other names job boards use for curated companies, mapped to the curated name
+COMPANY_ALIASES: Dict[str, str] = {
+    "AWS": "Amazon",
+    "Amazon Web Services": "Amazon",
+    "Alphabet": "Google",
+    "Google Cloud": "Google",
+    "Google DeepMind": "Google",
+    "DeepMind": "Google",
+    "Facebook": "Meta",
+    "Meta Platforms": "Meta",
+    "Block": "Square",
+    "Salesforce.com": "Salesforce",
+    "Slack Technologies": "Slack",
+    "Zoom Video Communications": "Zoom",
+    "Unity Technologies": "Unity",
+    "JPMorgan": "JPMorgan Chase",
+    "J.P. Morgan": "JPMorgan Chase",
+    "JP Morgan Chase": "JPMorgan Chase",
+    "Elasticsearch": "Elastic",
+    "Booking": "Booking.com",
+}
+
+# Trailing words dropped when normalizing company names
+LEGAL_SUFFIXES = {
+    "inc", "incorporated", "corp", "corporation", "co", "company", "llc", "llp",
+    "ltd", "limited", "plc", "gmbh", "ag", "se", "sa", "sas", "srl", "bv", "nv",
+    "ab", "as", "oy", "pty", "holdings",
+}
+
+# Words that can follow a company's name without naming another company
+# ("Unity Software", "Datadog Careers"); ignored when matching word by word
+GENERIC_WORDS = {
+    "software", "technologies", "technology", "tech", "labs", "group", "global",
+    "international", "careers", "jobs", "hiring", "remote", "the", "usa", "us", "uk",
+    "europe", "emea", "hq",
+}
+
+# Dots inside names ("Inc.", "S.A.") are dropped; other punctuation separates words
+_DOTS_RE = re.compile(r"[.']")
+_NON_WORD_RE = re.compile(r"[^\w]+")
+# "(Remote)", "[AWS]"; separators such as "Stripe - Remote" or "Stripe | Payments"
+_PARENS_RE = re.compile(r"[(\[]([^)\]]*)[)\]]")
+_SEPARATOR_RE = re.compile(r"\s+[-|/@\u2013\u2014]\s+")
+
 
 def get_companies() -> List[Company]:
     """Get list of Company objects from the database."""
@@ -105,15 +155,192 @@ def get_company_names() -> List[str]:
     return [company["name"] for company in ESTABLISHED_COMPANIES]
 
 
+def get_ats_companies(ats: str) -> List[Company]:
+    """Get companies whose job board is hosted on the given ATS ("greenhouse" or "lever")."""
+    return [Company(**company_data) for company_data in ESTABLISHED_COMPANIES
+            if company_data.get("ats") == ats]
+
+
 def is_established_company(company_name: str) -> bool:
     """Check if a company is in our established companies list."""
-    company_names_lower = [name.lower() for name in get_company_names()]
-    return company_name.lower() in company_names_lower
+    return get_company_info(company_name) is not None
 
 
 def get_company_info(company_name: str) -> Company | None:
-    """Get company information by name."""
+    """
+    Get company information by name.
+
+    Messy board strings such as "Stripe, Inc." or "Datadog (Remote)" are
+    matched too, see ``CompanyMatcher``. The returned ``Company`` is shared
+    between all lookups of the same company and must not be modified.
+    """
+    return _company_matcher().match(company_name)
+
+
+@lru_cache(maxsize=4096)
+def normalize_company_name(company_name: str) -> str:
+    """
+    Normalize a company name for lookups.
+
+    Lowercases, drops punctuation and trailing legal suffixes, so
+    "Stripe, Inc.", "STRIPE" and "Stripe Inc" all become "stripe".
+    Results are cached since boards repeat the same names on every page.
+    """
+    name = _DOTS_RE.sub("", company_name.lower())
+    words = _NON_WORD_RE.sub(" ", name).split()
+    while len(words) > 1 and words[-1] in LEGAL_SUFFIXES:
+        words.pop()
+    return " ".join(words)
+
+
+class CompanyMatcher:
+    """
+    Fuzzy lookup of company names.
+
+    A raw name is first looked up exactly (after normalization) as given,
+    without parenthesized parts ("Datadog (Remote)"), by the parenthesized
+    parts themselves ("Amazon Web Services (AWS)") and by the part before
+    a separator ("Stripe - Remote"). Failing that, names match word by
+    word, ignoring ``GENERIC_WORDS`` and plural "s" endings: "Unity
+    Software" and "Palo Alto Network" match, "Elastic Path" and "Square
+    One" do not.
+
+    Last, small typos are tolerated: names with the same number of
+    (non-generic) words are compared by trigram similarity (Dice
+    coefficient) using a precomputed trigram index, and the best match at
+    or above ``threshold`` wins. Results are memoized per raw string.
+    """
+
+    def __init__(self, entries: Dict[str, Any], threshold: float = 0.8, cache_size: int = 10000):
+        """
+        Args:
+            entries: Company names and aliases mapped to the value a match returns
+            threshold: Minimum trigram similarity (0-1) for fuzzy matches
+            cache_size: Raw strings remembered before the memo is reset
+        """
+        self.threshold = threshold
+        self.cache_size = cache_size
+        self._exact: Dict[str, Any] = {}
+        self._words: Dict[FrozenSet[str], Any] = {}
+        self._fuzzy: Dict[str, Any] = {}
+        self._word_counts: Dict[str, int] = {}
+        self._trigrams: Dict[str, Set[str]] = {}
+        self._postings: Dict[str, List[str]] = defaultdict(list)
+        self._cache: Dict[str, Any] = {}
+
+        for name, value in entries.items():
+            key = normalize_company_name(name)
+            if not key or key in self._exact:
+                continue
+            self._exact[key] = value
+            words = _significant_words(key)
+            self._words.setdefault(frozenset(words), value)
+            fuzzy_key = " ".join(words)
+            if fuzzy_key in self._fuzzy:
+                continue
+            self._fuzzy[fuzzy_key] = value
+            self._word_counts[fuzzy_key] = len(words)
+            grams = _trigrams(fuzzy_key)
+            self._trigrams[fuzzy_key] = grams
+            for gram in grams:
+                self._postings[gram].append(fuzzy_key)
+
+    def match(self, company_name: str) -> Any:
+        """Value of the best matching company, or None."""
+        try:
+            return self._cache[company_name]
+        except KeyError:
+            pass
+
+        value = self._match(company_name)
+        if len(self._cache) >= self.cache_size:
+            self._cache = {}
+        self._cache[company_name] = value
+        return value
+
+    def _match(self, company_name: str) -> Any:
+        variants = _name_variants(company_name)
+        for variant in variants:
+            value = self._exact.get(normalize_company_name(variant))
+            if value is not None:
+                return value
+
+        # Word and fuzzy matches on the name without parenthesized parts
+        words = _significant_words(normalize_company_name(variants[1] if len(variants) > 1 else variants[0]))
+        value = self._words.get(frozenset(words))
+        if value is not None:
+            return value
+
+        query = " ".join(words)
+        grams = _trigrams(query)
+        if not grams:
+            return None
+
+        # A name reaching the threshold shares at least min_overlap trigrams
+        # with the query, so it must contain one of the query's
+        # len(grams) - min_overlap + 1 rarest trigrams (prefix filtering).
+        # Common trigrams like " co" never have to be scanned.
+        min_overlap = math.ceil(self.threshold * len(grams) / (2 - self.threshold))
+        rarest = sorted(grams, key=lambda gram: len(self._postings.get(gram, ())))
+        candidates: Set[str] = set()
+        for gram in rarest[:len(grams) - max(min_overlap, 1) + 1]:
+            candidates.update(self._postings.get(gram, ()))
+
+        best_key, best_score = None, self.threshold
+        for key in candidates:
+            # An extra word names another company ("Elastic Path"), not a typo
+            if self._word_counts[key] != len(words):
+                continue
+            key_grams = self._trigrams[key]
+            score = 2 * len(grams & key_grams) / (len(grams) + len(key_grams))
+            if score >= best_score:
+                best_key, best_score = key, score
+        return self._fuzzy[best_key] if best_key is not None else None
+
+
+def _name_variants(company_name: str) -> List[str]:
+    """Raw name, name without parenthesized parts, the parts, and the text before a separator."""
+    variants = [company_name]
+    stripped = _PARENS_RE.sub(" ", company_name).strip()
+    if stripped != company_name:
+        variants.append(stripped)
+        variants.extend(_PARENS_RE.findall(company_name))
+    head = _SEPARATOR_RE.split(stripped, maxsplit=1)[0]
+    if head != stripped:
+        variants.append(head)
+    return variants
+
+
+def _significant_words(name: str) -> List[str]:
+    """Words of a normalized name without generic words, singular ("networks" -> "network")."""
+    words = name.split()
+    words = [word for word in words if word not in GENERIC_WORDS] or words
+    return [word[:-1] if len(word) > 3 and word.endswith("s") and not word.endswith("ss") else word
+            for word in words]
+
+
+def _trigrams(name: str) -> Set[str]:
+    padded = f" {name} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def get_company_matcher(company_names: Sequence[str]) -> CompanyMatcher:
+    """Shared matcher for a list of company names, indexed on first use."""
+    return _name_matcher(tuple(company_names), settings.company_match_threshold)
+
+
+@lru_cache(maxsize=16)
+def _name_matcher(company_names: Tuple[str, ...], threshold: float) -> CompanyMatcher:
+    return CompanyMatcher({name: name for name in company_names}, threshold=threshold)
+
+
+@lru_cache(maxsize=1)
+def _company_matcher() -> CompanyMatcher:
+    """Matcher mapping names and aliases to one Company instance each, built once."""
+    index: Dict[str, Company] = {}
     for company_data in ESTABLISHED_COMPANIES:
-        if company_data["name"].lower() == company_name.lower():
-            return Company(**company_data)
-    return None
+        company = Company(**company_data)
+        index[company.name] = company
+    for alias, name in COMPANY_ALIASES.items():
+        index[alias] = index[name]
+    return CompanyMatcher(index, threshold=settings.company_match_threshold)
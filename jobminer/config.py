@@ -11,13 +11,45 @@ class Settings(BaseSettings):
     # LLM Configuration
     ollama_base_url: str = "http://localhost:11434"
     ollama_model: str = "llama2"
+    ollama_timeout_seconds: float = 120.0  # Per-call deadline; local models can be slow
+    ollama_endpoints: str = ""  # Comma-separated Ollama URLs to load-balance over (replaces ollama_base_url)
     openai_api_key: str | None = None
     openai_base_url: str | None = None
     openai_model: str = "gpt-3.5-turbo"
+    openai_timeout_seconds: float = 60.0
+    openai_endpoints: str = ""  # Comma-separated OpenAI-compatible base URLs serving openai_model
 
     # Groq Configuration (free tier, OpenAI-compatible)
     groq_api_key: str | None = None
     groq_model: str = "llama-3.1-8b-instant"  # Fast and free
+    groq_timeout_seconds: float = 30.0
+
+    # LLM Scoring Configuration
+    llm_workers: int = 4  # Concurrent LLM calls
+    llm_max_retries: int = 3  # Retries of rate-limited calls
+    llm_backoff_base: float = 1.0  # Pause after a 429 without Retry-After (doubles)
+    llm_breaker_failures: int = 5  # Consecutive failures that stop calls to a backend
+    llm_breaker_reset_seconds: float = 60.0  # Wait before trying a failing backend again
+    llm_health_check_seconds: float = 30.0  # How often pooled endpoints are pinged
+    llm_slow_endpoint_factor: float = 3.0  # Pooled endpoints slower than this times the median are skipped
+    llm_batch_size: int = 8  # Max jobs per prompt; 1 sends one job per call
+    llm_context_tokens: int = 4096  # Model context window, limits jobs per prompt
+    llm_response_tokens_per_job: int = 80  # Context reserved for each job's verdict
+    llm_description_tokens: int = 300  # Description budget per job in prompts
+    prescore_enabled: bool = True  # Skip the LLM for jobs a cheap deterministic score rules out
+    prescore_threshold: float = 0.5  # Minimum pre-score for an LLM call
+    prescore_top_k: int = 0  # Only the K best pre-scored jobs of a run reach the LLM; 0 = no limit
+    prescore_keywords: str = (
+        "python,sql,spark,kafka,airflow,dbt,snowflake,databricks,aws,gcp,azure,"
+        "kubernetes,terraform,distributed,cloud,data platform,etl,streaming"
+    )
+    local_filter_fallback: bool = True  # Score by TF-IDF similarity when no LLM is available
+    local_filter_only: bool = False  # Always score by TF-IDF similarity, even with an LLM configured
+    local_filter_features: int = 2 ** 20  # Hashed feature columns
+    local_filter_match_similarity: float = 0.15  # Cosine similarity scored as 0.5 (the keep cutoff)
+    llm_cache_enabled: bool = True  # Reuse verdicts for unchanged jobs across runs
+    llm_cache_ttl_days: float = 30.0
+    llm_cache_max_entries: int = 100000
 
     # Job Search Configuration
     target_roles: str = "data engineer,senior data engineer,software engineer,solutions architect"
@@ -25,14 +57,43 @@ class Settings(BaseSettings):
     min_years_in_business: int = 5
     remote_only: bool = True
     prefer_public_companies: bool = True
+    company_match_threshold: float = 0.8  # Trigram similarity for company names with typos
 
     # Scraper Configuration
     max_jobs_per_run: int = 100
     headless_browser: bool = True
+    scrape_concurrency: int = 4  # Sources scraped in parallel
+    scrape_timeout_seconds: float = 120.0  # Per-source wall-clock limit
+    ats_concurrency: int = 8  # Greenhouse/Lever boards fetched in parallel
+    ats_requests_per_second: float = 2.0  # Per-host request budget
+    ats_burst: int = 4  # Per-host burst size
+    ats_include_content: bool = False  # Fetch full descriptions from Greenhouse/Lever
+    watermarks_enabled: bool = True  # Skip listings processed by earlier runs
+    watermark_stop_after: int = 20  # Stop an ordered feed after this many old listings
+
+    # Pipeline Configuration
+    pipeline_queue_size: int = 100  # Jobs buffered between stages (backpressure)
+    pipeline_batch_size: int = 16  # Jobs per LLM scoring batch
+    pipeline_flush_seconds: float = 2.0  # Max wait before scoring a partial batch
+    description_cleanup_enabled: bool = True  # Strip HTML and boilerplate, extract requirements
+    description_boilerplate_postings: int = 3  # Paragraphs repeated in this many postings of a company are dropped
+    near_duplicates_enabled: bool = True  # Score one copy of postings listed on several boards
+    near_duplicate_threshold: float = 0.8  # Estimated Jaccard similarity of title/description shingles
+
+    # HTTP Client Configuration
+    http_timeout_seconds: float = 10.0
+    http_max_retries: int = 3  # Retries on 429/5xx and connection errors
+    http_backoff_base: float = 0.5  # Seconds, doubled per attempt (with jitter)
+    http_backoff_max: float = 30.0
+    http_max_connections: int = 20
+    http2: bool = True  # Used only when the optional 'h2' package is installed
+    http_cache_enabled: bool = True  # ETag/Last-Modified cache under data_dir
+    http_cache_max_mb: int = 50
 
     # Data Storage
     data_dir: Path = Path("./data")
     output_format: str = "json,csv"
+    job_store_compact_ratio: float = 1.5  # Compact jobs.jsonl once it holds this many records per job
 
     class Config:
         env_file = ".env"
@@ -43,6 +104,26 @@ class Settings(BaseSettings):
         """Parse target roles into a list."""
         return [role.strip() for role in self.target_roles.split(",")]
 
+    @property
+    def ollama_endpoints_list(self) -> List[str]:
+        """Parse Ollama endpoints into a list."""
+        return [url.strip() for url in self.ollama_endpoints.split(",") if url.strip()]
+
+    @property
+    def openai_endpoints_list(self) -> List[str]:
+        """Parse OpenAI-compatible endpoints into a list."""
+        return [url.strip() for url in self.openai_endpoints.split(",") if url.strip()]
+
+    @property
+    def prescore_keywords_list(self) -> List[str]:
+        """Parse pre-scoring keywords into a list."""
+        return [keyword.strip() for keyword in self.prescore_keywords.split(",") if keyword.strip()]
+
+    @property
+    def scrape_fingerprint(self) -> str:
+        """Settings that decide which listings a source yields; state keyed on them is reset when they change."""
+        return "|".join([self.target_roles, str(self.remote_only), str(self.max_jobs_per_run)])
+
     @property
     def output_formats(self) -> List[str]:
         """Parse output formats into a list."""
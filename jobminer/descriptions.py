@@ -0,0 +1,166 @@
+"""Cleanup of scraped job descriptions before scoring and storage."""
+import hashlib
+import html
+import logging
+import re
+import threading
+from collections import defaultdict
+from typing import Dict, List, Optional, Set
+
+from jobminer.companies import normalize_company_name
+from jobminer.models import Job
+
+logger = logging.getLogger(__name__)
+
+_SCRIPT_RE = re.compile(r"<(script|style)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+_ITEM_RE = re.compile(r"<li\b[^>]*>", re.IGNORECASE)
+_BLOCK_RE = re.compile(r"</?(p|div|br|h[1-6]|ul|ol|li|tr|table|section|article|header|footer|blockquote)\b[^>]*>",
+                       re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"[ \t\r\f\v\u00a0\u200b]+")
+_BULLET_RE = re.compile(r"^\s*(?:[-*•·▪●–]|\d+[.)])\s*")
+
+# Legal text most postings carry, whatever the company
+BOILERPLATE_RE = re.compile(
+    r"equal (employment )?opportunity|without regard to|reasonable accommodation|e-verify|"
+    r"affirmative action|protected veteran|privacy (policy|notice)|recruitment agencies|"
+    r"do not accept unsolicited",
+    re.IGNORECASE,
+)
+
+# Section headings that start a list of requirements
+REQUIREMENTS_HEADING_RE = re.compile(
+    r"^(requirements|qualifications|minimum qualifications|basic qualifications|"
+    r"what you('ll)? (need|bring)|who you are|you (have|bring)|you should have|must haves?|"
+    r"skills( and experience)?|experience|about you)\b",
+    re.IGNORECASE,
+)
+
+# Headings of other sections, which end a requirements list
+SECTION_HEADING_RE = re.compile(
+    r"^(responsibilities|what you('ll)? do|the role|about (us|the (role|team|company))|benefits|perks|"
+    r"what we offer|nice to haves?|bonus( points)?|preferred qualifications|compensation|salary|"
+    r"how to apply|location|why join)\b",
+    re.IGNORECASE,
+)
+
+# Lines shorter than this are headings or fragments, never company boilerplate
+MIN_BOILERPLATE_CHARS = 40
+MAX_HEADING_CHARS = 60
+MAX_REQUIREMENTS = 20
+MAX_REQUIREMENT_CHARS = 300
+
+
+class DescriptionCleaner:
+    """
+    Turns raw HTML descriptions into compact plain text.
+
+    Besides stripping markup, it learns which paragraphs each company
+    repeats across its postings ("About us", benefits, legal text) and
+    drops them from later postings once they were seen in
+    ``min_postings - 1`` earlier ones. Safe to share between threads.
+    """
+
+    def __init__(self, min_postings: int = 3):
+        self.min_postings = max(2, min_postings)
+        self._paragraphs: Dict[str, Dict[str, int]] = defaultdict(dict)
+        self._lock = threading.Lock()
+
+    def clean(self, job: Job) -> int:
+        """
+        Clean a job's description in place and extract its requirements.
+
+        Returns:
+            Estimated tokens saved
+        """
+        if not job.description:
+            return 0
+        raw_tokens = estimate_tokens(job.description)
+        lines = [line for line in html_to_lines(job.description) if not BOILERPLATE_RE.search(line)]
+        if job.requirements is None:
+            job.requirements = extract_requirements(lines) or None
+        lines = self._drop_repeated(job.company, lines)
+        job.description = "\n".join(lines) or None
+        return raw_tokens - (estimate_tokens(job.description) if job.description else 0)
+
+    def _drop_repeated(self, company: str, lines: List[str]) -> List[str]:
+        company_key = normalize_company_name(company)
+        keys: Set[str] = set()
+        kept = []
+        with self._lock:
+            counts = self._paragraphs[company_key]
+            for line in lines:
+                if len(line) < MIN_BOILERPLATE_CHARS:
+                    kept.append(line)
+                    continue
+                key = hashlib.blake2b(line.lower().encode("utf-8"), digest_size=8).hexdigest()
+                if counts.get(key, 0) + 1 >= self.min_postings:
+                    continue
+                if key not in keys:
+                    keys.add(key)
+                    counts[key] = counts.get(key, 0) + 1
+                kept.append(line)
+        return kept
+
+
+def html_to_lines(markup: str) -> List[str]:
+    """Non-empty text lines of an HTML fragment, with list items as ``- `` bullets."""
+    text = _SCRIPT_RE.sub(" ", markup)
+    text = _ITEM_RE.sub("\n- ", text)
+    text = _BLOCK_RE.sub("\n", text)
+    text = html.unescape(_TAG_RE.sub("", text))
+    lines = (_SPACE_RE.sub(" ", line).strip() for line in text.split("\n"))
+    return [line for line in lines if line and line != "-"]
+
+
+def extract_requirements(lines: List[str]) -> List[str]:
+    """Items listed under the first requirements heading, if any."""
+    requirements: List[str] = []
+    in_section = False
+    for line in lines:
+        is_heading = len(line) <= MAX_HEADING_CHARS and not _BULLET_RE.match(line) and (
+            line.endswith(":") or REQUIREMENTS_HEADING_RE.match(line) or SECTION_HEADING_RE.match(line))
+        if in_section:
+            if is_heading and requirements:
+                break
+            item = _BULLET_RE.sub("", line).strip()
+            if item and not is_heading:
+                requirements.append(item[:MAX_REQUIREMENT_CHARS])
+                if len(requirements) >= MAX_REQUIREMENTS:
+                    break
+        elif is_heading and REQUIREMENTS_HEADING_RE.match(line):
+            in_section = True
+    return requirements
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count of English text (about four characters per token)."""
+    return len(text) // 4 + 1
+
+
+def fit_to_budget(text: Optional[str], max_tokens: int) -> str:
+    """
+    Shorten text to an estimated token budget.
+
+    Cuts at the last line or sentence end that fits, so prompts do not end
+    mid-word.
+    """
+    if not text:
+        return ""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    cut = text[:max(0, (max_tokens - 1) * 4 - 1)]
+    boundary = max(cut.rfind("\n"), cut.rfind(". "))
+    if boundary > len(cut) // 2:
+        cut = cut[:boundary + 1]
+    return cut.rstrip() + "…"
+
+
+def prompt_description(job: Job, max_tokens: int) -> str:
+    """Description for LLM prompts: requirements first, then as much text as the budget allows."""
+    if not job.description:
+        return "N/A"
+    if not job.requirements or estimate_tokens(job.description) <= max_tokens:
+        return fit_to_budget(job.description, max_tokens)
+    text = "Requirements: " + "; ".join(job.requirements) + "\n" + job.description
+    return fit_to_budget(text, max_tokens)
@@ -0,0 +1,162 @@
+"""Append-only JSON Lines store of all jobs ever saved."""
+import argparse
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+import jsonlines
+
+from jobminer.config import settings
+from jobminer.models import Job, load_jobs
+
+logger = logging.getLogger(__name__)
+
+
+class JobStore:
+    """
+    Job history kept as one JSON record per line.
+
+    Saving appends only jobs that are new or whose record changed, so a
+    run writes in proportion to what it found rather than to the whole
+    history. When a job is written again, its last record wins. ``compact``
+    rewrites the file with one record per job once superseded records
+    pile up.
+
+    The serialized record of every job is kept in memory after ``load``,
+    so views such as ``jobs_latest.json`` are written without serializing
+    the jobs again.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lines: Dict[str, str] = {}
+        self.records = 0  # Records in the file, including superseded ones
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def load(self) -> List[Job]:
+        """Read the store; returns the latest record of each job, in file order."""
+        self._lines = {}
+        self.records = 0
+        if not self.path.exists():
+            return []
+
+        # Records are kept as read (minus the newline) and parsed in one go below
+        with open(self.path, encoding="utf-8") as f:
+            lines = [line.strip() for line in f if line.strip()]
+        try:
+            jobs = load_jobs("[" + ",".join(lines) + "]")
+        except ValueError:
+            jobs, lines = self._load_valid(lines)
+
+        latest: Dict[str, Job] = {}
+        for line, job in zip(lines, jobs):
+            self._lines[job.id] = line
+            latest[job.id] = job
+        self.records = len(lines)
+        return list(latest.values())
+
+    def append(self, jobs: Iterable[Job]) -> int:
+        """
+        Append the jobs that are new or changed.
+
+        Returns:
+            Number of records written
+        """
+        changed = {}
+        for job in jobs:
+            line = job.model_dump_json()
+            if self._lines.get(job.id) != line:
+                changed[job.id] = line
+        if not changed:
+            return 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._end_torn_line()
+        # Records are serialized already; the writer only adds the newlines
+        with open(self.path, "a", encoding="utf-8") as f, jsonlines.Writer(f, dumps=str) as writer:
+            writer.write_all(changed.values())
+            f.flush()
+            os.fsync(f.fileno())
+        self._lines.update(changed)
+        self.records += len(changed)
+        return len(changed)
+
+    def needs_compaction(self, ratio: float) -> bool:
+        """True once the file holds ``ratio`` times as many records as jobs."""
+        return bool(self._lines) and self.records > len(self._lines) * ratio
+
+    def compact(self) -> int:
+        """
+        Rewrite the file with only the latest record of each job.
+
+        The new file replaces the old one atomically, so a crash leaves
+        either of them intact.
+
+        Returns:
+            Number of superseded records dropped
+        """
+        if not self._lines and self.path.exists():
+            self.load()
+        dropped = self.records - len(self._lines)
+        temp_path = self.path.with_suffix(".jsonl.tmp")
+        with open(temp_path, "w", encoding="utf-8") as f, jsonlines.Writer(f, dumps=str) as writer:
+            writer.write_all(self._lines.values())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+        self.records = len(self._lines)
+        logger.info(f"Compacted job store to {self.records} records ({dropped} superseded records dropped)")
+        return dropped
+
+    def write_json_view(self, path: Path, job_ids: Iterable[str]):
+        """Write a JSON array of the given stored jobs, in the given order."""
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("[\n")
+            f.write(",\n".join(self._lines[job_id] for job_id in job_ids))
+            f.write("\n]\n")
+
+    def _load_valid(self, lines: List[str]):
+        """Parse records one by one, skipping broken ones (e.g. a write cut short by a crash)."""
+        jobs, valid = [], []
+        for number, line in enumerate(lines, start=1):
+            try:
+                jobs.append(Job.model_validate_json(line))
+            except ValueError as e:
+                logger.warning(f"Skipping invalid record on line {number} of {self.path}: {e}")
+                continue
+            valid.append(line)
+        return jobs, valid
+
+    def _end_torn_line(self):
+        """Terminate a last line left without a newline, so appends start on a fresh line."""
+        if not self.path.exists() or self.path.stat().st_size == 0:
+            return
+        with open(self.path, "rb+") as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+
+
+def main():
+    """Compact the job store on demand."""
+    parser = argparse.ArgumentParser(description="Compact the job store")
+    parser.add_argument("--data-dir", type=Path, default=settings.data_dir)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    store = JobStore(args.data_dir / "jobs.jsonl")
+    if not store.exists():
+        logger.info(f"No job store at {store.path}")
+        return
+    store.load()
+    store.compact()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Persistent cache of LLM verdicts, so unchanged jobs are not scored again."""
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+
+from jobminer.models import Job
+
+logger = logging.getLogger(__name__)
+
+# Rows are trimmed back to the size limit every this many inserts
+EVICT_EVERY = 100
+
+
+class VerdictCache:
+    """
+    SQLite cache of ``(score, analysis)`` verdicts.
+
+    Keys are hashes of everything that determines a verdict (see
+    ``verdict_key``), so a changed posting, changed criteria, another model
+    or a new prompt version all miss. Entries expire after ``ttl_seconds``;
+    beyond ``max_entries`` the least recently used ones are evicted.
+    """
+
+    def __init__(self, path: Path, ttl_seconds: float, max_entries: int):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._inserts = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS verdicts ("
+            "key TEXT PRIMARY KEY, score REAL NOT NULL, analysis TEXT NOT NULL, "
+            "created_at REAL NOT NULL, used_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS verdicts_used_at ON verdicts (used_at)")
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM verdicts WHERE created_at < ?", (time.time() - ttl_seconds,))
+
+    def get(self, key: str) -> Optional[Tuple[float, str]]:
+        """Stored verdict for a key, or None if missing or expired."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT score, analysis, created_at FROM verdicts WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[2] < now - self.ttl_seconds:
+                return None
+            with self._conn:
+                self._conn.execute("UPDATE verdicts SET used_at = ? WHERE key = ?", (now, key))
+            return row[0], row[1]
+
+    def put(self, key: str, score: float, analysis: str):
+        """Store a verdict."""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO verdicts VALUES (?, ?, ?, ?, ?)",
+                (key, score, analysis, now, now),
+            )
+            self._inserts += 1
+            if self._inserts % EVICT_EVERY == 0:
+                self._evict()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._evict()
+            self._conn.commit()
+            self._conn.close()
+
+    def _evict(self):
+        excess = self._conn.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0] - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM verdicts WHERE key IN "
+                "(SELECT key FROM verdicts ORDER BY used_at LIMIT ?)", (excess,)
+            )
+            logger.info(f"Evicted {excess} LLM verdicts from the cache")
+
+
+def verdict_key(job: Job, user_criteria: str, model: str, prompt_version: str) -> str:
+    """Cache key from the job's scored content, the criteria, the model and the prompt version."""
+    digest = hashlib.sha256()
+    for part in (job_content_hash(job), _sha256(user_criteria), model, prompt_version):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def job_content_hash(job: Job) -> str:
+    """Hash of the job fields the prompts include."""
+    return _sha256("\0".join([
+        job.title, job.company, job.location, str(job.is_remote), job.description or "",
+    ]))
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
@@ -0,0 +1,228 @@
+"""Throttling and accounting for concurrent LLM calls."""
+import logging
+import re
+import threading
+import time
+from typing import List, Mapping, Optional
+
+from jobminer.models import LLMStats
+
+logger = logging.getLogger(__name__)
+
+# Durations in rate-limit headers: "1s", "6m0s", "20ms", "0.5"
+_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_UNIT_SECONDS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+class RateLimitedError(Exception):
+    """Raised by an LLM backend when the provider rejected a call with 429."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a backend whose circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Stops calls to a backend that keeps failing.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    calls fail immediately for ``reset_seconds``. Then one trial call is
+    let through (half-open): success closes the circuit, failure opens it
+    again for another ``reset_seconds``.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_seconds: float = 60.0):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """True while calls are being refused without a trial."""
+        with self._lock:
+            return self.opened_at is not None and (
+                self._trial_running or time.monotonic() - self.opened_at < self.reset_seconds)
+
+    def allow(self) -> bool:
+        """Whether a call may be made now; a True in half-open state claims the trial call."""
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if self._trial_running or time.monotonic() - self.opened_at < self.reset_seconds:
+                return False
+            self._trial_running = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            if self.opened_at is not None:
+                logger.info("LLM backend recovered; closing circuit")
+            self.failures = 0
+            self.opened_at = None
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._trial_running or (self.opened_at is None and self.failures >= self.failure_threshold):
+                logger.warning(f"LLM backend failed {self.failures} times in a row; "
+                               f"opening circuit for {self.reset_seconds:.0f}s")
+                self.opened_at = time.monotonic()
+            self._trial_running = False
+
+
+class AdaptiveThrottle:
+    """
+    Concurrency limit for LLM calls that adapts to the provider's limits.
+
+    Works like AIMD congestion control: each rate-limited call halves the
+    number of calls allowed in flight and pauses new calls for the
+    provider's ``Retry-After`` (or an exponential backoff); each successful
+    call slowly raises the limit again, up to ``max_concurrency``. Rate
+    limit headers (``x-ratelimit-remaining-*`` / ``x-ratelimit-reset-*``,
+    as sent by OpenAI and Groq) pause calls before the quota runs out.
+    """
+
+    def __init__(self, max_concurrency: int, backoff_base: float = 1.0, backoff_max: float = 60.0):
+        self.max_concurrency = max(1, max_concurrency)
+        self.limit = float(self.max_concurrency)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.active = 0
+        self.paused_until = 0.0
+        self._consecutive_limited = 0
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        """Block until a call may start."""
+        with self._condition:
+            while True:
+                wait = self.paused_until - time.monotonic()
+                if wait <= 0 and self.active < int(self.limit):
+                    self.active += 1
+                    return
+                self._condition.wait(timeout=wait if wait > 0 else None)
+
+    def release(self, rate_limited: bool = False, retry_after: Optional[float] = None):
+        """Finish a call started with ``acquire``."""
+        with self._condition:
+            self.active -= 1
+            if rate_limited:
+                self._consecutive_limited += 1
+                self.limit = max(1.0, self.limit / 2)
+                if retry_after is None:
+                    retry_after = min(self.backoff_max,
+                                      self.backoff_base * 2 ** (self._consecutive_limited - 1))
+                self._pause(retry_after)
+                logger.warning(f"LLM rate limited; pausing {retry_after:.1f}s, "
+                               f"concurrency limit now {int(self.limit)}")
+            else:
+                self._consecutive_limited = 0
+                self.limit = min(float(self.max_concurrency), self.limit + 1 / self.limit)
+            self._condition.notify_all()
+
+    def update(self, headers: Mapping[str, str]):
+        """Pause ahead of time when rate-limit headers say the quota is used up."""
+        for kind in ("requests", "tokens"):
+            remaining = headers.get(f"x-ratelimit-remaining-{kind}")
+            reset = parse_duration(headers.get(f"x-ratelimit-reset-{kind}"))
+            try:
+                exhausted = remaining is not None and float(remaining) <= 0
+            except ValueError:
+                continue
+            if exhausted and reset:
+                with self._condition:
+                    self._pause(reset)
+                logger.info(f"LLM {kind} quota used up; pausing {reset:.1f}s")
+
+    def _pause(self, seconds: float):
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+
+class LLMCallStats:
+    """Thread-safe accumulator of per-call LLM latency and outcome figures."""
+
+    def __init__(self, max_samples: int = 10000):
+        self._lock = threading.Lock()
+        self._max_samples = max_samples
+        self.reset()
+
+    def reset(self):
+        """Clear all counters, e.g. at the start of a run."""
+        with self._lock:
+            self.latencies_ms: List[float] = []
+            self._totals = LLMStats()
+
+    def record(self, latency_ms: float, failed: bool = False, rate_limited: bool = False):
+        """Add one finished call attempt."""
+        with self._lock:
+            totals = self._totals
+            totals.calls += 1
+            totals.failures += int(failed)
+            totals.rate_limited += int(rate_limited)
+            totals.total_latency_ms += latency_ms
+            totals.max_latency_ms = max(totals.max_latency_ms, latency_ms)
+            if len(self.latencies_ms) < self._max_samples:
+                self.latencies_ms.append(latency_ms)
+
+    def record_tokens(self, prompt_tokens: int, completion_tokens: int):
+        """Add the token usage a provider reported for one call."""
+        with self._lock:
+            self._totals.prompt_tokens += prompt_tokens
+            self._totals.completion_tokens += completion_tokens
+
+    def record_scored(self, jobs: int = 1):
+        """Count jobs that got a verdict from the LLM."""
+        with self._lock:
+            self._totals.jobs_scored += jobs
+
+    def record_fallbacks(self, jobs: int):
+        """Count jobs a multi-job prompt failed to score."""
+        with self._lock:
+            self._totals.batch_fallbacks += jobs
+
+    def record_cache(self, hit: bool):
+        """Count a verdict cache lookup."""
+        with self._lock:
+            if hit:
+                self._totals.cache_hits += 1
+            else:
+                self._totals.cache_misses += 1
+
+    def snapshot(self) -> LLMStats:
+        """Copy of the current totals with latency percentiles."""
+        with self._lock:
+            stats = self._totals.model_copy()
+            latencies = sorted(self.latencies_ms)
+        if latencies:
+            stats.p50_latency_ms = _percentile(latencies, 50)
+            stats.p95_latency_ms = _percentile(latencies, 95)
+            stats.p99_latency_ms = _percentile(latencies, 99)
+        return stats
+
+
+def parse_duration(value: Optional[str]) -> Optional[float]:
+    """Seconds in a rate-limit header value, or None if it cannot be parsed."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    parts = _DURATION_RE.findall(value)
+    if not parts:
+        return None
+    return sum(float(number) * _UNIT_SECONDS[unit] for number, unit in parts)
+
+
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    index = min(len(sorted_values) - 1, int(round(percent / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
@@ -1,19 +1,53 @@
 """LLM integration for job filtering and analysis."""
 import json
 import logging
-from typing import List, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from jobminer.config import settings
+from jobminer.descriptions import estimate_tokens, prompt_description
+from jobminer.llm_cache import VerdictCache, verdict_key
+from jobminer.llm_calls import (AdaptiveThrottle, CircuitBreaker, CircuitOpenError, LLMCallStats,
+                                RateLimitedError, parse_duration)
 from jobminer.models import Job
 
 logger = logging.getLogger(__name__)
 
+# Part of every verdict cache key; bump when prompts or score parsing change
+PROMPT_VERSION = "1"
+
+# Start of the analysis of jobs left without a score
+UNSCORED_PREFIX = "Unscored: "
+
 
 class LLMFilter:
-    """Base class for LLM-based job filtering."""
+    """
+    Base class for LLM-based job filtering.
+
+    Subclasses implement ``analyze_job`` for one job, raising
+    ``RateLimitedError`` when the provider answers 429 and reporting rate
+    limit headers to ``self.throttle``. Subclasses that also implement
+    ``_generate`` (and set ``supports_batch_prompts``) can score several
+    jobs per prompt. ``batch_analyze`` runs the calls concurrently under
+    the adaptive throttle, reusing verdicts from ``self.cache`` (set by the
+    orchestrator) for jobs scored before. A circuit breaker stops calls to
+    a backend that keeps failing; jobs that could not be scored keep a
+    ``None`` score and an "Unscored: ..." analysis.
+    """
+
+    supports_batch_prompts = False
+    # Whether verdicts are worth caching; cheap local scores are not, so an
+    # LLM scores the job once one is reachable again
+    caches_verdicts = True
 
     def __init__(self):
         self.model = None
+        self.workers = max(1, settings.llm_workers)
+        self.throttle = AdaptiveThrottle(self.workers, backoff_base=settings.llm_backoff_base)
+        self.stats = LLMCallStats()
+        self.breaker = CircuitBreaker(settings.llm_breaker_failures, settings.llm_breaker_reset_seconds)
+        self.cache: Optional[VerdictCache] = None
 
     def analyze_job(self, job: Job, user_criteria: str) -> tuple[float, str]:
         """
@@ -28,28 +62,157 @@ class LLMFilter:
         """
         raise NotImplementedError
 
+    def _generate(self, prompt: str) -> str:
+        """Send a prompt asking for a JSON response and return the response text."""
+        raise NotImplementedError
+
+    def ping(self):
+        """Cheap request checking that the backend is up; raises if it is not."""
+
     def batch_analyze(self, jobs: List[Job], user_criteria: str) -> List[Job]:
-        """Analyze multiple jobs and update their relevance scores."""
-        for job in jobs:
-            try:
-                score, analysis = self.analyze_job(job, user_criteria)
-                job.relevance_score = score
-                job.llm_analysis = analysis
-            except Exception as e:
-                logger.error(f"Error analyzing job {job.id}: {e}")
-                job.relevance_score = 0.0
-                job.llm_analysis = f"Error during analysis: {str(e)}"
+        """
+        Analyze multiple jobs concurrently and update their relevance scores.
+
+        Jobs with a cached verdict are not sent to the LLM. The rest are
+        packed into multi-job prompts when the backend supports them, or
+        scored one per call otherwise. Up to ``settings.llm_workers`` calls
+        run at once (fewer while the provider is rate limiting). Jobs are
+        returned in input order.
+        """
+        pending = [job for job in jobs if not self._apply_cached(job, user_criteria)]
+        if self.supports_batch_prompts and settings.llm_batch_size > 1 and len(pending) > 1:
+            groups = pack_prompt_batches(pending, user_criteria)
+            self._run_concurrently(lambda group: self._score_group(group, user_criteria), groups)
+        else:
+            self._run_concurrently(lambda job: self._score_job(job, user_criteria), pending)
         return jobs
 
+    def _run_concurrently(self, work: Callable[[Any], None], items: List[Any]):
+        if len(items) <= 1 or self.workers == 1:
+            for item in items:
+                work(item)
+            return
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(items)),
+                                thread_name_prefix="llm") as executor:
+            list(executor.map(work, items))
+
+    def _score_group(self, jobs: List[Job], user_criteria: str):
+        """Score jobs with one multi-job prompt, falling back to single calls for bad items."""
+        if len(jobs) == 1:
+            self._score_job(jobs[0], user_criteria)
+            return
+
+        try:
+            text = self._call(lambda: self._generate(build_batch_prompt(jobs, user_criteria)))
+            verdicts = parse_batch_response(text, len(jobs))
+        except CircuitOpenError as e:
+            for job in jobs:
+                self._mark_unscored(job, str(e))
+            return
+        except Exception as e:
+            logger.error(f"Error analyzing batch of {len(jobs)} jobs: {e}")
+            verdicts = {}
+
+        missing = []
+        for number, job in enumerate(jobs, start=1):
+            if number in verdicts:
+                self._apply_verdict(job, user_criteria, *verdicts[number])
+            else:
+                missing.append(job)
+        if missing:
+            logger.warning(f"Batch response lacked valid verdicts for {len(missing)} of {len(jobs)} jobs; "
+                           f"scoring them one by one")
+            self.stats.record_fallbacks(len(missing))
+            for job in missing:
+                self._score_job(job, user_criteria)
+
+    def _score_job(self, job: Job, user_criteria: str):
+        """Score one job with its own call."""
+        try:
+            score, analysis = self._call(lambda: self.analyze_job(job, user_criteria))
+        except CircuitOpenError as e:
+            self._mark_unscored(job, str(e))
+            return
+        except Exception as e:
+            logger.error(f"Error analyzing job {job.id}: {e}")
+            self._mark_unscored(job, f"error during analysis: {e}")
+            return
+        self._apply_verdict(job, user_criteria, score, analysis)
+
+    def _call(self, request: Callable[[], Any]) -> Any:
+        """
+        Make one LLM call under the throttle and circuit breaker.
+
+        Calls rejected by the rate limit are retried; they show the backend
+        is up, so they do not count towards opening the circuit.
+
+        Raises:
+            CircuitOpenError: If the backend's circuit is open
+        """
+        for attempt in range(settings.llm_max_retries + 1):
+            if not self.breaker.allow():
+                raise CircuitOpenError(f"{type(self).__name__} is failing; circuit open")
+            self.throttle.acquire()
+            start = time.monotonic()
+            try:
+                response = request()
+            except RateLimitedError as e:
+                self.throttle.release(rate_limited=True, retry_after=e.retry_after)
+                self.stats.record(_elapsed_ms(start), rate_limited=True)
+                self.breaker.record_success()
+                if attempt < settings.llm_max_retries:
+                    continue
+                raise RateLimitedError(f"Still rate limited after {attempt + 1} attempts: {e}")
+            except Exception:
+                self.throttle.release()
+                self.stats.record(_elapsed_ms(start), failed=True)
+                self.breaker.record_failure()
+                raise
+
+            self.throttle.release()
+            self.stats.record(_elapsed_ms(start))
+            self.breaker.record_success()
+            return response
+
+    def _cache_key(self, job: Job, user_criteria: str) -> str:
+        return verdict_key(job, user_criteria, f"{type(self).__name__}:{self.model}", PROMPT_VERSION)
+
+    def _apply_cached(self, job: Job, user_criteria: str) -> bool:
+        """Set a cached verdict on the job; False if there is none."""
+        if self.cache is None:
+            return False
+        cached = self.cache.get(self._cache_key(job, user_criteria))
+        self.stats.record_cache(hit=cached is not None)
+        if cached is None:
+            return False
+        job.relevance_score, job.llm_analysis = cached
+        return True
+
+    def _mark_unscored(self, job: Job, reason: str):
+        """Leave the job without a score, saying why."""
+        mark_unscored(job, reason)
+
+    def _apply_verdict(self, job: Job, user_criteria: str, score: float, analysis: str):
+        """Set a fresh LLM verdict on the job and remember it."""
+        job.relevance_score = score
+        job.llm_analysis = analysis
+        self.stats.record_scored()
+        if self.cache is not None:
+            self.cache.put(self._cache_key(job, user_criteria), score, analysis)
+
 
 class OllamaFilter(LLMFilter):
     """LLM filter using local Ollama instance (free)."""
 
-    def __init__(self):
+    supports_batch_prompts = True
+
+    def __init__(self, base_url: Optional[str] = None):
         super().__init__()
         try:
             import ollama
-            self.client = ollama.Client(host=settings.ollama_base_url)
+            self.base_url = base_url or settings.ollama_base_url
+            self.client = ollama.Client(host=self.base_url, timeout=settings.ollama_timeout_seconds)
+            self._response_error = ollama.ResponseError
             self.model = settings.ollama_model
             logger.info(f"Initialized Ollama filter with model: {self.model}")
         except ImportError:
@@ -71,7 +234,7 @@ Job Details:
 - Company: {job.company}
 - Location: {job.location}
 - Remote: {job.is_remote}
-- Description: {job.description[:500] if job.description else 'N/A'}
+- Description: {prompt_description(job, settings.llm_description_tokens)}
 
 Please provide:
 1. A relevance score from 0.0 to 1.0 (where 1.0 is perfect match)
@@ -81,41 +244,61 @@ Respond in JSON format:
 {{"score": 0.0-1.0, "analysis": "your analysis here"}}
 """
 
+        result = json.loads(self._generate(prompt))
+        score = float(result.get('score', 0.0))
+        analysis = result.get('analysis', 'No analysis provided')
+
+        return score, analysis
+
+    def ping(self):
+        """List the models the server has."""
+        self.client.list()
+
+    def _generate(self, prompt: str) -> str:
+        """Generate a JSON response with Ollama."""
         try:
             response = self.client.generate(
                 model=self.model,
                 prompt=prompt,
-                format='json'
+                format='json',
+                # Ollama silently truncates prompts beyond its (small) default context
+                options={'num_ctx': settings.llm_context_tokens},
             )
+        except self._response_error as e:
+            if e.status_code == 429:
+                raise RateLimitedError(f"Ollama busy: {e}")
+            raise
 
-            result = json.loads(response['response'])
-            score = float(result.get('score', 0.0))
-            analysis = result.get('analysis', 'No analysis provided')
-
-            return score, analysis
-
-        except Exception as e:
-            logger.error(f"Ollama analysis error: {e}")
-            return 0.0, f"Analysis failed: {str(e)}"
+        self.stats.record_tokens(response.get('prompt_eval_count') or 0, response.get('eval_count') or 0)
+        return response['response']
 
 
 class OpenAICompatibleFilter(LLMFilter):
     """LLM filter using OpenAI-compatible API (for small/free models)."""
 
-    def __init__(self, api_key: str = None, base_url: str = None, model: str = None):
+    supports_batch_prompts = True
+
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None,
+                 model: Optional[str] = None, timeout: Optional[float] = None):
         super().__init__()
         try:
-            from openai import OpenAI
+            from openai import OpenAI, RateLimitError
 
             # Use provided values or fall back to settings
             api_key = api_key or settings.openai_api_key
             if not api_key:
                 raise ValueError("API key not configured")
 
+            # Rate-limited calls are retried by batch_analyze under the
+            # adaptive throttle, so the SDK must not retry them itself
+            self.base_url = base_url or settings.openai_base_url
             self.client = OpenAI(
                 api_key=api_key,
-                base_url=base_url or settings.openai_base_url
+                base_url=self.base_url,
+                max_retries=0,
+                timeout=timeout or settings.openai_timeout_seconds,
             )
+            self._rate_limit_error = RateLimitError
             self.model = model or settings.openai_model
             logger.info(f"Initialized OpenAI-compatible filter with model: {self.model}")
         except ImportError:
@@ -137,14 +320,26 @@ Job Details:
 - Company: {job.company}
 - Location: {job.location}
 - Remote: {job.is_remote}
-- Description: {job.description[:500] if job.description else 'N/A'}
+- Description: {prompt_description(job, settings.llm_description_tokens)}
 
 Provide a relevance score from 0.0 to 1.0 and a brief explanation.
 Respond in JSON: {{"score": 0.0-1.0, "analysis": "explanation"}}
 """
 
+        result = json.loads(self._generate(prompt))
+        score = float(result.get('score', 0.0))
+        analysis = result.get('analysis', 'No analysis provided')
+
+        return score, analysis
+
+    def ping(self):
+        """List the models the endpoint serves."""
+        self.client.models.list()
+
+    def _generate(self, prompt: str) -> str:
+        """Generate a JSON response with the chat completions API."""
         try:
-            response = self.client.chat.completions.create(
+            raw = self.client.chat.completions.with_raw_response.create(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": "You are a job matching assistant. Respond only with JSON."},
@@ -153,16 +348,15 @@ Respond in JSON: {{"score": 0.0-1.0, "analysis": "explanation"}}
                 response_format={"type": "json_object"},
                 temperature=0.3
             )
+        except self._rate_limit_error as e:
+            retry_after = parse_duration(e.response.headers.get("retry-after"))
+            raise RateLimitedError(f"Rate limited: {e}", retry_after=retry_after)
 
-            result = json.loads(response.choices[0].message.content)
-            score = float(result.get('score', 0.0))
-            analysis = result.get('analysis', 'No analysis provided')
-
-            return score, analysis
-
-        except Exception as e:
-            logger.error(f"OpenAI API analysis error: {e}")
-            return 0.0, f"Analysis failed: {str(e)}"
+        self.throttle.update(raw.headers)
+        response = raw.parse()
+        if response.usage:
+            self.stats.record_tokens(response.usage.prompt_tokens, response.usage.completion_tokens)
+        return response.choices[0].message.content or ""
 
 
 class GroqFilter(OpenAICompatibleFilter):
@@ -175,37 +369,255 @@ class GroqFilter(OpenAICompatibleFilter):
         super().__init__(
             api_key=settings.groq_api_key,
             base_url="https://api.groq.com/openai/v1",
-            model=settings.groq_model
+            model=settings.groq_model,
+            timeout=settings.groq_timeout_seconds,
         )
         logger.info(f"Initialized Groq filter with model: {self.model} (FREE)")
 
 
+class FailoverFilter(LLMFilter):
+    """
+    Scores with the first healthy backend, failing over to the next.
+
+    Jobs a backend left unscored (errors, timeouts, an open circuit) are
+    passed to the next backend in order; backends whose circuit is open
+    are skipped. Backends share this filter's stats. The verdict cache is
+    used here only, under this filter's key, so a job is looked up once
+    however many backends it fails over to; the backends do not see it.
+    """
+
+    def __init__(self, backends: List[LLMFilter]):
+        self.backends = backends
+        super().__init__()
+        self.model = " > ".join(f"{type(backend).__name__}:{backend.model}" for backend in backends)
+        for backend in backends:
+            backend.stats = self.stats
+
+    @property
+    def cache(self) -> Optional[VerdictCache]:
+        return self._cache
+
+    @cache.setter
+    def cache(self, cache: Optional[VerdictCache]):
+        self._cache = cache
+        for backend in self.backends:
+            backend.cache = None
+
+    def analyze_job(self, job: Job, user_criteria: str) -> tuple[float, str]:
+        """Analyze one job with the first backend that can score it."""
+        self.batch_analyze([job], user_criteria)
+        if job.relevance_score is None:
+            raise RuntimeError(job.llm_analysis)
+        return job.relevance_score, job.llm_analysis or ""
+
+    def batch_analyze(self, jobs: List[Job], user_criteria: str) -> List[Job]:
+        """Score jobs, moving those a backend could not score on to the next one."""
+        pending = [job for job in jobs if not self._apply_cached(job, user_criteria)]
+        tried = None
+        for backend in self.backends:
+            if not pending:
+                break
+            if backend.breaker.is_open:
+                continue
+            if tried is not None:
+                logger.warning(f"Failing over {len(pending)} jobs from {type(tried).__name__} "
+                               f"to {type(backend).__name__}")
+            backend.batch_analyze(pending, user_criteria)
+            tried = backend
+            if self.cache is not None and backend.caches_verdicts:
+                for job in pending:
+                    if job.relevance_score is not None:
+                        self.cache.put(self._cache_key(job, user_criteria), job.relevance_score,
+                                       job.llm_analysis or "")
+            pending = [job for job in pending if job.relevance_score is None]
+        for job in pending:
+            if job.llm_analysis is None:
+                self._mark_unscored(job, "all LLM backends are failing")
+        return jobs
+
+
 def get_llm_filter() -> Optional[LLMFilter]:
-    """Get the appropriate LLM filter based on configuration."""
+    """
+    Get the appropriate LLM filter based on configuration.
+
+    All backends that can be set up are used, in order of preference
+    (Groq, Ollama, OpenAI-compatible), failing over from one to the next.
+    With ``settings.ollama_endpoints`` or ``settings.openai_endpoints``
+    set, those endpoints form one load-balanced backend in Ollama's place.
+    With ``settings.local_filter_fallback``, local similarity scoring comes
+    last, so jobs are scored even when no LLM is reachable.
+    """
+    if settings.local_filter_only:
+        return _local_filter()
+
+    backends: List[LLMFilter] = []
+
     # Try Groq first (free cloud API)
     if settings.groq_api_key:
         try:
-            return GroqFilter()
+            backends.append(GroqFilter())
         except Exception as e:
             logger.warning(f"Could not initialize Groq filter: {e}")
 
-    # Try Ollama second (free and local)
-    try:
-        return OllamaFilter()
-    except Exception as e:
-        logger.warning(f"Could not initialize Ollama filter: {e}")
+    # Several self-hosted endpoints are load-balanced as one backend
+    pooled = _pooled_filter()
+    if pooled is not None:
+        backends.append(pooled)
+    else:
+        # Try Ollama second (free and local)
+        try:
+            backends.append(OllamaFilter())
+        except Exception as e:
+            logger.warning(f"Could not initialize Ollama filter: {e}")
 
     # Fall back to OpenAI-compatible API if configured
-    if settings.openai_api_key:
+    if settings.openai_api_key and not settings.openai_endpoints_list:
         try:
-            return OpenAICompatibleFilter()
+            backends.append(OpenAICompatibleFilter())
         except Exception as e:
             logger.warning(f"Could not initialize OpenAI filter: {e}")
 
+    if settings.local_filter_fallback:
+        if not backends:
+            logger.warning("No LLM available; scoring jobs by similarity to the search criteria instead")
+        # Last in the chain: jobs no LLM could score are scored locally
+        # instead of being saved unscored
+        backends.append(_local_filter())
+
+    if len(backends) > 1:
+        return FailoverFilter(backends)
+    if backends:
+        return backends[0]
+
     logger.error("No LLM filter available. Please configure Groq, Ollama, or OpenAI.")
     return None
 
 
+def _pooled_filter() -> Optional[LLMFilter]:
+    from jobminer.llm_pool import PooledFilter
+
+    endpoints: List[LLMFilter] = []
+    for url in settings.ollama_endpoints_list:
+        try:
+            endpoints.append(OllamaFilter(base_url=url))
+        except Exception as e:
+            logger.warning(f"Could not initialize Ollama endpoint {url}: {e}")
+    for url in settings.openai_endpoints_list:
+        try:
+            # Self-hosted servers usually ignore the key, but the client requires one
+            endpoints.append(OpenAICompatibleFilter(api_key=settings.openai_api_key or "unused", base_url=url))
+        except Exception as e:
+            logger.warning(f"Could not initialize OpenAI-compatible endpoint {url}: {e}")
+    if not endpoints:
+        return None
+    return PooledFilter(endpoints) if len(endpoints) > 1 else endpoints[0]
+
+
+def _local_filter() -> LLMFilter:
+    from jobminer.local_filter import LocalSimilarityFilter
+    return LocalSimilarityFilter()
+
+
+def mark_unscored(job: Job, reason: str):
+    """Leave the job without a score, saying why."""
+    job.relevance_score = None
+    job.llm_analysis = f"{UNSCORED_PREFIX}{reason}"
+
+
+def is_unscored(job: Job) -> bool:
+    """True for jobs left without a score because no LLM could score them."""
+    return job.relevance_score is None and (job.llm_analysis or "").startswith(UNSCORED_PREFIX)
+
+
+def build_batch_prompt(jobs: List[Job], user_criteria: str) -> str:
+    """Prompt asking for verdicts on several jobs, numbered from 1."""
+    blocks = "\n".join(_job_block(number, job) for number, job in enumerate(jobs, start=1))
+    return _BATCH_PROMPT.format(criteria=user_criteria, count=len(jobs), jobs=blocks)
+
+
+def pack_prompt_batches(jobs: List[Job], user_criteria: str) -> List[List[Job]]:
+    """
+    Split jobs into groups that each fit one prompt.
+
+    A group is closed when it reaches ``settings.llm_batch_size`` jobs or
+    when another job's text plus its share of the response would exceed
+    ``settings.llm_context_tokens``. Token counts are estimated from
+    character counts.
+    """
+    overhead = estimate_tokens(_BATCH_PROMPT.format(criteria=user_criteria, count=0, jobs=""))
+    budget = settings.llm_context_tokens - overhead
+    groups: List[List[Job]] = []
+    group: List[Job] = []
+    used = 0
+    for job in jobs:
+        cost = estimate_tokens(_job_block(len(group) + 1, job)) + settings.llm_response_tokens_per_job
+        if group and (len(group) >= settings.llm_batch_size or used + cost > budget):
+            groups.append(group)
+            group, used = [], 0
+        group.append(job)
+        used += cost
+    if group:
+        groups.append(group)
+    return groups
+
+
+def parse_batch_response(text: str, count: int) -> Dict[int, Tuple[float, str]]:
+    """
+    Valid verdicts from a batch response, by job number.
+
+    Accepts ``{"results": [...]}`` or a bare array of ``{id, score,
+    analysis}`` objects. Items with an unknown or repeated id, a score
+    outside 0-1 or a missing analysis are skipped.
+    """
+    data = json.loads(text)
+    if isinstance(data, dict):
+        data = data.get("results")
+    if not isinstance(data, list):
+        raise ValueError("Batch response has no results array")
+
+    verdicts: Dict[int, Tuple[float, str]] = {}
+    for item in data:
+        try:
+            number = int(item["id"])
+            score = float(item["score"])
+            analysis = item["analysis"]
+        except (TypeError, KeyError, ValueError):
+            continue
+        if 1 <= number <= count and number not in verdicts and 0.0 <= score <= 1.0 \
+                and isinstance(analysis, str) and analysis:
+            verdicts[number] = (score, analysis)
+    return verdicts
+
+
+def _job_block(number: int, job: Job) -> str:
+    return f"""[{number}]
+- Title: {job.title}
+- Company: {job.company}
+- Location: {job.location}
+- Remote: {job.is_remote}
+- Description: {prompt_description(job, settings.llm_description_tokens)}
+"""
+
+
+_BATCH_PROMPT = """Analyze these {count} job postings and rate the relevance of each for the candidate.
+
+User's Criteria:
+{criteria}
+
+Jobs:
+{jobs}
+For every job provide a relevance score from 0.0 to 1.0 (where 1.0 is perfect match) and a brief
+explanation of why it matches or doesn't match the criteria.
+
+Respond in JSON with one entry per job, using the job's number as id:
+{{"results": [{{"id": 1, "score": 0.0-1.0, "analysis": "your analysis here"}}]}}
+"""
+
+
+def _elapsed_ms(start: float) -> float:
+    return (time.monotonic() - start) * 1000
+
+
 def build_user_criteria() -> str:
     """Build a text description of user's job search criteria."""
     criteria = f"""
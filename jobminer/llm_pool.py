@@ -0,0 +1,186 @@
+"""Load-balanced scoring across several LLM endpoints serving the same model."""
+import logging
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional
+
+from jobminer.config import settings
+from jobminer.llm_cache import VerdictCache
+from jobminer.llm_calls import CircuitOpenError
+from jobminer.llm_filter import LLMFilter
+from jobminer.models import Job
+
+logger = logging.getLogger(__name__)
+
+# Weight of the newest call in an endpoint's moving average latency
+LATENCY_SMOOTHING = 0.2
+
+# Calls an endpoint must have made before it can be judged slow (the first
+# Ollama call also loads the model)
+MIN_CALLS_FOR_LATENCY = 5
+
+
+class Endpoint:
+    """One pool member and its routing state."""
+
+    def __init__(self, backend: LLMFilter):
+        self.backend = backend
+        self.name = getattr(backend, "base_url", None) or type(backend).__name__
+        self.outstanding = 0
+        self.calls = 0
+        self.latency_ms: Optional[float] = None
+        self.healthy = True
+        self.slow = False
+
+    @property
+    def available(self) -> bool:
+        return self.healthy and not self.slow and not self.backend.breaker.is_open
+
+    def record_latency(self, latency_ms: float):
+        self.calls += 1
+        if self.latency_ms is None:
+            self.latency_ms = latency_ms
+        else:
+            self.latency_ms += LATENCY_SMOOTHING * (latency_ms - self.latency_ms)
+
+
+class PooledFilter(LLMFilter):
+    """
+    Spreads LLM calls over several endpoints serving the same model.
+
+    Each call goes to the available endpoint with the fewest requests in
+    flight (least outstanding requests), so faster endpoints take more of
+    the work. Up to ``settings.llm_workers`` calls run per endpoint, so
+    throughput grows with the number of endpoints.
+
+    Endpoints whose average call latency grows beyond
+    ``settings.llm_slow_endpoint_factor`` times the pool median get no
+    more calls. Every ``settings.llm_health_check_seconds`` all endpoints
+    are pinged: those failing the check get no calls until a later check
+    passes, and slow ones that pass get another chance. A failed call is
+    retried once on each other endpoint. Endpoints share this filter's
+    stats and verdict cache.
+    """
+
+    def __init__(self, backends: List[LLMFilter]):
+        self.endpoints = [Endpoint(backend) for backend in backends]
+        super().__init__()
+        self.workers = max(1, settings.llm_workers) * len(backends)
+        models = {backend.model for backend in backends}
+        self.model = models.pop() if len(models) == 1 else ",".join(sorted(map(str, models)))
+        self.supports_batch_prompts = all(backend.supports_batch_prompts for backend in backends)
+        self._lock = threading.Condition()
+        self._checked_at = 0.0
+        for backend in backends:
+            backend.stats = self.stats
+        logger.info(f"Initialized LLM pool with {len(backends)} endpoints: "
+                    f"{', '.join(endpoint.name for endpoint in self.endpoints)}")
+
+    @property
+    def cache(self) -> Optional[VerdictCache]:
+        return self._cache
+
+    @cache.setter
+    def cache(self, cache: Optional[VerdictCache]):
+        self._cache = cache
+        for endpoint in self.endpoints:
+            endpoint.backend.cache = cache
+
+    def batch_analyze(self, jobs: List[Job], user_criteria: str) -> List[Job]:
+        """Check endpoint health if due, then score the jobs across the pool."""
+        if time.monotonic() - self._checked_at >= settings.llm_health_check_seconds:
+            self.check_health()
+        return super().batch_analyze(jobs, user_criteria)
+
+    def analyze_job(self, job: Job, user_criteria: str) -> tuple[float, str]:
+        return self._route(lambda backend: backend.analyze_job(job, user_criteria))
+
+    def _generate(self, prompt: str) -> str:
+        return self._route(lambda backend: backend._generate(prompt))
+
+    def _call(self, request: Callable[[], Any]) -> Any:
+        # Throttling, retries and circuit breaking happen per endpoint in _route
+        return request()
+
+    def check_health(self):
+        """Ping all endpoints concurrently and update which ones get calls."""
+        def ping(endpoint: Endpoint):
+            try:
+                endpoint.backend.ping()
+            except Exception as e:
+                if endpoint.healthy:
+                    logger.warning(f"LLM endpoint {endpoint.name} failed its health check: {e}")
+                endpoint.healthy = False
+                return
+            if not endpoint.healthy:
+                logger.info(f"LLM endpoint {endpoint.name} is healthy again")
+            endpoint.healthy = True
+            if endpoint.slow:
+                # Judge it again on fresh calls
+                endpoint.slow = False
+                endpoint.calls = 0
+                endpoint.latency_ms = None
+
+        with ThreadPoolExecutor(max_workers=len(self.endpoints), thread_name_prefix="llm-health") as executor:
+            list(executor.map(ping, self.endpoints))
+        with self._lock:
+            self._checked_at = time.monotonic()
+            self._lock.notify_all()
+
+    def _mark_slow(self):
+        """Stop routing to endpoints much slower than the pool median."""
+        measured = [endpoint for endpoint in self.endpoints
+                    if endpoint.available and endpoint.calls >= MIN_CALLS_FOR_LATENCY]
+        if len(measured) < 2:
+            return
+        limit = statistics.median(endpoint.latency_ms for endpoint in measured) * settings.llm_slow_endpoint_factor
+        for endpoint in measured:
+            if endpoint.latency_ms > limit and sum(e.available for e in self.endpoints) > 1:
+                logger.warning(f"LLM endpoint {endpoint.name} is slow "
+                               f"({endpoint.latency_ms:.0f} ms vs {limit:.0f} ms limit); skipping it")
+                endpoint.slow = True
+
+    def _route(self, request: Callable[[LLMFilter], Any]) -> Any:
+        """Run a request on the least loaded endpoint, trying the others if it fails."""
+        tried: List[Endpoint] = []
+        error: Optional[Exception] = None
+        while True:
+            endpoint = self._acquire(tried)
+            if endpoint is None:
+                raise error or CircuitOpenError("No LLM endpoint in the pool is available")
+            tried.append(endpoint)
+            start = time.monotonic()
+            try:
+                response = endpoint.backend._call(lambda: request(endpoint.backend))
+            except Exception as e:
+                error = e
+                continue
+            else:
+                with self._lock:
+                    endpoint.record_latency((time.monotonic() - start) * 1000)
+                return response
+            finally:
+                self._release(endpoint)
+
+    def _acquire(self, tried: List[Endpoint]) -> Optional[Endpoint]:
+        """Reserve the available endpoint with the fewest requests in flight."""
+        with self._lock:
+            while True:
+                candidates = [endpoint for endpoint in self.endpoints
+                              if endpoint not in tried and endpoint.available]
+                if not candidates:
+                    return None
+                idle = [endpoint for endpoint in candidates if endpoint.outstanding < endpoint.backend.workers]
+                if idle:
+                    endpoint = min(idle, key=lambda e: (e.outstanding, e.latency_ms or 0.0))
+                    endpoint.outstanding += 1
+                    return endpoint
+                self._lock.wait(timeout=1.0)
+
+    def _release(self, endpoint: Endpoint):
+        with self._lock:
+            endpoint.outstanding -= 1
+            self._mark_slow()
+            self._lock.notify_all()
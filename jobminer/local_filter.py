@@ -0,0 +1,151 @@
+"""Local job scoring by TF-IDF similarity to the search criteria, for runs without an LLM."""
+import logging
+import re
+import time
+import zlib
+from typing import List, Tuple
+
+import numpy as np
+
+from jobminer.config import settings
+from jobminer.llm_filter import LLMFilter
+from jobminer.models import Job
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]")
+
+# Words too common in postings and criteria to say anything about fit
+STOP_WORDS = frozenset("""
+a an and are as at be by for from has have in is it of on or our the to we with you your will
+this that who what job role team work company years year minimum preferred required looking
+""".split())
+
+# Matched terms named in a job's analysis
+TERMS_IN_ANALYSIS = 5
+
+
+class LocalSimilarityFilter(LLMFilter):
+    """
+    Scores jobs without an LLM: cosine similarity of TF-IDF vectors.
+
+    Titles and descriptions are tokenized into words and word bigrams,
+    which a hashing vectorizer maps to ``settings.local_filter_features``
+    columns, so no vocabulary has to be built or stored. IDF weights come
+    from the lines of the criteria alone: terms repeated across the
+    criteria ("data", "engineer") weigh less than those named once, and
+    terms absent from the criteria get the highest weight. A job's score
+    therefore does not depend on which other jobs share its batch. The
+    whole batch is scored with a few NumPy operations on the non-zero
+    entries instead of a loop over jobs.
+
+    Similarity is mapped to a relevance score so that
+    ``settings.local_filter_match_similarity`` lands on 0.5, the cutoff
+    the orchestrator keeps jobs at.
+    """
+
+    caches_verdicts = False
+
+    def __init__(self):
+        super().__init__()
+        self.model = "local-tfidf"
+        self.features = settings.local_filter_features
+        logger.info(f"Initialized local similarity filter with {self.features} hashed features")
+
+    def analyze_job(self, job: Job, user_criteria: str) -> tuple[float, str]:
+        """Score one job; see ``batch_analyze`` for scoring many at once."""
+        return self.score_jobs([job], user_criteria)[0]
+
+    def batch_analyze(self, jobs: List[Job], user_criteria: str) -> List[Job]:
+        """Score all jobs in one vectorized pass and set their verdicts."""
+        if not jobs:
+            return jobs
+        start = time.monotonic()
+        verdicts = self.score_jobs(jobs, user_criteria)
+        for job, (score, analysis) in zip(jobs, verdicts):
+            job.relevance_score = score
+            job.llm_analysis = analysis
+        self.stats.record((time.monotonic() - start) * 1000)
+        self.stats.record_scored(len(jobs))
+        return jobs
+
+    def score_jobs(self, jobs: List[Job], user_criteria: str) -> List[Tuple[float, str]]:
+        """
+        Relevance verdicts for jobs, in input order.
+
+        Returns:
+            List of (relevance_score, analysis_text) tuples
+        """
+        token_lists = [tokenize(f"{job.title} {job.title} {job.description or ''}") for job in jobs]
+        criteria_lines = [tokenize(line) for line in user_criteria.splitlines()]
+        similarities, terms = self._cosine_similarities(token_lists, [line for line in criteria_lines if line])
+
+        verdicts = []
+        for similarity, matched in zip(similarities, terms):
+            score = round(float(min(1.0, 0.5 * similarity / settings.local_filter_match_similarity)), 3)
+            analysis = f"Local similarity {similarity:.3f} to search criteria"
+            analysis += f"; matched: {', '.join(matched)}" if matched else "; no matching terms"
+            verdicts.append((score, analysis))
+        return verdicts
+
+    def _cosine_similarities(self, token_lists: List[List[str]],
+                             query_lines: List[List[str]]) -> Tuple[np.ndarray, List[List[str]]]:
+        """Cosine similarity of each token list to the query, and the query terms that matched most."""
+        n_docs = len(token_lists)
+        features = self.features
+
+        # Sparse document-term counts as (document, feature) pairs
+        lengths = np.fromiter((len(tokens) for tokens in token_lists), dtype=np.int64, count=n_docs)
+        docs = np.repeat(np.arange(n_docs, dtype=np.int64), lengths)
+        hashed = hash_tokens([token for tokens in token_lists for token in tokens], features)
+        pairs, counts = np.unique(docs * features + hashed, return_counts=True)
+        docs, cols = np.divmod(pairs, features)
+
+        query_tokens = [token for line in query_lines for token in line]
+        query_cols, query_counts = np.unique(hash_tokens(query_tokens, features), return_counts=True)
+
+        # Smoothed IDF over the lines of the criteria
+        df = np.zeros(features)
+        for line in query_lines:
+            df[np.unique(hash_tokens(line, features))] += 1
+        idf = np.log((len(query_lines) + 1) / (df + 1)) + 1.0
+
+        # Sublinear TF, then TF-IDF
+        weights = (1.0 + np.log(counts)) * idf[cols]
+        query = np.zeros(features)
+        query[query_cols] = (1.0 + np.log(query_counts)) * idf[query_cols]
+        query_norm = np.linalg.norm(query)
+
+        contributions = weights * query[cols]
+        dots = np.bincount(docs, weights=contributions, minlength=n_docs)
+        norms = np.sqrt(np.bincount(docs, weights=weights * weights, minlength=n_docs))
+        denominators = norms * query_norm
+        similarities = np.divide(dots, denominators, out=np.zeros(n_docs), where=denominators > 0)
+
+        return similarities, self._top_terms(docs, cols, contributions, n_docs, query_tokens)
+
+    def _top_terms(self, docs: np.ndarray, cols: np.ndarray, contributions: np.ndarray,
+                   n_docs: int, query_tokens: List[str]) -> List[List[str]]:
+        """Query terms contributing most to each document's similarity."""
+        names = dict(zip(hash_tokens(query_tokens, self.features).tolist(), query_tokens))
+        matched = contributions > 0
+        docs, cols, contributions = docs[matched], cols[matched], contributions[matched]
+        order = np.lexsort((-contributions, docs))
+        docs, cols = docs[order], cols[order]
+        bounds = np.searchsorted(docs, np.arange(n_docs + 1))
+        return [
+            [names[col] for col in cols[bounds[i]:bounds[i + 1]][:TERMS_IN_ANALYSIS].tolist()]
+            for i in range(n_docs)
+        ]
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase words without stop words, plus bigrams of neighbouring words."""
+    words = [word for word in _TOKEN_RE.findall(text.lower()) if word not in STOP_WORDS]
+    return words + [f"{first} {second}" for first, second in zip(words, words[1:])]
+
+
+def hash_tokens(tokens: List[str], features: int) -> np.ndarray:
+    """Column of each token in a hashed feature space (stable across processes)."""
+    hashes = map(zlib.crc32, map(str.encode, tokens))
+    return np.fromiter(hashes, dtype=np.int64, count=len(tokens)) % features
@@ -1,9 +1,12 @@
 """Data models for job scraping."""
+import gc
 from datetime import datetime
 from enum import Enum
 from typing import List, Optional
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl, TypeAdapter, model_validator
+
+from jobminer.urls import is_job_id, job_id
 
 
 class CompanySize(str, Enum):
@@ -35,6 +38,8 @@ class Company(BaseModel):
     growth_rate: Optional[str] = None
     headquarters: Optional[str] = None
     website: Optional[HttpUrl] = None
+    ats: Optional[str] = None  # Applicant tracking system hosting the job board
+    ats_slug: Optional[str] = None  # Board identifier on the ATS
 
     @property
     def meets_criteria(self) -> bool:
@@ -50,20 +55,24 @@ class Company(BaseModel):
 
 class Job(BaseModel):
     """Job posting model."""
-    id: str = Field(default_factory=lambda: f"{datetime.now().timestamp()}")
+    id: str = ""  # Derived from the canonical URL, see jobminer.urls.job_id
     title: str
+    matched_role: Optional[str] = None  # Target role the title matched
     company: str
     company_info: Optional[Company] = None
     url: HttpUrl
+    alternate_urls: List[str] = Field(default_factory=list)  # Same posting on other boards
     location: str
     is_remote: bool
     description: Optional[str] = None
     requirements: Optional[List[str]] = None
     posted_date: Optional[datetime] = None
+    updated_at: Optional[datetime] = None  # Last change reported by the source
     salary_range: Optional[str] = None
     job_level: Optional[JobLevel] = None
 
     # Scoring and filtering
+    prescore: Optional[float] = None  # Cheap score deciding whether the LLM sees the job
     relevance_score: Optional[float] = None
     llm_analysis: Optional[str] = None
     scraped_at: datetime = Field(default_factory=datetime.now)
@@ -73,6 +82,54 @@ class Job(BaseModel):
             datetime: lambda v: v.isoformat(),
         }
 
+    @model_validator(mode="after")
+    def _derive_id(self) -> "Job":
+        """Give new jobs, and jobs stored with legacy timestamp IDs, their stable ID."""
+        if not is_job_id(self.id):
+            self.id = job_id(str(self.url))
+        return self
+
+
+class HttpStats(BaseModel):
+    """Aggregate HTTP transport figures for a scraping session."""
+    requests: int = 0
+    retries: int = 0
+    failures: int = 0
+    bytes_received: int = 0
+    total_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+    cache_hits: int = 0  # 304 Not Modified revalidations
+    cache_misses: int = 0
+    cache_bytes_saved: int = 0
+
+
+class LLMStats(BaseModel):
+    """Aggregate LLM call figures for a scraping session."""
+    calls: int = 0  # Call attempts, including retries
+    failures: int = 0
+    rate_limited: int = 0
+    total_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+    p50_latency_ms: float = 0.0
+    p95_latency_ms: float = 0.0
+    p99_latency_ms: float = 0.0
+    cache_hits: int = 0  # Verdicts reused from earlier runs
+    cache_misses: int = 0
+    jobs_scored: int = 0  # Jobs that got a verdict from the LLM
+    batch_fallbacks: int = 0  # Jobs rescored alone after a bad multi-job response
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+    @property
+    def tokens_per_job(self) -> float:
+        tokens = self.prompt_tokens + self.completion_tokens
+        return tokens / self.jobs_scored if self.jobs_scored else 0.0
+
+    @property
+    def cache_hit_rate(self) -> float:
+        lookups = self.cache_hits + self.cache_misses
+        return self.cache_hits / lookups if lookups else 0.0
+
 
 class ScrapingResult(BaseModel):
     """Result of a scraping session."""
@@ -80,6 +137,39 @@ class ScrapingResult(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.now)
     jobs_found: int = 0
     jobs_filtered: int = 0
+    near_duplicates: int = 0
+    description_tokens_saved: int = 0  # Estimated tokens removed by description cleanup
+    prescore_skipped: int = 0  # Jobs kept away from the LLM by pre-scoring
+    unscored: int = 0  # Jobs no LLM backend could score; saved without a score
     jobs_saved: int = 0
     errors: List[str] = Field(default_factory=list)
     sources: List[str] = Field(default_factory=list)
+    http: HttpStats = Field(default_factory=HttpStats)
+    llm: LLMStats = Field(default_factory=LLMStats)
+
+
+# Validates and serializes whole job lists in one pass through pydantic-core,
+# parsing JSON directly instead of going through intermediate dicts
+JOB_LIST_ADAPTER = TypeAdapter(List[Job])
+
+
+def load_jobs(raw: bytes | str) -> List[Job]:
+    """
+    Parse a stored JSON array of jobs.
+
+    The cyclic garbage collector is paused meanwhile: loading allocates
+    hundreds of thousands of objects, none of them in cycles, and the
+    collections this triggers otherwise take about half the load time.
+    """
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return JOB_LIST_ADAPTER.validate_json(raw)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def dump_jobs(jobs: List[Job]) -> bytes:
+    """Serialize jobs to the stored JSON format."""
+    return JOB_LIST_ADAPTER.dump_json(jobs, indent=2)
@@ -0,0 +1,134 @@
+"""Near-duplicate job detection with MinHash signatures and LSH buckets."""
+import html
+import logging
+import re
+import threading
+import zlib
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from jobminer.companies import normalize_company_name
+from jobminer.models import Job
+
+logger = logging.getLogger(__name__)
+
+# 64 hash functions in 16 bands of 4 rows: pairs above ~0.5 Jaccard
+# similarity share a bucket with high probability, and candidates are then
+# checked against the (higher) configured threshold
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+SHINGLE_SIZE = 3
+
+# Universal hashing (a * x + b) mod p with 32-bit shingle hashes; p is the
+# smallest prime above 2**32, so products stay within uint64
+_PRIME = np.uint64(4294967311)
+_rng = np.random.default_rng(1)
+_A = _rng.integers(1, 2**32, size=NUM_PERM, dtype=np.uint64)
+_B = _rng.integers(0, 2**32, size=NUM_PERM, dtype=np.uint64)
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_WORD_RE = re.compile(r"\w+")
+
+
+class NearDuplicateIndex:
+    """
+    Clusters jobs that are the same posting listed on different boards.
+
+    Each job gets a MinHash signature over word shingles of its title and
+    description. Signatures are split into bands, and each band is hashed
+    into a bucket together with the normalized company name, so only jobs
+    of the same company that agree on a whole band are compared. Adding a
+    job costs the same no matter how many jobs were added before, so
+    clustering a run is linear in the number of jobs.
+
+    Jobs from the same board are never clustered: a board lists each
+    posting once, so two similar listings there (say, the same title for
+    two teams) are different postings.
+
+    The first job of a cluster is its canonical job; later members are not
+    kept, but their URLs are added to the canonical job's ``alternate_urls``.
+
+    The index lives for one run and is not seeded from stored jobs, so a
+    posting that reappears on another board in a later run is not caught
+    here (only exact URL duplicates are, by job ID).
+    """
+
+    def __init__(self, threshold: float = 0.8):
+        """
+        Args:
+            threshold: Minimum estimated Jaccard similarity of two jobs' shingles
+        """
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        self._buckets: Dict[Tuple[str, int, bytes], List[int]] = defaultdict(list)
+        self._jobs: List[Job] = []
+        self._signatures: List[np.ndarray] = []
+        self._hosts: List[str] = []
+        self.duplicates = 0
+
+    def add(self, job: Job) -> Optional[Job]:
+        """
+        Add a job to the index.
+
+        Returns:
+            The canonical job if ``job`` is a near-duplicate of a job added
+            earlier (its URL is then recorded on the canonical job), else None
+        """
+        company = job.company_info.name if job.company_info else job.company
+        company = normalize_company_name(company)
+        host = job.url.host or ""
+        signature = minhash(shingles(job))
+        band_keys = [(company, band, signature[band * ROWS:(band + 1) * ROWS].tobytes())
+                     for band in range(BANDS)]
+
+        with self._lock:
+            candidates: Set[int] = set()
+            for key in band_keys:
+                candidates.update(self._buckets.get(key, ()))
+
+            best, best_similarity = None, self.threshold
+            for index in candidates:
+                if self._hosts[index] == host:
+                    continue
+                similarity = float(np.mean(self._signatures[index] == signature))
+                if similarity >= best_similarity:
+                    best, best_similarity = index, similarity
+
+            if best is not None:
+                canonical = self._jobs[best]
+                url = str(job.url)
+                if url != str(canonical.url) and url not in canonical.alternate_urls:
+                    canonical.alternate_urls.append(url)
+                self.duplicates += 1
+                logger.debug(f"Near-duplicate of {canonical.url}: {job.url} ({best_similarity:.2f})")
+                return canonical
+
+            index = len(self._jobs)
+            self._jobs.append(job)
+            self._signatures.append(signature)
+            self._hosts.append(host)
+            for key in band_keys:
+                self._buckets[key].append(index)
+            return None
+
+
+def shingles(job: Job) -> Set[str]:
+    """Word shingles of a job's normalized title and description."""
+    text = job.title
+    if job.description:
+        text += " " + html.unescape(_TAG_RE.sub(" ", job.description))
+    words = _WORD_RE.findall(text.lower())
+    if len(words) < SHINGLE_SIZE:
+        return {" ".join(words)}
+    return {" ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)}
+
+
+def minhash(items: Set[str]) -> np.ndarray:
+    """MinHash signature (``NUM_PERM`` values) of a set of strings."""
+    hashes = np.fromiter((zlib.crc32(item.encode("utf-8")) for item in items),
+                         dtype=np.uint64, count=len(items))
+    permuted = (np.outer(hashes, _A) + _B) % _PRIME
+    return permuted.min(axis=0)
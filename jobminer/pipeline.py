@@ -0,0 +1,91 @@
+"""Queue-connected pipeline stages running in background threads."""
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# End-of-stream marker passed from each stage to the next
+DONE = object()
+
+
+def iter_queue(inbox: queue.Queue) -> Iterator[Any]:
+    """Yield items from a queue until the end-of-stream marker."""
+    while True:
+        item = inbox.get()
+        if item is DONE:
+            return
+        yield item
+
+
+def iter_batches(inbox: queue.Queue, size: int, max_wait: float) -> Iterator[List[Any]]:
+    """
+    Group queue items into batches.
+
+    A batch is emitted when it reaches ``size`` items or when its first
+    item has waited ``max_wait`` seconds, so slow producers do not hold
+    back work that is already available.
+    """
+    batch: List[Any] = []
+    deadline = 0.0
+    while True:
+        timeout = max(0.0, deadline - time.monotonic()) if batch else None
+        try:
+            item = inbox.get(timeout=timeout)
+        except queue.Empty:
+            yield batch
+            batch = []
+            continue
+
+        if item is DONE:
+            if batch:
+                yield batch
+            return
+
+        batch.append(item)
+        if len(batch) == 1:
+            deadline = time.monotonic() + max_wait
+        if len(batch) >= size:
+            yield batch
+            batch = []
+
+
+def drain(inbox: queue.Queue):
+    """Consume a queue up to its end-of-stream marker, unblocking producers."""
+    for _ in iter_queue(inbox):
+        pass
+
+
+def start_stage(
+    name: str,
+    work: Callable[[], object],
+    inbox: Optional[queue.Queue] = None,
+    outbox: Optional[queue.Queue] = None,
+    on_error: Optional[Callable[[str], None]] = None,
+) -> threading.Thread:
+    """
+    Run one pipeline stage in a background thread.
+
+    The stage always signals end-of-stream downstream, even if it fails;
+    after a failure its inbox is drained so upstream stages blocked on a
+    full queue can finish.
+    """
+    def run():
+        try:
+            work()
+        except Exception as e:
+            error_msg = f"Pipeline stage '{name}' failed: {e}"
+            logger.error(error_msg, exc_info=True)
+            if on_error:
+                on_error(error_msg)
+            if inbox is not None:
+                drain(inbox)
+        finally:
+            if outbox is not None:
+                outbox.put(DONE)
+
+    thread = threading.Thread(target=run, name=f"pipeline-{name}", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,110 @@
+"""Cheap deterministic pre-scoring that decides which jobs are worth an LLM call."""
+import logging
+import re
+from typing import Dict, List, Optional, Tuple
+
+from jobminer.companies import get_company_info
+from jobminer.config import settings
+from jobminer.models import Job
+from jobminer.roles import get_role_matcher
+
+logger = logging.getLogger(__name__)
+
+SENIOR_TITLE_RE = re.compile(r"(?<!\w)(senior|sr\.?|staff|principal|lead|head|architect)(?!\w)", re.IGNORECASE)
+JUNIOR_TITLE_RE = re.compile(
+    r"(?<!\w)(junior|jr\.?|intern|internship|entry[ -]level|graduate|apprentice|trainee)(?!\w)", re.IGNORECASE
+)
+
+# Weights of the partial scores; they add up to 1
+WEIGHTS = {"seniority": 0.3, "role": 0.25, "keywords": 0.25, "company": 0.2}
+
+# Keyword hits in the description that count as a full keyword score
+KEYWORD_HITS_FOR_FULL_SCORE = 5
+
+
+class PreScorer:
+    """
+    Scores jobs from 0.0 to 1.0 without an LLM.
+
+    Combines title seniority, whether the title matches a target role,
+    keyword hits in the description and the company's metadata from
+    ``companies.py``. Junior titles and, when remote work is required,
+    on-site jobs score 0.
+    """
+
+    def __init__(self, keywords: Optional[List[str]] = None):
+        keywords = keywords if keywords is not None else settings.prescore_keywords_list
+        self.keywords_re = re.compile(
+            r"(?<!\w)(" + "|".join(re.escape(k) for k in sorted(keywords, key=len, reverse=True)) + r")(?!\w)",
+            re.IGNORECASE,
+        ) if keywords else None
+        self.keyword_target = min(KEYWORD_HITS_FOR_FULL_SCORE, len(keywords)) or 1
+        self.roles = get_role_matcher(settings.target_roles_list)
+
+    def score(self, job: Job) -> Tuple[float, str]:
+        """Pre-score of a job and a short explanation."""
+        if JUNIOR_TITLE_RE.search(job.title):
+            return 0.0, "junior title"
+        if settings.remote_only and not job.is_remote:
+            return 0.0, "not remote"
+
+        parts = {
+            "seniority": 1.0 if SENIOR_TITLE_RE.search(job.title) else 0.5,
+            "role": 1.0 if (job.matched_role or self.roles.match(job.title)) else 0.0,
+            "keywords": self._keyword_score(job.description),
+            "company": self._company_score(job),
+        }
+        score = sum(WEIGHTS[name] * value for name, value in parts.items())
+        explanation = ", ".join(f"{name} {value:.2f}" for name, value in parts.items())
+        return round(score, 3), explanation
+
+    def _keyword_score(self, description: Optional[str]) -> float:
+        if not description or self.keywords_re is None:
+            return 0.5  # Unknown, e.g. boards without descriptions
+        hits = {match.lower() for match in self.keywords_re.findall(description)}
+        return min(1.0, len(hits) / self.keyword_target)
+
+    def _company_score(self, job: Job) -> float:
+        company = job.company_info or get_company_info(job.company)
+        if company is None:
+            return 0.3
+        checks = []
+        if company.employee_count is not None:
+            checks.append(company.employee_count >= settings.min_employees)
+        if company.founded_year is not None:
+            checks.append(job.scraped_at.year - company.founded_year >= settings.min_years_in_business)
+        if settings.prefer_public_companies:
+            checks.append(company.is_public)
+        return sum(checks) / len(checks) if checks else 0.5
+
+
+def select_for_llm(jobs: List[Job], scorer: PreScorer, threshold: float,
+                   top_k: int = 0) -> Tuple[List[Job], List[Job]]:
+    """
+    Split jobs into those worth an LLM call and those that are not.
+
+    Every job gets its ``prescore``. Jobs at or above ``threshold`` are
+    escalated, limited to the ``top_k`` best if ``top_k`` is set. Skipped
+    jobs get a 0.0 relevance score and an explanation.
+
+    Returns:
+        Tuple of (escalated jobs in input order, skipped jobs)
+    """
+    scores: Dict[int, float] = {}
+    explanations: Dict[int, str] = {}
+    for job in jobs:
+        scores[id(job)], explanations[id(job)] = scorer.score(job)
+        job.prescore = scores[id(job)]
+
+    candidates = [job for job in jobs if scores[id(job)] >= threshold]
+    if top_k and len(candidates) > top_k:
+        best = sorted(candidates, key=lambda job: scores[id(job)], reverse=True)[:top_k]
+        best_ids = {id(job) for job in best}
+        candidates = [job for job in candidates if id(job) in best_ids]
+
+    escalated_ids = {id(job) for job in candidates}
+    skipped = [job for job in jobs if id(job) not in escalated_ids]
+    for job in skipped:
+        job.relevance_score = 0.0
+        job.llm_analysis = f"Not sent to the LLM: pre-score {scores[id(job)]:.2f} ({explanations[id(job)]})"
+    return candidates, skipped
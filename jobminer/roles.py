@@ -0,0 +1,97 @@
+"""Matching job titles against the target roles."""
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Abbreviations and other spellings of single words in job titles
+WORD_SYNONYMS: Dict[str, List[str]] = {
+    "senior": ["sr", "sr."],
+    "junior": ["jr", "jr."],
+    "engineer": ["eng", "eng."],
+    "principal": ["princ."],
+    "architect": ["arch."],
+    "developer": ["dev"],
+}
+
+# Other ways job titles say a whole role phrase
+PHRASE_SYNONYMS: Dict[str, List[str]] = {
+    "software engineer": ["swe", "sde", "software developer", "software development engineer"],
+    "data engineer": ["data platform engineer", "big data engineer"],
+    "solutions architect": ["solution architect"],
+}
+
+# Separators allowed between the words of a role ("Data-Engineer", "Data / Engineer")
+_SEPARATOR = r"[\s\-/]+"
+
+
+class RoleMatcher:
+    """
+    Finds which target role a job title is for.
+
+    All roles and their synonyms are compiled into one regular expression
+    with a named group per role, so a title is scanned once regardless of
+    the number of roles. Matches respect word boundaries: "data engineer"
+    matches "Sr. Data Engineer" but not "Metadata Engineering Lead".
+    """
+
+    def __init__(self, roles: Sequence[str]):
+        """
+        Args:
+            roles: Target roles as configured, e.g. ``settings.target_roles_list``
+        """
+        self.roles: List[str] = [role.strip() for role in roles if role.strip()]
+        # Longer roles first, so "senior data engineer" wins over "data engineer"
+        # when both would match at the same position
+        ordered = sorted(enumerate(self.roles), key=lambda item: -len(item[1]))
+        alternatives = [f"(?P<role{index}>{_role_pattern(role)})" for index, role in ordered]
+        self.pattern = re.compile(r"(?<!\w)(?:" + "|".join(alternatives) + r")(?!\w)", re.IGNORECASE) \
+            if alternatives else None
+
+    def match(self, title: str) -> Optional[str]:
+        """Configured role the title matches, or None."""
+        if self.pattern is None:
+            return None
+        found = self.pattern.search(title)
+        if found is None or found.lastgroup is None:
+            return None
+        return self.roles[int(found.lastgroup[len("role"):])]
+
+
+def get_role_matcher(roles: Sequence[str]) -> RoleMatcher:
+    """Shared matcher for a list of roles, compiled on first use."""
+    return _compiled_matcher(tuple(roles))
+
+
+@lru_cache(maxsize=16)
+def _compiled_matcher(roles: Tuple[str, ...]) -> RoleMatcher:
+    return RoleMatcher(roles)
+
+
+def _role_pattern(role: str) -> str:
+    """Regex for one role, expanding phrase and word synonyms."""
+    words = role.lower().split()
+    parts = []
+    i = 0
+    while i < len(words):
+        for phrase, synonyms in PHRASE_SYNONYMS.items():
+            phrase_words = phrase.split()
+            if words[i:i + len(phrase_words)] == phrase_words:
+                variants = [phrase] + synonyms
+                parts.append("(?:" + "|".join(_words_pattern(v.split()) for v in variants) + ")")
+                i += len(phrase_words)
+                break
+        else:
+            parts.append(_word_pattern(words[i]))
+            i += 1
+    return _SEPARATOR.join(parts)
+
+
+def _words_pattern(words: List[str]) -> str:
+    return _SEPARATOR.join(_word_pattern(word) for word in words)
+
+
+def _word_pattern(word: str) -> str:
+    variants = [word] + WORD_SYNONYMS.get(word, [])
+    # Longest first: "sr." before "sr"
+    variants.sort(key=len, reverse=True)
+    return "(?:" + "|".join(re.escape(variant) for variant in variants) + ")"
@@ -2,17 +2,35 @@
 import csv
 import json
 import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from queue import Queue
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set
 
 from jobminer.config import settings
-from jobminer.llm_filter import build_user_criteria, get_llm_filter
-from jobminer.models import Job, ScrapingResult
+from jobminer.descriptions import DescriptionCleaner
+from jobminer.job_store import JobStore
+from jobminer.llm_cache import VerdictCache
+from jobminer.llm_filter import LLMFilter, build_user_criteria, get_llm_filter, is_unscored, mark_unscored
+from jobminer.models import Job, ScrapingResult, dump_jobs, load_jobs
+from jobminer.near_duplicates import NearDuplicateIndex
+from jobminer.prescore import PreScorer, select_for_llm
+from jobminer.pipeline import iter_batches, iter_queue, start_stage
+from jobminer.scrapers.base import BaseScraper
+from jobminer.scrapers.http_cache import HttpCache
+from jobminer.scrapers.http_client import get_http_client
 from jobminer.scrapers.job_boards import get_all_scrapers
+from jobminer.urls import job_id
+from jobminer.watermarks import WatermarkStore
 
 logger = logging.getLogger(__name__)
 
+# Jobs scoring below this are left out of the results
+MIN_RELEVANCE = 0.5
+
 
 class JobScraperOrchestrator:
     """Orchestrates the job scraping process."""
@@ -20,190 +38,419 @@ class JobScraperOrchestrator:
     def __init__(self, data_dir: Path = None):
         self.data_dir = data_dir or settings.data_dir
         self.data_dir.mkdir(exist_ok=True, parents=True)
+        self.job_store = JobStore(self.data_dir / "jobs.jsonl")
         self.scrapers = get_all_scrapers()
         self.llm_filter = get_llm_filter()
+        self.watermarks = None
+        if settings.watermarks_enabled:
+            self.watermarks = WatermarkStore(self.data_dir / "watermarks.json", settings.scrape_fingerprint)
+        self.http_cache = None
+        if settings.http_cache_enabled:
+            self.http_cache = HttpCache(
+                self.data_dir / "http_cache",
+                max_bytes=settings.http_cache_max_mb * 1024 * 1024,
+                fingerprint=settings.scrape_fingerprint,
+            )
+        self.verdict_cache = None
+        if settings.llm_cache_enabled:
+            self.verdict_cache = VerdictCache(
+                self.data_dir / "llm_cache.sqlite",
+                ttl_seconds=settings.llm_cache_ttl_days * 86400,
+                max_entries=settings.llm_cache_max_entries,
+            )
 
     def run(self) -> ScrapingResult:
-        """Run the complete scraping pipeline."""
+        """
+        Run the complete scraping pipeline.
+
+        Stages are connected by bounded queues and run concurrently, so jobs
+        are deduplicated and scored while slower sources are still being
+        scraped, and a full queue slows the stages feeding it:
+
+            scrape -> dedup/near-dup/pre-filter -> LLM scoring -> collect, merge and save
+        """
         run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
         result = ScrapingResult(run_id=run_id)
 
         logger.info(f"Starting scraping run: {run_id}")
 
-        # Step 1: Scrape jobs from all sources
-        all_jobs = []
         keywords = settings.target_roles_list
-
+        http_client = get_http_client()
+        http_client.stats.reset()
+        http_client.cache = self.http_cache
+        if isinstance(self.llm_filter, LLMFilter):
+            self.llm_filter.stats.reset()
+            self.llm_filter.cache = self.verdict_cache
         for scraper in self.scrapers:
-            try:
-                logger.info(f"Scraping from {scraper.name}...")
-                jobs = scraper.scrape(keywords, max_jobs=settings.max_jobs_per_run // len(self.scrapers))
-                all_jobs.extend(jobs)
-                result.sources.append(scraper.name)
-            except Exception as e:
-                error_msg = f"Error with {scraper.name}: {str(e)}"
-                logger.error(error_msg)
-                result.errors.append(error_msg)
-
-        result.jobs_found = len(all_jobs)
-        logger.info(f"Total jobs found: {result.jobs_found}")
+            scraper.watermarks = self.watermarks
 
-        if not all_jobs:
-            logger.warning("No jobs found!")
+        # Known jobs are loaded up front so they can skip scoring; those saved
+        # unscored (e.g. during an LLM outage) are scored again
+        existing_jobs = self._load_existing_jobs()
+        existing_ids = {job.id for job in existing_jobs}
+        # Near-duplicates dropped in earlier runs are known under their own URLs
+        existing_ids.update(job_id(url) for job in existing_jobs for url in job.alternate_urls)
+        rescore = [job for job in existing_jobs if is_unscored(job)] if self.llm_filter else []
+
+        scraped: Queue = Queue(maxsize=settings.pipeline_queue_size)
+        filtered: Queue = Queue(maxsize=settings.pipeline_queue_size)
+        scored: Queue = Queue(maxsize=settings.pipeline_queue_size)
+
+        stages = [
+            # Step 1: Scrape jobs from all sources (concurrently)
+            start_stage("scrape", lambda: self._scrape_all(keywords, result, emit=scraped.put),
+                        outbox=scraped, on_error=result.errors.append),
+            # Step 2: Deduplicate and drop jobs we already have
+            start_stage("filter", lambda: self._filter_stage(scraped, filtered, existing_ids, result, rescore),
+                        inbox=scraped, outbox=filtered, on_error=result.errors.append),
+            # Step 3: Score with LLM
+            start_stage("score", lambda: self._score_stage(filtered, scored, result),
+                        inbox=filtered, outbox=scored, on_error=result.errors.append),
+        ]
+
+        # Step 4: Collect relevant jobs as they arrive
+        new_jobs = list(iter_queue(scored))
+        for stage in stages:
+            stage.join()
+
+        result.http = http_client.stats.snapshot()
+        logger.info(
+            f"HTTP: {result.http.requests} requests, {result.http.retries} retries, "
+            f"{result.http.bytes_received / 1024:.0f} KiB received; cache: "
+            f"{result.http.cache_hits} hits, {result.http.cache_misses} misses, "
+            f"{result.http.cache_bytes_saved / 1024:.0f} KiB saved"
+        )
+        if isinstance(self.llm_filter, LLMFilter):
+            result.llm = self.llm_filter.stats.snapshot()
+            logger.info(
+                f"LLM: {result.llm.calls} calls, {result.llm.failures} failed, "
+                f"{result.llm.rate_limited} rate limited; latency p50 "
+                f"{result.llm.p50_latency_ms:.0f} ms, p95 {result.llm.p95_latency_ms:.0f} ms; "
+                f"{result.llm.jobs_scored} jobs scored, {result.llm.tokens_per_job:.0f} tokens/job, "
+                f"{result.llm.batch_fallbacks} batch fallbacks; "
+                f"verdict cache: {result.llm.cache_hits} hits, {result.llm.cache_misses} misses "
+                f"({result.llm.cache_hit_rate:.0%} hit rate)"
+            )
+        logger.info(f"Total jobs found: {result.jobs_found} ({result.near_duplicates} near-duplicates)")
+        if result.description_tokens_saved:
+            logger.info(f"Description cleanup saved about {result.description_tokens_saved} tokens")
+        if result.prescore_skipped:
+            logger.info(f"Pre-scoring kept {result.prescore_skipped} jobs away from the LLM")
+        if result.unscored:
+            logger.warning(f"{result.unscored} jobs could not be scored and are saved unscored")
+
+        if not result.jobs_found and not rescore:
+            logger.warning("No new jobs found!")
+            self._commit_progress()
             return result
 
-        # Step 2: Deduplicate
-        all_jobs = self._deduplicate(all_jobs)
-        logger.info(f"Jobs after deduplication: {len(all_jobs)}")
-
-        # Step 3: Filter with LLM
-        if self.llm_filter:
-            try:
-                logger.info("Filtering jobs with LLM...")
-                user_criteria = build_user_criteria()
-                all_jobs = self.llm_filter.batch_analyze(all_jobs, user_criteria)
-
-                # Keep jobs with score >= 0.5
-                filtered_jobs = [job for job in all_jobs if job.relevance_score and job.relevance_score >= 0.5]
-                result.jobs_filtered = len(filtered_jobs)
-
-                # Sort by relevance score
-                filtered_jobs.sort(key=lambda x: x.relevance_score or 0, reverse=True)
-
-                logger.info(f"Jobs after LLM filtering: {result.jobs_filtered}")
-            except Exception as e:
-                error_msg = f"LLM filtering error: {str(e)}"
-                logger.error(error_msg)
-                result.errors.append(error_msg)
-                filtered_jobs = all_jobs  # Use unfiltered if LLM fails
-        else:
-            logger.warning("No LLM filter available, saving all jobs")
-            filtered_jobs = all_jobs
-            result.jobs_filtered = len(filtered_jobs)
-
-        # Step 4: Load existing jobs and merge
-        existing_jobs = self._load_existing_jobs()
-        merged_jobs = self._merge_with_existing(filtered_jobs, existing_jobs)
+        result.jobs_filtered = len(new_jobs)
+        logger.info(f"New relevant jobs: {result.jobs_filtered}")
 
-        # Step 5: Save results
+        # Step 5: Merge with existing jobs and save results; rescored jobs
+        # found irrelevant stay in the store but leave the results
+        existing_jobs = [job for job in existing_jobs
+                         if job.relevance_score is None or job.relevance_score >= MIN_RELEVANCE]
+        merged_jobs = self._merge_with_existing(new_jobs, existing_jobs)
         result.jobs_saved = len(merged_jobs)
-        self._save_jobs(merged_jobs, run_id)
+        self._save_jobs(merged_jobs, new_jobs, run_id, rescore)
         self._save_result(result)
+        # Only now is it safe to skip this run's listings next time
+        self._commit_progress()
 
         logger.info(f"Scraping complete. Saved {result.jobs_saved} jobs.")
         return result
 
-    def _deduplicate(self, jobs: List[Job]) -> List[Job]:
-        """Remove duplicate jobs based on URL."""
-        seen_urls = set()
-        unique_jobs = []
-        for job in jobs:
-            url_str = str(job.url)
-            if url_str not in seen_urls:
-                seen_urls.add(url_str)
-                unique_jobs.append(job)
-        return unique_jobs
+    def _filter_stage(self, inbox: Queue, outbox: Queue, existing_ids: Set[str],
+                      result: ScrapingResult, rescore: Sequence[Job] = ()):
+        """
+        Pass on each job the first time its ID is seen, unless already stored.
+
+        Stored jobs in ``rescore`` are passed on first, ahead of scraped ones.
+
+        Descriptions are cleaned up first (see ``DescriptionCleaner``).
+        Near-duplicates of a job passed on earlier (the same posting on
+        another board) are dropped too; their URLs are kept on that job.
+        """
+        for job in rescore:
+            outbox.put(job)
+        seen_ids = set(existing_ids)
+        cleaner = DescriptionCleaner(settings.description_boilerplate_postings) \
+            if settings.description_cleanup_enabled else None
+        near_duplicates = NearDuplicateIndex(settings.near_duplicate_threshold) \
+            if settings.near_duplicates_enabled else None
+        for job in iter_queue(inbox):
+            result.jobs_found += 1
+            if job.id in seen_ids:
+                continue
+            seen_ids.add(job.id)
+            if cleaner is not None:
+                result.description_tokens_saved += cleaner.clean(job)
+            if near_duplicates is not None and near_duplicates.add(job) is not None:
+                result.near_duplicates += 1
+                continue
+            outbox.put(job)
+
+    def _score_stage(self, inbox: Queue, outbox: Queue, result: ScrapingResult):
+        """
+        Score jobs in micro-batches and pass on the relevant ones.
+
+        A cheap pre-score decides which jobs reach the LLM. With
+        ``settings.prescore_top_k`` set, the stage first waits for all jobs
+        of the run so it can escalate the best ones.
+        """
+        if not self.llm_filter:
+            logger.warning("No LLM filter available, saving all jobs")
+            for job in iter_queue(inbox):
+                outbox.put(job)
+            return
+
+        user_criteria = build_user_criteria()
+        prescorer = PreScorer() if settings.prescore_enabled else None
+        top_k = settings.prescore_top_k if prescorer else 0
+        batches: Iterable[List[Job]]
+        if prescorer and top_k:
+            jobs = list(iter_queue(inbox))
+            jobs, skipped = select_for_llm(jobs, prescorer, settings.prescore_threshold, top_k)
+            result.prescore_skipped += len(skipped)
+            size = settings.pipeline_batch_size
+            batches = (jobs[i:i + size] for i in range(0, len(jobs), size))
+        else:
+            batches = iter_batches(inbox, settings.pipeline_batch_size, settings.pipeline_flush_seconds)
+
+        llm_failed = False
+        for batch in batches:
+            if prescorer and not top_k:
+                batch, skipped = select_for_llm(batch, prescorer, settings.prescore_threshold)
+                result.prescore_skipped += len(skipped)
+            if not batch:
+                continue
+            try:
+                batch = self.llm_filter.batch_analyze(batch, user_criteria)
+            except Exception as e:
+                if not llm_failed:
+                    error_msg = f"LLM filtering error: {str(e)}"
+                    logger.error(error_msg)
+                    result.errors.append(error_msg)
+                    llm_failed = True
+                # Jobs the failed call left without a score are kept, marked like any other unscored job
+                for job in batch:
+                    if job.relevance_score is None:
+                        mark_unscored(job, f"error during analysis: {e}")
+
+            # Keep relevant jobs, and unscored ones so they are not lost
+            result.unscored += sum(1 for job in batch if job.relevance_score is None)
+            for job in batch:
+                if job.relevance_score is None or job.relevance_score >= MIN_RELEVANCE:
+                    outbox.put(job)
+
+    def _scrape_all(self, keywords: List[str], result: ScrapingResult,
+                    emit: Optional[Callable[[Job], None]] = None) -> List[Job]:
+        """
+        Run every scraper in a bounded thread pool.
+
+        Each source gets its own wall-clock budget, measured from the moment
+        it actually starts running. A source that overruns is reported as an
+        error and abandoned; the worker thread cannot be interrupted, so it
+        stops at its next job or on its own HTTP timeouts. Scans an abandoned
+        source still has open are not watermarked, so listings it recorded
+        but never passed on are seen again next run.
+
+        Args:
+            keywords: Job title keywords to search for
+            result: Run result receiving sources and errors
+            emit: If given, each job is passed to it as soon as it is scraped
+                and nothing is returned. Otherwise jobs are returned in scraper
+                order once all sources finished; jobs of an overrunning source
+                are discarded.
+        """
+        if not self.scrapers:
+            return []
+
+        max_jobs = settings.max_jobs_per_run // len(self.scrapers)
+        timeout = settings.scrape_timeout_seconds
+        workers = max(1, min(settings.scrape_concurrency, len(self.scrapers)))
+
+        started: Dict[str, float] = {}
+        abandoned: Set[str] = set()
+        # Guards `abandoned` and `emitting`: nothing is emitted once a source is
+        # given up on, and emits already under way finish before we return.
+        # The lock is not held while emitting, which may block on a full queue.
+        state = threading.Condition()
+        emitting = 0  # Emits under way
+        jobs_by_source: Dict[str, List[Job]] = {}
+
+        def run_scraper(scraper: BaseScraper) -> List[Job]:
+            nonlocal emitting
+            started[scraper.name] = time.monotonic()
+            logger.info(f"Scraping from {scraper.name}...")
+            jobs = []
+            job_iter = scraper.iter_jobs(keywords, max_jobs=max_jobs)
+            try:
+                for job in job_iter:
+                    with state:
+                        if scraper.name in abandoned:
+                            break
+                        if not emit:
+                            jobs.append(job)
+                            continue
+                        emitting += 1
+                    try:
+                        emit(job)
+                    finally:
+                        with state:
+                            emitting -= 1
+                            state.notify_all()
+            finally:
+                job_iter.close()
+            return jobs
+
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scraper")
+        futures: Dict[Future, BaseScraper] = {
+            executor.submit(run_scraper, scraper): scraper for scraper in self.scrapers
+        }
+        pending = set(futures)
 
-    def _load_existing_jobs(self) -> List[Job]:
-        """Load existing jobs from the latest file."""
-        existing_jobs = []
+        try:
+            while pending:
+                done, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    scraper = futures[future]
+                    try:
+                        jobs_by_source[scraper.name] = future.result()
+                        result.sources.append(scraper.name)
+                    except Exception as e:
+                        error_msg = f"Error with {scraper.name}: {str(e)}"
+                        logger.error(error_msg)
+                        result.errors.append(error_msg)
+
+                now = time.monotonic()
+                for future in list(pending):
+                    scraper = futures[future]
+                    start = started.get(scraper.name)
+                    if start is not None and now - start > timeout:
+                        pending.discard(future)
+                        with state:
+                            abandoned.add(scraper.name)
+                            # The job in hand is dropped, though its listing may be
+                            # recorded; staging nothing more keeps it new next run
+                            scraper.watermarks = None
+                        error_msg = f"Error with {scraper.name}: timed out after {timeout:.0f}s"
+                        logger.error(error_msg)
+                        result.errors.append(error_msg)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            with state:
+                state.wait_for(lambda: not emitting)
+
+        # Keep the output order stable regardless of completion order
+        all_jobs = []
+        for scraper in self.scrapers:
+            all_jobs.extend(jobs_by_source.get(scraper.name, []))
+        return all_jobs
 
-        # Find most recent jobs file
-        json_files = sorted(self.data_dir.glob("jobs_*.json"), reverse=True)
-        if not json_files:
-            return existing_jobs
+    def _commit_progress(self):
+        """Persist the per-source progress of this run: watermarks and kept HTTP cache entries."""
+        if self.watermarks is not None:
+            self.watermarks.commit()
+        if self.http_cache is not None:
+            self.http_cache.commit()
 
+    def _load_existing_jobs(self) -> List[Job]:
+        """Load existing jobs from the job store."""
         try:
-            with open(json_files[0], 'r') as f:
-                data = json.load(f)
-                existing_jobs = [Job(**job_data) for job_data in data]
+            if self.job_store.exists():
+                existing_jobs = self.job_store.load()
+            else:
+                existing_jobs = self._import_legacy_jobs()
             logger.info(f"Loaded {len(existing_jobs)} existing jobs")
+            return existing_jobs
         except Exception as e:
             logger.error(f"Error loading existing jobs: {e}")
+            return []
 
-        return existing_jobs
+    def _import_legacy_jobs(self) -> List[Job]:
+        """Move history saved as JSON files by earlier versions into the job store."""
+        # jobs_latest.json sorts first and holds the full history
+        json_files = sorted(self.data_dir.glob("jobs_*.json"), reverse=True)
+        if not json_files:
+            return []
+        with open(json_files[0], 'rb') as f:
+            jobs = load_jobs(f.read())
+        self.job_store.append(jobs)
+        logger.info(f"Imported {len(jobs)} jobs from {json_files[0].name} into {self.job_store.path.name}")
+        return jobs
 
     def _merge_with_existing(self, new_jobs: List[Job], existing_jobs: List[Job]) -> List[Job]:
-        """Merge new jobs with existing, avoiding duplicates."""
-        existing_urls = {str(job.url) for job in existing_jobs}
-
-        # Add new jobs that don't exist
-        for job in new_jobs:
-            if str(job.url) not in existing_urls:
-                existing_jobs.append(job)
+        """Merge new jobs with existing, avoiding duplicates by job ID."""
+        # Existing jobs win; history saved before IDs were derived from
+        # canonical URLs may itself contain duplicates, which are dropped too
+        merged: Dict[str, Job] = {}
+        for job in existing_jobs + new_jobs:
+            merged.setdefault(job.id, job)
+        jobs = list(merged.values())
 
         # Sort by scraped date
-        existing_jobs.sort(key=lambda x: x.scraped_at, reverse=True)
+        jobs.sort(key=lambda x: x.scraped_at, reverse=True)
+
+        return jobs
+
+    def _save_jobs(self, jobs: List[Job], new_jobs: List[Job], run_id: str, rescored: Sequence[Job] = ()):
+        """
+        Append new and changed jobs to the job store and write the output files.
+
+        The per-run files hold only this run's jobs. The ``jobs_latest.*``
+        views of all jobs are rewritten only when the store changed.
+        Stored jobs in ``rescored`` are appended whatever their new score,
+        so they are not scored again.
+        """
+        # Existing jobs win the merge, so only new jobs that made it in, and
+        # rescored ones, can differ from what is stored
+        merged = {id(job) for job in jobs}
+        appended = self.job_store.append([job for job in new_jobs if id(job) in merged] + list(rescored))
+        logger.info(f"Appended {appended} jobs to {self.job_store.path}")
+        if self.job_store.needs_compaction(settings.job_store_compact_ratio):
+            self.job_store.compact()
 
-        return existing_jobs
-
-    def _save_jobs(self, jobs: List[Job], run_id: str):
-        """Save jobs to configured output formats."""
-        # Save as JSON
         if "json" in settings.output_formats:
             json_file = self.data_dir / f"jobs_{run_id}.json"
-            with open(json_file, 'w') as f:
-                json.dump(
-                    [job.model_dump(mode='json') for job in jobs],
-                    f,
-                    indent=2,
-                    default=str
-                )
+            json_file.write_bytes(dump_jobs(new_jobs))
             logger.info(f"Saved jobs to {json_file}")
 
-            # Also save to a 'latest' file for easy access
             latest_file = self.data_dir / "jobs_latest.json"
-            with open(latest_file, 'w') as f:
-                json.dump(
-                    [job.model_dump(mode='json') for job in jobs],
-                    f,
-                    indent=2,
-                    default=str
-                )
-
-        # Save as CSV
+            if appended or not latest_file.exists():
+                self.job_store.write_json_view(latest_file, [job.id for job in jobs])
+
         if "csv" in settings.output_formats:
             csv_file = self.data_dir / f"jobs_{run_id}.csv"
-            with open(csv_file, 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=[
-                    'title', 'company', 'url', 'location', 'is_remote',
-                    'relevance_score', 'llm_analysis', 'posted_date', 'scraped_at'
-                ])
-                writer.writeheader()
-                for job in jobs:
-                    writer.writerow({
-                        'title': job.title,
-                        'company': job.company,
-                        'url': str(job.url),
-                        'location': job.location,
-                        'is_remote': job.is_remote,
-                        'relevance_score': job.relevance_score,
-                        'llm_analysis': job.llm_analysis,
-                        'posted_date': job.posted_date,
-                        'scraped_at': job.scraped_at,
-                    })
+            self._write_csv(csv_file, new_jobs)
             logger.info(f"Saved jobs to {csv_file}")
 
-            # Also save to a 'latest' file
             latest_csv = self.data_dir / "jobs_latest.csv"
-            with open(latest_csv, 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=[
-                    'title', 'company', 'url', 'location', 'is_remote',
-                    'relevance_score', 'llm_analysis', 'posted_date', 'scraped_at'
-                ])
-                writer.writeheader()
-                for job in jobs:
-                    writer.writerow({
-                        'title': job.title,
-                        'company': job.company,
-                        'url': str(job.url),
-                        'location': job.location,
-                        'is_remote': job.is_remote,
-                        'relevance_score': job.relevance_score,
-                        'llm_analysis': job.llm_analysis,
-                        'posted_date': job.posted_date,
-                        'scraped_at': job.scraped_at,
-                    })
+            if appended or not latest_csv.exists():
+                self._write_csv(latest_csv, jobs)
+
+    def _write_csv(self, path: Path, jobs: List[Job]):
+        """Write the main fields of jobs as CSV."""
+        with open(path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=[
+                'title', 'company', 'url', 'location', 'is_remote',
+                'relevance_score', 'llm_analysis', 'posted_date', 'scraped_at'
+            ])
+            writer.writeheader()
+            for job in jobs:
+                writer.writerow({
+                    'title': job.title,
+                    'company': job.company,
+                    'url': str(job.url),
+                    'location': job.location,
+                    'is_remote': job.is_remote,
+                    'relevance_score': job.relevance_score,
+                    'llm_analysis': job.llm_analysis,
+                    'posted_date': job.posted_date,
+                    'scraped_at': job.scraped_at,
+                })
 
     def _save_result(self, result: ScrapingResult):
         """Save scraping result metadata."""
@@ -1,9 +1,12 @@
 """Base scraper class and utilities."""
 import logging
-from abc import ABC, abstractmethod
-from typing import List
+from abc import ABC
+from typing import Dict, Generator, List, Optional
 
+from jobminer.companies import get_company_matcher
 from jobminer.models import Job
+from jobminer.scrapers.http_client import HttpClient, get_http_client
+from jobminer.watermarks import WatermarkStore, WatermarkTracker
 
 logger = logging.getLogger(__name__)
 
@@ -14,8 +17,14 @@ class BaseScraper(ABC):
     def __init__(self, name: str):
         self.name = name
         self.jobs: List[Job] = []
+        # Set by the orchestrator to enable incremental scraping
+        self.watermarks: Optional[WatermarkStore] = None
+
+    @property
+    def http(self) -> HttpClient:
+        """Shared pooled HTTP client."""
+        return get_http_client()
 
-    @abstractmethod
     def scrape(self, keywords: List[str], max_jobs: int = 50) -> List[Job]:
         """
         Scrape jobs from the source.
@@ -27,28 +36,65 @@ class BaseScraper(ABC):
         Returns:
             List of Job objects
         """
-        pass
+        return list(self.iter_jobs(keywords, max_jobs))
+
+    def iter_jobs(self, keywords: List[str], max_jobs: int = 50) -> Generator[Job, None, None]:
+        """
+        Scrape jobs from the source, yielding each one as soon as it is ready.
+
+        Subclasses implement this or ``scrape`` (or both). Consumers may stop
+        iterating early; the generator is then closed and should release any
+        open connections.
+
+        Args:
+            keywords: List of job title keywords to search for
+            max_jobs: Maximum number of jobs to yield
+
+        Yields:
+            Job objects
+        """
+        if type(self).scrape is BaseScraper.scrape:
+            raise NotImplementedError(f"{type(self).__name__} must implement scrape or iter_jobs")
+        yield from self.scrape(keywords, max_jobs)
+
+    def watermark_tracker(self, key: str) -> WatermarkTracker:
+        """Start tracking a source; without a store every listing counts as new."""
+        if self.watermarks is None:
+            return WatermarkTracker()
+        return self.watermarks.tracker(key)
+
+    def stage_watermark(self, key: str, tracker: WatermarkTracker):
+        """Record a source's progress, to be committed once the run is saved."""
+        if self.watermarks is not None:
+            self.watermarks.stage(key, tracker)
+
+    def finish_scan(self, key: str, tracker: WatermarkTracker, url: str,
+                    params: Optional[Dict[str, str]] = None):
+        """
+        Stage a source's progress after scanning the response of ``url``.
+
+        The response is kept in the HTTP cache only if every listing was
+        considered: a 304 next run must not hide listings never looked at.
+        """
+        if tracker.completed:
+            self.http.keep_cached(url, params)
+        self.stage_watermark(key, tracker)
 
     def filter_remote(self, jobs: List[Job]) -> List[Job]:
         """Filter for remote jobs only."""
         return [job for job in jobs if job.is_remote]
 
     def filter_by_company(self, jobs: List[Job], company_names: List[str]) -> List[Job]:
-        """Filter jobs from specific companies."""
-        company_names_lower = [name.lower() for name in company_names]
-        filtered = []
-        for job in jobs:
-            if any(company.lower() in job.company.lower() for company in company_names_lower):
-                filtered.append(job)
-        return filtered
+        """Filter jobs from specific companies, matching company names fuzzily."""
+        matcher = get_company_matcher(company_names)
+        return [job for job in jobs if matcher.match(job.company) is not None]
 
     def deduplicate(self, jobs: List[Job]) -> List[Job]:
-        """Remove duplicate jobs based on URL."""
-        seen_urls = set()
+        """Remove duplicate jobs based on their ID (the canonical URL)."""
+        seen_ids = set()
         unique_jobs = []
         for job in jobs:
-            url_str = str(job.url)
-            if url_str not in seen_urls:
-                seen_urls.add(url_str)
+            if job.id not in seen_ids:
+                seen_ids.add(job.id)
                 unique_jobs.append(job)
         return unique_jobs
@@ -0,0 +1,200 @@
+"""On-disk conditional-request cache (ETag / Last-Modified) for scraper responses."""
+import hashlib
+import json
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    """Validators and bookkeeping for one cached URL."""
+    url: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    content_type: Optional[str] = None
+    content_length: int = 0  # Size of the full body as last downloaded
+    stored_bytes: int = 0  # Size of the body kept on disk (0 if validators only)
+    last_access: float = 0.0
+
+
+class HttpCache:
+    """
+    LRU-evicted cache of response validators and bodies.
+
+    Entries are keyed by URL and kept in ``index.json`` next to the body
+    files. The index carries a fingerprint of the scraping configuration;
+    when it changes (e.g. new target roles) the cache is discarded, since
+    a "not modified" page would otherwise hide listings that now match.
+
+    Responses are stored in two steps, like watermarks: ``store`` stages
+    them, and ``commit`` writes those marked with ``keep``, which scrapers
+    do once every listing of a response was processed. A 304 for a page
+    whose listings were only partly processed, or never saved, would
+    otherwise hide the rest for good.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int, fingerprint: str = ""):
+        self.directory = Path(directory)
+        self.bodies_dir = self.directory / "bodies"
+        self.bodies_dir.mkdir(parents=True, exist_ok=True)
+        self.index_file = self.directory / "index.json"
+        self.max_bytes = max_bytes
+        self.fingerprint = fingerprint
+        self._lock = threading.Lock()
+        self._entries: Dict[str, CacheEntry] = {}
+        # Staged responses: key -> (entry, body), or None to remove the entry
+        self._staged: Dict[str, Optional[Tuple[CacheEntry, Optional[bytes]]]] = {}
+        self._kept: Dict[str, Optional[Tuple[CacheEntry, Optional[bytes]]]] = {}
+        self._load()
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _body_path(self, key: str) -> Path:
+        return self.bodies_dir / f"{key}.bin"
+
+    def _load(self):
+        if not self.index_file.exists():
+            return
+        try:
+            with open(self.index_file, "r") as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable HTTP cache index: {e}")
+            return
+
+        if data.get("fingerprint") != self.fingerprint:
+            logger.info("Scraping configuration changed; discarding HTTP cache")
+            self.clear()
+            return
+        self._entries = {key: CacheEntry(**entry) for key, entry in data.get("entries", {}).items()}
+
+    def _save(self):
+        tmp_file = self.index_file.with_suffix(".tmp")
+        with open(tmp_file, "w") as f:
+            json.dump({
+                "fingerprint": self.fingerprint,
+                "entries": {key: asdict(entry) for key, entry in self._entries.items()},
+            }, f)
+        tmp_file.replace(self.index_file)
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Request headers that let the server answer 304 Not Modified."""
+        with self._lock:
+            entry = self._entries.get(self._key(url))
+        headers = {}
+        if entry:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def lookup(self, url: str) -> Optional[CacheEntry]:
+        """Get an entry and mark it as recently used; the index is written by the next ``commit``."""
+        with self._lock:
+            entry = self._entries.get(self._key(url))
+            if entry:
+                entry.last_access = time.time()
+            return entry
+
+    def read_body(self, url: str) -> Optional[bytes]:
+        """Stored body for a URL, if one was kept."""
+        path = self._body_path(self._key(url))
+        try:
+            return path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def store(self, url: str, headers, body: Optional[bytes], content_length: Optional[int] = None):
+        """
+        Stage a response's validators and (optionally) its body.
+
+        Responses without an ETag or Last-Modified header cannot be
+        revalidated; their entry is removed instead once kept and committed.
+        """
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        key = self._key(url)
+
+        with self._lock:
+            if not etag and not last_modified:
+                self._staged[key] = None
+                return
+
+            if body is not None and len(body) > self.max_bytes:
+                body = None
+            entry = CacheEntry(
+                url=url,
+                etag=etag,
+                last_modified=last_modified,
+                content_type=headers.get("Content-Type"),
+                content_length=content_length if content_length is not None else len(body or b""),
+                stored_bytes=len(body) if body is not None else 0,
+                last_access=time.time(),
+            )
+            self._staged[key] = (entry, body)
+
+    def keep(self, url: str):
+        """Mark the response staged for a URL to be written by the next commit."""
+        key = self._key(url)
+        with self._lock:
+            if key in self._staged:
+                self._kept[key] = self._staged.pop(key)
+
+    def commit(self):
+        """Write the kept responses and drop the other staged ones."""
+        with self._lock:
+            for key, staged in self._kept.items():
+                if staged is None:
+                    self._remove(key)
+                    continue
+                entry, body = staged
+                body_path = self._body_path(key)
+                if body is not None:
+                    body_path.write_bytes(body)
+                else:
+                    body_path.unlink(missing_ok=True)
+                self._entries[key] = entry
+            self._staged = {}
+            self._kept = {}
+            self._evict()
+            self._save()
+
+    def clear(self):
+        """Remove every entry and body."""
+        with self._lock:
+            for path in self.bodies_dir.glob("*.bin"):
+                path.unlink(missing_ok=True)
+            self._entries = {}
+            self._save()
+
+    @property
+    def size_bytes(self) -> int:
+        """Total bytes of bodies kept on disk."""
+        return sum(entry.stored_bytes for entry in self._entries.values())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str):
+        self._entries.pop(key, None)
+        self._body_path(key).unlink(missing_ok=True)
+
+    def _evict(self):
+        """Drop least recently used entries until the size cap is met."""
+        total = self.size_bytes
+        if total <= self.max_bytes:
+            return
+        for key, entry in sorted(self._entries.items(), key=lambda item: item[1].last_access):
+            if total <= self.max_bytes:
+                break
+            total -= entry.stored_bytes
+            self._remove(key)
@@ -0,0 +1,332 @@
+"""Shared pooled HTTP client used by all scrapers."""
+import importlib.util
+import logging
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Deque, Dict, Iterator, Optional
+
+import httpx
+
+from jobminer.config import settings
+from jobminer.models import HttpStats
+from jobminer.scrapers.http_cache import HttpCache
+from jobminer.scrapers.ratelimit import HostRateLimiter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+    'Accept-Encoding': 'gzip, deflate',
+}
+
+# Responses worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Set on responses served from the cache after a 304 revalidation
+NOT_MODIFIED = "jobminer_not_modified"
+
+
+@dataclass
+class RequestRecord:
+    """Accounting for a single logical request (including its retries)."""
+    url: str
+    status: Optional[int]
+    attempts: int
+    bytes_received: int
+    latency_ms: float
+
+
+class RequestStats:
+    """Thread-safe accumulator of per-request byte and latency figures."""
+
+    def __init__(self, max_records: int = 1000):
+        self._lock = threading.Lock()
+        self._max_records = max_records
+        self.reset()
+
+    def reset(self):
+        """Clear all counters, e.g. at the start of a run."""
+        with self._lock:
+            self.records: Deque[RequestRecord] = deque(maxlen=self._max_records)
+            self._totals = HttpStats()
+
+    def record(self, record: RequestRecord, failed: bool = False):
+        """Add one finished request."""
+        with self._lock:
+            self.records.append(record)
+            totals = self._totals
+            totals.requests += 1
+            totals.retries += record.attempts - 1
+            totals.failures += int(failed)
+            totals.bytes_received += record.bytes_received
+            totals.total_latency_ms += record.latency_ms
+            totals.max_latency_ms = max(totals.max_latency_ms, record.latency_ms)
+
+    def record_cache(self, hit: bool, bytes_saved: int = 0):
+        """Count a conditional-request cache lookup."""
+        with self._lock:
+            if hit:
+                self._totals.cache_hits += 1
+                self._totals.cache_bytes_saved += bytes_saved
+            else:
+                self._totals.cache_misses += 1
+
+    def snapshot(self) -> HttpStats:
+        """Copy of the current totals."""
+        with self._lock:
+            return self._totals.model_copy()
+
+
+class HttpClient:
+    """
+    Pooled keep-alive HTTP client with retries and request accounting.
+
+    Wraps a single ``httpx.Client`` so every scraper shares one connection
+    pool. Requests that fail with a transport error or a retryable status are
+    retried with jittered exponential backoff, honouring ``Retry-After``.
+    """
+
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        backoff_base: Optional[float] = None,
+        backoff_max: Optional[float] = None,
+        max_connections: Optional[int] = None,
+        http2: Optional[bool] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+        cache: Optional[HttpCache] = None,
+    ):
+        self.max_retries = settings.http_max_retries if max_retries is None else max_retries
+        self.backoff_base = settings.http_backoff_base if backoff_base is None else backoff_base
+        self.backoff_max = settings.http_backoff_max if backoff_max is None else backoff_max
+        self.stats = RequestStats()
+        self.cache = cache
+
+        http2 = settings.http2 if http2 is None else http2
+        if http2 and not _h2_available():
+            logger.info("HTTP/2 requested but the 'h2' package is not installed; using HTTP/1.1")
+            http2 = False
+
+        max_connections = max_connections or settings.http_max_connections
+        self.client = httpx.Client(
+            headers=DEFAULT_HEADERS,
+            timeout=timeout or settings.http_timeout_seconds,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            http2=http2,
+            follow_redirects=True,
+            transport=transport,
+        )
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None, use_cache: bool = True,
+            rate_limiter: Optional[HostRateLimiter] = None, **kwargs) -> httpx.Response:
+        """
+        Send a GET request, retrying transient failures.
+
+        When a cache is configured the request is made conditional. If the
+        server answers 304, the cached body is returned as a 200 response
+        flagged so that ``is_not_modified(response)`` is true, letting the
+        caller skip parsing. A 200 response is staged in the cache; callers
+        ``keep_cached`` it once all its listings were processed. The final
+        response is returned even if its status is an error, so callers keep
+        using ``response.raise_for_status()``. With a ``rate_limiter``, every
+        attempt, retries included, waits for a slot on the URL's host.
+        """
+        if self.cache is None or not use_cache:
+            return self.request("GET", url, headers=headers, rate_limiter=rate_limiter, **kwargs)
+
+        cache_url = str(httpx.URL(url, params=kwargs.get("params")))
+        headers = {**self.cache.conditional_headers(cache_url), **(headers or {})}
+        response = self.request("GET", url, headers=headers, rate_limiter=rate_limiter, **kwargs)
+
+        if response.status_code == 304:
+            entry = self.cache.lookup(cache_url)
+            self.stats.record_cache(hit=True, bytes_saved=entry.content_length if entry else 0)
+            return httpx.Response(
+                200,
+                headers={"Content-Type": entry.content_type} if entry and entry.content_type else None,
+                content=self.cache.read_body(cache_url) or b"",
+                request=response.request,
+                extensions={NOT_MODIFIED: True},
+            )
+
+        self.stats.record_cache(hit=False)
+        if response.status_code == 200:
+            self.cache.store(cache_url, response.headers, response.content)
+        return response
+
+    def request(self, method: str, url: str, rate_limiter: Optional[HostRateLimiter] = None,
+                **kwargs) -> httpx.Response:
+        """Send a request, retrying transient failures."""
+        start = time.perf_counter()
+        response, attempts, received = self._send(method, url, start, stream=False,
+                                                  rate_limiter=rate_limiter, **kwargs)
+        # Wire bytes when the body was streamed from the network
+        received += response.num_bytes_downloaded or len(response.content)
+        self._record(method, url, response.status_code, attempts, received, start,
+                     failed=response.status_code >= 400)
+        return response
+
+    @contextmanager
+    def stream(self, url: str, headers: Optional[Dict[str, str]] = None, use_cache: bool = True,
+               **kwargs) -> Iterator[httpx.Response]:
+        """
+        Open a streaming GET request; the body is read by the caller.
+
+        Retries happen before any body bytes are handed out. With a cache,
+        the request is conditional like ``get``; a 304 yields an empty
+        response flagged by ``is_not_modified``. Only validators are cached
+        for streamed bodies, and only if the caller finished without error;
+        like with ``get``, they are staged until ``keep_cached``.
+        """
+        cache = self.cache if use_cache else None
+        cache_url = str(httpx.URL(url, params=kwargs.get("params")))
+        if cache is not None:
+            headers = {**cache.conditional_headers(cache_url), **(headers or {})}
+
+        start = time.perf_counter()
+        response, attempts, received = self._send("GET", url, start, stream=True, headers=headers, **kwargs)
+        try:
+            if cache is not None and response.status_code == 304:
+                entry = cache.lookup(cache_url)
+                self.stats.record_cache(hit=True, bytes_saved=entry.content_length if entry else 0)
+                yield httpx.Response(200, request=response.request, extensions={NOT_MODIFIED: True})
+                return
+
+            if cache is not None:
+                self.stats.record_cache(hit=False)
+            yield response
+
+            if cache is not None and response.status_code == 200:
+                length = response.num_bytes_downloaded if response.is_stream_consumed else 0
+                cache.store(cache_url, response.headers, None,
+                            content_length=length or int(response.headers.get("Content-Length", 0)))
+        finally:
+            response.close()
+            self._record("GET", url, response.status_code, attempts,
+                         received + response.num_bytes_downloaded, start,
+                         failed=response.status_code >= 400)
+
+    def keep_cached(self, url: str, params: Optional[Dict[str, str]] = None):
+        """
+        Keep the response cached for a URL in this run.
+
+        Scrapers call this once every listing of the response was processed;
+        kept responses are written when the run's progress is committed.
+        """
+        if self.cache is not None:
+            self.cache.keep(str(httpx.URL(url, params=params)))
+
+    def _send(self, method: str, url: str, start: float, stream: bool,
+              rate_limiter: Optional[HostRateLimiter] = None, **kwargs):
+        """
+        Send with retries, taking a ``rate_limiter`` slot for each attempt.
+
+        Returns:
+            Tuple of (final response, attempts made, bytes received by
+            discarded attempts)
+        """
+        received = 0
+        attempt = 0
+
+        while True:
+            attempt += 1
+            if rate_limiter is not None:
+                rate_limiter.acquire(url)
+            try:
+                request = self.client.build_request(method, url, **kwargs)
+                response = self.client.send(request, stream=stream)
+            except httpx.TransportError as e:
+                if attempt > self.max_retries:
+                    self._record(method, url, None, attempt, received, start, failed=True)
+                    raise
+                delay = self._backoff(attempt)
+                logger.warning(f"{method} {url} failed ({e}); retrying in {delay:.1f}s")
+                time.sleep(delay)
+                continue
+
+            if response.status_code not in RETRY_STATUSES or attempt > self.max_retries:
+                return response, attempt, received
+
+            received += response.num_bytes_downloaded
+            retry_after = _retry_after(response)
+            delay = min(self._backoff(attempt) if retry_after is None else retry_after, self.backoff_max)
+            logger.warning(f"{method} {url} returned {response.status_code}; retrying in {delay:.1f}s")
+            response.close()
+            time.sleep(delay)
+
+    def close(self):
+        """Close all pooled connections."""
+        self.client.close()
+
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the given attempt number."""
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    def _record(self, method: str, url: str, status: Optional[int], attempts: int, received: int,
+                start: float, failed: bool):
+        latency_ms = (time.perf_counter() - start) * 1000
+        self.stats.record(RequestRecord(url, status, attempts, received, latency_ms), failed=failed)
+        logger.debug(f"{method} {url} -> {status} ({received} bytes, {latency_ms:.0f}ms, {attempts} attempts)")
+
+
+def is_not_modified(response: httpx.Response) -> bool:
+    """Whether a response was revalidated from the cache (server sent 304)."""
+    return bool(response.extensions.get(NOT_MODIFIED))
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _h2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """
+    Get the process-wide shared HTTP client.
+
+    It has no cache of its own; the orchestrator attaches one kept in its
+    data directory for the duration of a run.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient()
+        return _client
+
+
+def set_http_client(client: Optional[HttpClient]):
+    """Replace the shared HTTP client (mainly for tests)."""
+    global _client
+    with _client_lock:
+        _client = client
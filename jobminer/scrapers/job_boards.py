@@ -1,20 +1,25 @@
 """Scraper for public job boards using APIs and web scraping."""
+import html
 import logging
-import time
-from typing import List
-from urllib.parse import quote_plus
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, Generator, List, Optional, Tuple
 
-import requests
-from bs4 import BeautifulSoup
-
-from jobminer.companies import (get_company_info, get_company_names,
-                                is_established_company)
+from jobminer.companies import get_ats_companies, get_company_info
 from jobminer.config import settings
 from jobminer.models import Job
+from jobminer.roles import get_role_matcher
 from jobminer.scrapers.base import BaseScraper
+from jobminer.scrapers.http_client import is_not_modified
+from jobminer.scrapers.parsing import iter_json_array, parse_listings
+from jobminer.scrapers.ratelimit import HostRateLimiter
+from jobminer.watermarks import WatermarkTracker
 
 logger = logging.getLogger(__name__)
 
+STREAM_CHUNK_SIZE = 64 * 1024
+
 
 class RemoteOKScraper(BaseScraper):
     """Scraper for RemoteOK (free, no API key needed)."""
@@ -23,64 +28,84 @@ class RemoteOKScraper(BaseScraper):
         super().__init__("RemoteOK")
         self.base_url = "https://remoteok.com/api"
 
-    def scrape(self, keywords: List[str], max_jobs: int = 50) -> List[Job]:
-        """Scrape jobs from RemoteOK API."""
-        jobs = []
+    def iter_jobs(self, keywords: List[str], max_jobs: int = 50) -> Generator[Job, None, None]:
+        """Scrape jobs from RemoteOK API, yielding each match as soon as it is parsed."""
+        count = 0
+        examined = 0
+        roles = get_role_matcher(keywords)
+        tracker = self.watermark_tracker(self.name)
 
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-            }
-
-            response = requests.get(self.base_url, headers=headers, timeout=10)
-            response.raise_for_status()
-
-            data = response.json()
-            # First item is metadata, skip it
-            job_listings = data[1:] if len(data) > 1 else []
-
-            company_names = get_company_names()
-
-            for listing in job_listings[:max_jobs * 3]:  # Get extra to filter
-                try:
-                    company = listing.get('company', '')
-                    position = listing.get('position', '')
+            # Stream the feed so we can stop as soon as enough listings were seen
+            with self.http.stream(self.base_url) as response:
+                response.raise_for_status()
+                if is_not_modified(response):
+                    logger.info("RemoteOK: Feed unchanged since last run, skipping")
+                    return
+
+                listings = iter_json_array(response.iter_bytes(chunk_size=STREAM_CHUNK_SIZE))
+                # First item is metadata, skip it
+                next(listings, None)
+
+                for listing in listings:
+                    if examined >= max_jobs * 3:  # Get extra to filter
+                        break
 
-                    # Check if it's an established company
-                    if not is_established_company(company):
+                    # Ids grow over time; zero-pad so they compare as strings
+                    listing_id = str(listing.get('id', ''))
+                    if not tracker.is_new(listing_id, listing_id.zfill(12)):
+                        if tracker.consecutive_known >= settings.watermark_stop_after:
+                            # Reached listings processed by earlier runs
+                            tracker.complete()
+                            break
                         continue
-
-                    # Check if position matches keywords
-                    position_lower = position.lower()
-                    if not any(keyword.lower() in position_lower for keyword in keywords):
+                    examined += 1
+
+                    try:
+                        company = listing.get('company', '')
+                        position = listing.get('position', '')
+
+                        # Check if it's an established company
+                        company_info = get_company_info(company)
+                        if company_info is None:
+                            continue
+
+                        # Check if position matches a target role
+                        matched_role = roles.match(position)
+                        if matched_role is None:
+                            continue
+
+                        job = Job(
+                            title=position,
+                            matched_role=matched_role,
+                            company=company,
+                            company_info=company_info,
+                            url=f"https://remoteok.com/remote-jobs/{listing.get('id', '')}",
+                            location=listing.get('location') or 'Remote',
+                            is_remote=True,
+                            description=listing.get('description', ''),
+                            posted_date=None,
+                            salary_range=_salary_range(listing.get('salary_min'), listing.get('salary_max'))
+                        )
+                        count += 1
+                        yield job
+
+                        if count >= max_jobs:
+                            break
+
+                    except Exception as e:
+                        logger.error(f"Error parsing RemoteOK job: {e}")
                         continue
+                else:
+                    tracker.complete()
 
-                    job = Job(
-                        title=position,
-                        company=company,
-                        company_info=get_company_info(company),
-                        url=f"https://remoteok.com/remote-jobs/{listing.get('id', '')}",
-                        location=listing.get('location', 'Remote'),
-                        is_remote=True,
-                        description=listing.get('description', ''),
-                        posted_date=None,
-                        salary_range=listing.get('salary_min', '')
-                    )
-                    jobs.append(job)
-
-                    if len(jobs) >= max_jobs:
-                        break
-
-                except Exception as e:
-                    logger.error(f"Error parsing RemoteOK job: {e}")
-                    continue
-
-            logger.info(f"RemoteOK: Scraped {len(jobs)} jobs")
+            logger.info(f"RemoteOK: Scraped {count} jobs")
 
         except Exception as e:
             logger.error(f"Error scraping RemoteOK: {e}")
 
-        return jobs
+        finally:
+            self.finish_scan(self.name, tracker, self.base_url)
 
 
 class WWRScraper(BaseScraper):
@@ -90,26 +115,28 @@ class WWRScraper(BaseScraper):
         super().__init__("WeWorkRemotely")
         self.base_url = "https://weworkremotely.com"
 
-    def scrape(self, keywords: List[str], max_jobs: int = 50) -> List[Job]:
-        """Scrape jobs from We Work Remotely."""
-        jobs = []
+    def iter_jobs(self, keywords: List[str], max_jobs: int = 50) -> Generator[Job, None, None]:
+        """Scrape jobs from We Work Remotely, yielding each match as soon as it is parsed."""
+        count = 0
+        examined = 0
+        roles = get_role_matcher(keywords)
+        tracker = self.watermark_tracker(self.name)
 
         try:
             # Search in programming category
             url = f"{self.base_url}/categories/remote-programming-jobs"
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-            }
-
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.http.get(url)
             response.raise_for_status()
+            if is_not_modified(response):
+                logger.info("WWR: Listings unchanged since last run, skipping")
+                return
 
-            soup = BeautifulSoup(response.content, 'html.parser')
-            listings = soup.find_all('li', class_='feature')
+            listings = parse_listings(response.content, 'li', 'feature')
 
-            company_names = get_company_names()
+            for listing in listings:
+                if examined >= max_jobs * 2:
+                    break
 
-            for listing in listings[:max_jobs * 2]:
                 try:
                     title_elem = listing.find('span', class_='title')
                     company_elem = listing.find('span', class_='company')
@@ -122,39 +149,50 @@ class WWRScraper(BaseScraper):
                     company = company_elem.text.strip()
                     job_url = self.base_url + link_elem['href']
 
+                    # Skip listings processed by earlier runs
+                    if not tracker.is_new(job_url):
+                        continue
+                    examined += 1
+
                     # Check if it's an established company
-                    if not is_established_company(company):
+                    company_info = get_company_info(company)
+                    if company_info is None:
                         continue
 
-                    # Check if position matches keywords
-                    title_lower = title.lower()
-                    if not any(keyword.lower() in title_lower for keyword in keywords):
+                    # Check if position matches a target role
+                    matched_role = roles.match(title)
+                    if matched_role is None:
                         continue
 
                     job = Job(
                         title=title,
+                        matched_role=matched_role,
                         company=company,
-                        company_info=get_company_info(company),
+                        company_info=company_info,
                         url=job_url,
                         location="Remote",
                         is_remote=True,
                         description=None
                     )
-                    jobs.append(job)
+                    count += 1
+                    yield job
 
-                    if len(jobs) >= max_jobs:
+                    if count >= max_jobs:
                         break
 
                 except Exception as e:
                     logger.error(f"Error parsing WWR job: {e}")
                     continue
+            else:
+                tracker.complete()
 
-            logger.info(f"WWR: Scraped {len(jobs)} jobs")
+            logger.info(f"WWR: Scraped {count} jobs")
 
         except Exception as e:
             logger.error(f"Error scraping WWR: {e}")
 
-        return jobs
+        finally:
+            self.finish_scan(self.name, tracker, url)
 
 
 class RemotiveScraper(BaseScraper):
@@ -164,25 +202,27 @@ class RemotiveScraper(BaseScraper):
         super().__init__("Remotive")
         self.base_url = "https://remotive.com"
 
-    def scrape(self, keywords: List[str], max_jobs: int = 50) -> List[Job]:
-        """Scrape jobs from Remotive."""
-        jobs = []
+    def iter_jobs(self, keywords: List[str], max_jobs: int = 50) -> Generator[Job, None, None]:
+        """Scrape jobs from Remotive, yielding each match as soon as it is parsed."""
+        count = 0
+        examined = 0
+        roles = get_role_matcher(keywords)
+        tracker = self.watermark_tracker(self.name)
 
         try:
             url = f"{self.base_url}/remote-jobs/software-dev"
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-            }
-
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.http.get(url)
             response.raise_for_status()
+            if is_not_modified(response):
+                logger.info("Remotive: Listings unchanged since last run, skipping")
+                return
 
-            soup = BeautifulSoup(response.content, 'html.parser')
-            listings = soup.find_all('li', class_='job-tile')
+            listings = parse_listings(response.content, 'li', 'job-tile')
 
-            company_names = get_company_names()
+            for listing in listings:
+                if examined >= max_jobs * 2:
+                    break
 
-            for listing in listings[:max_jobs * 2]:
                 try:
                     title_elem = listing.find('a', class_='job-tile-title')
                     company_elem = listing.find('span', class_='company')
@@ -192,197 +232,334 @@ class RemotiveScraper(BaseScraper):
 
                     title = title_elem.text.strip()
                     company = company_elem.text.strip()
-                    job_url = title_elem['href']
+                    job_url = str(title_elem['href'])
                     if not job_url.startswith('http'):
                         job_url = self.base_url + job_url
 
+                    # Skip listings processed by earlier runs
+                    if not tracker.is_new(job_url):
+                        continue
+                    examined += 1
+
                     # Check if it's an established company
-                    if not is_established_company(company):
+                    company_info = get_company_info(company)
+                    if company_info is None:
                         continue
 
-                    # Check if position matches keywords
-                    title_lower = title.lower()
-                    if not any(keyword.lower() in title_lower for keyword in keywords):
+                    # Check if position matches a target role
+                    matched_role = roles.match(title)
+                    if matched_role is None:
                         continue
 
                     job = Job(
                         title=title,
+                        matched_role=matched_role,
                         company=company,
-                        company_info=get_company_info(company),
+                        company_info=company_info,
                         url=job_url,
                         location="Remote",
                         is_remote=True,
                         description=None
                     )
-                    jobs.append(job)
+                    count += 1
+                    yield job
 
-                    if len(jobs) >= max_jobs:
+                    if count >= max_jobs:
                         break
 
                 except Exception as e:
                     logger.error(f"Error parsing Remotive job: {e}")
                     continue
+            else:
+                tracker.complete()
 
-            logger.info(f"Remotive: Scraped {len(jobs)} jobs")
+            logger.info(f"Remotive: Scraped {count} jobs")
 
         except Exception as e:
             logger.error(f"Error scraping Remotive: {e}")
 
-        return jobs
+        finally:
+            self.finish_scan(self.name, tracker, url)
+
+
+@dataclass
+class BoardScan:
+    """Jobs found on one ATS board and the watermark progress behind them."""
+    watermark_key: str
+    tracker: WatermarkTracker
+    url: str
+    params: Optional[Dict[str, str]] = None
+    jobs: List[Job] = field(default_factory=list)
+    listing_ids: List[str] = field(default_factory=list)  # Listing of each job
 
 
 class CompanyCareersPageScraper(BaseScraper):
     """Scraper for direct company career pages (Greenhouse, Lever, etc.)."""
 
+    # Boards worth checking for companies outside the curated database
+    EXTRA_GREENHOUSE_COMPANIES = ["Coinbase", "DoorDash", "Robinhood"]
+    EXTRA_LEVER_COMPANIES = ["Canva", "Figma", "Discord", "Notion"]
+
     def __init__(self):
         super().__init__("CompanyCareersPage")
-        self.greenhouse_companies = [
-            "Databricks", "Snowflake", "GitLab", "Stripe", "Coinbase",
-            "Spotify", "Airbnb", "DoorDash", "Robinhood"
-        ]
-        self.lever_companies = [
-            "Netflix", "Canva", "Figma", "Discord", "Notion"
-        ]
-
-    def scrape(self, keywords: List[str], max_jobs: int = 50) -> List[Job]:
-        """Scrape jobs from company career pages."""
-        jobs = []
-
-        # Scrape Greenhouse boards
-        for company in self.greenhouse_companies[:10]:
-            if len(jobs) >= max_jobs:
-                break
-
-            try:
-                jobs.extend(self._scrape_greenhouse(company, keywords, max_jobs // 10))
-                time.sleep(1)  # Be respectful
-            except Exception as e:
-                logger.error(f"Error scraping {company} Greenhouse: {e}")
-
-        # Scrape Lever boards
-        for company in self.lever_companies[:10]:
-            if len(jobs) >= max_jobs:
-                break
-
+        self.greenhouse_boards = self._build_boards("greenhouse", self.EXTRA_GREENHOUSE_COMPANIES)
+        self.lever_boards = self._build_boards("lever", self.EXTRA_LEVER_COMPANIES)
+        self.rate_limiter = HostRateLimiter(
+            rate=settings.ats_requests_per_second,
+            capacity=settings.ats_burst,
+        )
+
+    @staticmethod
+    def _build_boards(ats: str, extra_companies: List[str]) -> List[Tuple[str, str]]:
+        """Build (company, slug) pairs for every board hosted on an ATS."""
+        boards = [(company.name, company.ats_slug or _slugify(company.name))
+                  for company in get_ats_companies(ats)]
+        known = {name for name, _ in boards}
+        boards.extend((name, _slugify(name)) for name in extra_companies if name not in known)
+        return boards
+
+    def iter_jobs(self, keywords: List[str], max_jobs: int = 50) -> Generator[Job, None, None]:
+        """
+        Scrape jobs from company career pages, yielding each board as it completes.
+
+        A board's watermark is staged only for the jobs passed on: boards
+        left over once ``max_jobs`` is reached are dropped unstaged, and
+        listings of a partly passed-on board stay new for the next run.
+        """
+        per_board = max(1, max_jobs // 10)
+        tasks = [(self._scan_greenhouse, company, slug, "Greenhouse")
+                 for company, slug in self.greenhouse_boards]
+        tasks += [(self._scan_lever, company, slug, "Lever")
+                  for company, slug in self.lever_boards]
+
+        results: Dict[int, Optional[BoardScan]] = {}
+        next_board = 0
+        count = 0
+
+        # Boards are fetched concurrently; the per-host rate limiter keeps
+        # the request rate to each ATS within budget.
+        with ThreadPoolExecutor(max_workers=max(1, settings.ats_concurrency),
+                                thread_name_prefix="ats") as executor:
+            futures = {
+                executor.submit(fetch, company, keywords, per_board, slug): (i, company, ats)
+                for i, (fetch, company, slug, ats) in enumerate(tasks)
+            }
             try:
-                jobs.extend(self._scrape_lever(company, keywords, max_jobs // 10))
-                time.sleep(1)
-            except Exception as e:
-                logger.error(f"Error scraping {company} Lever: {e}")
-
-        logger.info(f"CompanyCareersPage: Scraped {len(jobs)} jobs")
-        return jobs[:max_jobs]
-
-    def _scrape_greenhouse(self, company: str, keywords: List[str], max_jobs: int) -> List[Job]:
-        """Scrape a Greenhouse job board."""
-        jobs = []
-        company_slug = company.lower().replace(' ', '-')
-        url = f"https://boards.greenhouse.io/{company_slug}"
+                for future in as_completed(futures):
+                    i, company, ats = futures[future]
+                    try:
+                        results[i] = future.result()
+                    except Exception as e:
+                        logger.error(f"Error scraping {company} {ats}: {e}")
+                        results[i] = None
+
+                    # Release finished boards in board order so output is stable
+                    while next_board in results:
+                        scan = results.pop(next_board)
+                        next_board += 1
+                        if scan is None:
+                            continue
+                        passed_on = 0
+                        try:
+                            for job in scan.jobs:
+                                passed_on += 1
+                                yield job
+                                count += 1
+                                if count >= max_jobs:
+                                    return
+                        finally:
+                            self._stage_scan(scan, passed_on)
+            finally:
+                for pending in futures:
+                    pending.cancel()
+                logger.info(f"CompanyCareersPage: Scraped {count} jobs")
+
+    def _stage_scan(self, scan: BoardScan, passed_on: int):
+        """Stage a board's watermark, keeping listings of jobs not passed on new."""
+        for listing_id in scan.listing_ids[passed_on:]:
+            scan.tracker.forget(listing_id)
+        self.finish_scan(scan.watermark_key, scan.tracker, scan.url, scan.params)
+
+    def _scrape_greenhouse(self, company: str, keywords: List[str], max_jobs: int,
+                           company_slug: Optional[str] = None) -> List[Job]:
+        """Scrape a Greenhouse job board through its public JSON API."""
+        scan = self._scan_greenhouse(company, keywords, max_jobs, company_slug)
+        self._stage_scan(scan, len(scan.jobs))
+        return scan.jobs
+
+    def _scan_greenhouse(self, company: str, keywords: List[str], max_jobs: int,
+                         company_slug: Optional[str] = None) -> BoardScan:
+        """Fetch a Greenhouse board's jobs without staging its watermark."""
+        company_slug = company_slug or _slugify(company)
+        url = f"https://boards-api.greenhouse.io/v1/boards/{company_slug}/jobs"
+        params = {"content": "true"} if settings.ats_include_content else None
+        watermark_key = f"greenhouse:{company_slug}"
+        scan = BoardScan(watermark_key, self.watermark_tracker(watermark_key), url, params)
+        jobs, tracker = scan.jobs, scan.tracker
 
         try:
-            headers = {'User-Agent': 'Mozilla/5.0'}
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.http.get(url, params=params, rate_limiter=self.rate_limiter)
             response.raise_for_status()
+            if is_not_modified(response):
+                logger.info(f"Greenhouse board for {company} unchanged since last run, skipping")
+                return scan
+
+            for listing in response.json().get("jobs", []):
+                # Skip postings not updated since an earlier run processed them
+                listing_id = str(listing.get("id"))
+                updated_at = _parse_datetime(listing.get("updated_at"))
+                updated_key = updated_at.astimezone(timezone.utc).isoformat() if updated_at else ""
+                if not tracker.is_new(listing_id, updated_key):
+                    continue
 
-            soup = BeautifulSoup(response.content, 'html.parser')
-            listings = soup.find_all('div', class_='opening')
-
-            for listing in listings[:max_jobs]:
                 try:
-                    title_elem = listing.find('a')
-                    location_elem = listing.find('span', class_='location')
-
-                    if not title_elem:
-                        continue
-
-                    title = title_elem.text.strip()
-                    location = location_elem.text.strip() if location_elem else "Unknown"
-                    job_url = title_elem['href']
-                    if not job_url.startswith('http'):
-                        job_url = f"https://boards.greenhouse.io{job_url}"
-
-                    # Check keywords
-                    title_lower = title.lower()
-                    if not any(keyword.lower() in title_lower for keyword in keywords):
-                        continue
-
-                    # Check if remote
-                    is_remote = 'remote' in location.lower()
-                    if settings.remote_only and not is_remote:
-                        continue
-
-                    job = Job(
-                        title=title,
-                        company=company,
-                        company_info=get_company_info(company),
-                        url=job_url,
-                        location=location,
-                        is_remote=is_remote
-                    )
-                    jobs.append(job)
+                    job = self._greenhouse_job(company, listing, keywords)
+                    if job:
+                        jobs.append(job)
+                        scan.listing_ids.append(listing_id)
+                        if len(jobs) >= max_jobs:
+                            break
 
                 except Exception as e:
                     logger.error(f"Error parsing Greenhouse listing: {e}")
+            else:
+                tracker.complete()
 
         except Exception as e:
             logger.error(f"Error fetching Greenhouse board for {company}: {e}")
 
-        return jobs
-
-    def _scrape_lever(self, company: str, keywords: List[str], max_jobs: int) -> List[Job]:
-        """Scrape a Lever job board."""
-        jobs = []
-        company_slug = company.lower().replace(' ', '-')
-        url = f"https://jobs.lever.co/{company_slug}"
+        return scan
+
+    def _greenhouse_job(self, company: str, listing: dict, keywords: List[str]) -> Optional[Job]:
+        """Map a Greenhouse API job to a Job, or None if it does not match."""
+        title = (listing.get("title") or "").strip()
+        location = ((listing.get("location") or {}).get("name") or "Unknown").strip()
+
+        # Check if the title matches a target role
+        matched_role = get_role_matcher(keywords).match(title)
+        if matched_role is None:
+            return None
+
+        # Check if remote
+        is_remote = 'remote' in location.lower()
+        if settings.remote_only and not is_remote:
+            return None
+
+        content = listing.get("content")
+        updated_at = _parse_datetime(listing.get("updated_at"))
+        return Job(
+            title=title,
+            matched_role=matched_role,
+            company=company,
+            company_info=get_company_info(company),
+            url=listing["absolute_url"],
+            location=location,
+            is_remote=is_remote,
+            description=html.unescape(content) if content else None,
+            posted_date=_parse_datetime(listing.get("first_published")) or updated_at,
+            updated_at=updated_at,
+        )
+
+    def _scrape_lever(self, company: str, keywords: List[str], max_jobs: int,
+                      company_slug: Optional[str] = None) -> List[Job]:
+        """Scrape a Lever job board through its public postings API."""
+        scan = self._scan_lever(company, keywords, max_jobs, company_slug)
+        self._stage_scan(scan, len(scan.jobs))
+        return scan.jobs
+
+    def _scan_lever(self, company: str, keywords: List[str], max_jobs: int,
+                    company_slug: Optional[str] = None) -> BoardScan:
+        """Fetch a Lever board's jobs without staging its watermark."""
+        company_slug = company_slug or _slugify(company)
+        url = f"https://api.lever.co/v0/postings/{company_slug}"
+        params = {"mode": "json"}
+        watermark_key = f"lever:{company_slug}"
+        scan = BoardScan(watermark_key, self.watermark_tracker(watermark_key), url, params)
+        jobs, tracker = scan.jobs, scan.tracker
 
         try:
-            headers = {'User-Agent': 'Mozilla/5.0'}
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.http.get(url, params=params, rate_limiter=self.rate_limiter)
             response.raise_for_status()
+            if is_not_modified(response):
+                logger.info(f"Lever board for {company} unchanged since last run, skipping")
+                return scan
+
+            for listing in response.json():
+                # Skip postings an earlier run already processed
+                listing_id = str(listing.get("id"))
+                if not tracker.is_new(listing_id):
+                    continue
 
-            soup = BeautifulSoup(response.content, 'html.parser')
-            listings = soup.find_all('div', class_='posting')
-
-            for listing in listings[:max_jobs]:
                 try:
-                    title_elem = listing.find('h5')
-                    location_elem = listing.find('span', class_='location')
-                    link_elem = listing.find('a', class_='posting-title')
-
-                    if not all([title_elem, link_elem]):
-                        continue
-
-                    title = title_elem.text.strip()
-                    location = location_elem.text.strip() if location_elem else "Unknown"
-                    job_url = link_elem['href']
-
-                    # Check keywords
-                    title_lower = title.lower()
-                    if not any(keyword.lower() in title_lower for keyword in keywords):
-                        continue
-
-                    # Check if remote
-                    is_remote = 'remote' in location.lower()
-                    if settings.remote_only and not is_remote:
-                        continue
-
-                    job = Job(
-                        title=title,
-                        company=company,
-                        company_info=get_company_info(company),
-                        url=job_url,
-                        location=location,
-                        is_remote=is_remote
-                    )
-                    jobs.append(job)
+                    job = self._lever_job(company, listing, keywords)
+                    if job:
+                        jobs.append(job)
+                        scan.listing_ids.append(listing_id)
+                        if len(jobs) >= max_jobs:
+                            break
 
                 except Exception as e:
                     logger.error(f"Error parsing Lever listing: {e}")
+            else:
+                tracker.complete()
 
         except Exception as e:
             logger.error(f"Error fetching Lever board for {company}: {e}")
 
-        return jobs
+        return scan
+
+    def _lever_job(self, company: str, listing: dict, keywords: List[str]) -> Optional[Job]:
+        """Map a Lever API posting to a Job, or None if it does not match."""
+        title = (listing.get("text") or "").strip()
+        location = ((listing.get("categories") or {}).get("location") or "Unknown").strip()
+
+        # Check if the title matches a target role
+        matched_role = get_role_matcher(keywords).match(title)
+        if matched_role is None:
+            return None
+
+        # Check if remote
+        is_remote = listing.get("workplaceType") == "remote" or 'remote' in location.lower()
+        if settings.remote_only and not is_remote:
+            return None
+
+        created_at = listing.get("createdAt")
+        posted_date = datetime.fromtimestamp(created_at / 1000, tz=timezone.utc) if created_at else None
+        return Job(
+            title=title,
+            matched_role=matched_role,
+            company=company,
+            company_info=get_company_info(company),
+            url=listing["hostedUrl"],
+            location=location,
+            is_remote=is_remote,
+            description=listing.get("descriptionPlain") if settings.ats_include_content else None,
+            posted_date=posted_date,
+        )
+
+
+def _slugify(company: str) -> str:
+    """Derive a default ATS board slug from a company name."""
+    return company.lower().replace(' ', '-')
+
+
+def _salary_range(salary_min, salary_max) -> Optional[str]:
+    """Format RemoteOK's numeric salary bounds (0 means not given)."""
+    if salary_min and salary_max:
+        return f"{salary_min}-{salary_max}"
+    if salary_min or salary_max:
+        return str(salary_min or salary_max)
+    return None
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO-8601 timestamp from an ATS API, tolerating bad values."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
 
 
 def get_all_scrapers() -> List[BaseScraper]:
@@ -0,0 +1,118 @@
+"""Shared HTML and JSON parsing helpers for the scrapers."""
+import codecs
+import json
+from typing import Any, Iterable, Iterator, List
+
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.element import Tag
+
+# lxml is a hard dependency and much faster than the pure-Python parser
+HTML_PARSER = "lxml"
+
+
+def parse_listings(markup: bytes | str, name: str, class_: str) -> List[Tag]:
+    """
+    Parse only the listing elements out of a page.
+
+    A ``SoupStrainer`` restricts tree building to ``<name class="class_">``
+    elements and their descendants, so the rest of the document (navigation,
+    scripts, footers) never becomes part of the tree.
+
+    Args:
+        markup: Raw page content
+        name: Tag name of a listing element (e.g. ``"li"``)
+        class_: CSS class identifying listing elements
+
+    Returns:
+        Matching elements in document order
+    """
+    strainer = SoupStrainer(name, class_=_has_class(class_))
+    soup = BeautifulSoup(markup, HTML_PARSER, parse_only=strainer)
+    return soup.find_all(name, class_=class_)
+
+
+def _has_class(class_: str):
+    """
+    Class matcher for strainers.
+
+    While the tree is being built the ``class`` attribute is still the raw
+    string (``"job-tile tw-flex"``), so it has to be split by hand.
+    """
+    def match(value) -> bool:
+        if value is None:
+            return False
+        classes = value.split() if isinstance(value, str) else value
+        return class_ in classes
+    return match
+
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",]"
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """
+    Decode a top-level JSON array incrementally, one element at a time.
+
+    Only the element currently being decoded is held in memory, so the
+    caller can stop early without downloading or decoding the rest of
+    the body.
+
+    Args:
+        chunks: UTF-8 encoded body chunks, e.g. ``response.iter_bytes()``
+
+    Yields:
+        Decoded array elements in order
+
+    Raises:
+        ValueError: If the body is not a JSON array
+    """
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    chunks = iter(chunks)
+    buffer = ""
+    pos = 0
+    started = False
+    exhausted = False
+
+    while True:
+        # Skip whitespace and separators between elements
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        if pos < len(buffer):
+            char = buffer[pos]
+            if not started:
+                if char != "[":
+                    raise ValueError("Expected a JSON array")
+                started = True
+                pos += 1
+                continue
+            if char == ",":
+                pos += 1
+                continue
+            if char == "]":
+                return
+
+            try:
+                value, end = _decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if exhausted:
+                    raise
+                value, end = None, None
+
+            # A number at the end of the buffer may continue in the next
+            # chunk ("3." + "5"), so only accept values followed by a delimiter
+            if end is not None and (exhausted or (end < len(buffer) and buffer[end] in _DELIMITERS)):
+                yield value
+                buffer = buffer[end:]
+                pos = 0
+                continue
+        elif exhausted:
+            raise ValueError("Unexpected end of JSON array")
+
+        chunk = next(chunks, None)
+        if chunk is None:
+            exhausted = True
+            buffer += utf8.decode(b"", final=True)
+        else:
+            buffer += utf8.decode(chunk)
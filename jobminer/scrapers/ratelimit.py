@@ -0,0 +1,89 @@
+"""Token-bucket rate limiting for polite concurrent scraping."""
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at a fixed rate."""
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take tokens if available without blocking."""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Block until tokens are available and take them.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class HostRateLimiter:
+    """One token bucket per host, created lazily on first use."""
+
+    def __init__(self, rate: float, capacity: float, overrides: Optional[Dict[str, tuple]] = None):
+        """
+        Args:
+            rate: Default requests per second for each host
+            capacity: Default burst size for each host
+            overrides: Optional mapping of host to (rate, capacity)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.overrides = overrides or {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket_for(self, url_or_host: str) -> TokenBucket:
+        """Get (or create) the bucket for a URL's host."""
+        host = urlsplit(url_or_host).hostname if "://" in url_or_host else url_or_host
+        host = (host or "").lower()
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                rate, capacity = self.overrides.get(host, (self.rate, self.capacity))
+                bucket = TokenBucket(rate, capacity)
+                self._buckets[host] = bucket
+            return bucket
+
+    def acquire(self, url_or_host: str) -> float:
+        """Wait for a request slot on the given host."""
+        return self.bucket_for(url_or_host).acquire()
@@ -0,0 +1,66 @@
+"""Canonical job URLs and the stable job IDs derived from them."""
+import hashlib
+import posixpath
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = {
+    "ref", "referrer", "source", "src", "via", "gclid", "fbclid", "msclkid",
+    "mc_cid", "mc_eid", "trk", "_hsenc", "_hsmi", "gh_src", "lever-source",
+    "lever-origin", "lever-via",
+}
+TRACKING_PREFIXES = ("utm_",)
+
+# IDs are 16 hex digits of a SHA-256; anything else is a legacy ID
+JOB_ID_LENGTH = 16
+_JOB_ID_RE = re.compile(rf"^[0-9a-f]{{{JOB_ID_LENGTH}}}$")
+
+
+def canonical_url(url: str) -> str:
+    """
+    Normalize a job URL so variants of the same posting compare equal.
+
+    Uses https, lowercases the host and drops "www." and default ports,
+    removes duplicate and trailing slashes, tracking parameters (utm_*,
+    ref, gclid, ...) and the fragment, and sorts the remaining query.
+    """
+    parts = urlsplit(str(url).strip())
+    scheme = parts.scheme.lower()
+    if scheme == "http":
+        scheme = "https"
+
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    netloc = host
+    if parts.port and parts.port not in (80, 443):
+        netloc = f"{host}:{parts.port}"
+
+    path = re.sub(r"/{2,}", "/", parts.path)
+    if path not in ("", "/"):
+        path = posixpath.normpath(path)
+    path = path.rstrip("/")
+
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+    return urlunsplit((scheme, netloc, path, urlencode(query), ""))
+
+
+def job_id(url: str) -> str:
+    """
+    Stable ID of a job posting: a hash of its canonical URL.
+
+    Every source's posting URL identifies the posting within that source
+    (the API sources embed their native posting id in it), so the same
+    posting gets the same ID on every run and on every board linking it.
+    """
+    digest = hashlib.sha256(canonical_url(url).encode("utf-8")).hexdigest()
+    return digest[:JOB_ID_LENGTH]
+
+
+def is_job_id(value: str) -> bool:
+    """Whether a value has the format of IDs made by ``job_id``."""
+    return bool(_JOB_ID_RE.match(value))
@@ -0,0 +1,149 @@
+"""Per-source incremental scraping watermarks."""
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+
+class Watermark(BaseModel):
+    """
+    How far a source has been processed.
+
+    ``high_water`` is the largest ordering value (e.g. a zero-padded posting
+    id or a UTC timestamp) below which everything has been processed.
+    ``seen`` holds listings processed since then, mapped to their ordering
+    value ("" for sources without one), so partial scans are not lost.
+    """
+    high_water: Optional[str] = None
+    seen: Dict[str, str] = Field(default_factory=dict)
+
+
+class WatermarkTracker:
+    """
+    Tracks one source during one run.
+
+    Scrapers call ``is_new`` for every listing before doing any work on it
+    and ``complete`` once they have looked at every listing the source
+    offered (or reached the already-processed region of an ordered feed).
+    Only a complete scan may raise the high-water mark; a partial scan just
+    adds what it processed to ``seen``.
+    """
+
+    def __init__(self, watermark: Optional[Watermark] = None):
+        self.previous = watermark or Watermark()
+        self.processed: Dict[str, str] = {}
+        self.present: Set[str] = set()
+        self.consecutive_known = 0
+        self.completed = False
+
+    def is_new(self, item_id: str, value: str = "") -> bool:
+        """Whether a listing still needs processing; new ones are recorded as processed."""
+        self.present.add(item_id)
+        previous = self.previous
+        if value and previous.high_water is not None and value <= previous.high_water:
+            # Below the mark: ordered feeds may stop after a run of these
+            self.consecutive_known += 1
+            return False
+        if item_id in previous.seen and previous.seen[item_id] == value:
+            return False
+
+        self.consecutive_known = 0
+        self.processed[item_id] = value
+        return True
+
+    def complete(self):
+        """Mark that every listing of the source was considered."""
+        self.completed = True
+
+    def forget(self, item_id: str):
+        """
+        Undo ``is_new`` for a listing whose job was not passed on.
+
+        The listing stays new for the next run, and the scan no longer
+        counts as complete.
+        """
+        self.processed.pop(item_id, None)
+        self.completed = False
+
+    def result(self) -> Watermark:
+        """Updated watermark reflecting this run."""
+        previous = self.previous
+        if not self.completed:
+            return Watermark(high_water=previous.high_water, seen={**previous.seen, **self.processed})
+
+        seen = {**previous.seen, **self.processed}
+        values = [value for value in seen.values() if value]
+        if previous.high_water:
+            values.append(previous.high_water)
+        if values:
+            # Ordered source: everything up to the newest value is done
+            return Watermark(high_water=max(values))
+        # Unordered source: keep only listings that are still published
+        return Watermark(seen={item_id: value for item_id, value in seen.items() if item_id in self.present})
+
+
+class WatermarkStore:
+    """
+    Watermarks for all sources, persisted as JSON.
+
+    Updates from a run are staged and only written by ``commit``, which the
+    orchestrator calls after the run's jobs were saved. The store carries a
+    fingerprint of the scraping configuration and starts over when it
+    changes, since listings skipped under the old settings might match now.
+    """
+
+    def __init__(self, path: Path, fingerprint: str = ""):
+        self.path = Path(path)
+        self.fingerprint = fingerprint
+        self._lock = threading.Lock()
+        self._watermarks: Dict[str, Watermark] = {}
+        self._staged: Dict[str, Watermark] = {}
+        self._load()
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable watermarks file: {e}")
+            return
+
+        if data.get("fingerprint") != self.fingerprint:
+            logger.info("Scraping configuration changed; starting watermarks over")
+            return
+        self._watermarks = {key: Watermark(**value) for key, value in data.get("sources", {}).items()}
+
+    def tracker(self, key: str) -> WatermarkTracker:
+        """Start tracking a source for the current run."""
+        with self._lock:
+            return WatermarkTracker(self._watermarks.get(key))
+
+    def stage(self, key: str, tracker: WatermarkTracker):
+        """Remember a source's progress until the next commit."""
+        with self._lock:
+            self._staged[key] = tracker.result()
+
+    def get(self, key: str) -> Optional[Watermark]:
+        """Committed watermark for a source."""
+        with self._lock:
+            return self._watermarks.get(key)
+
+    def commit(self):
+        """Apply staged progress and write the file."""
+        with self._lock:
+            self._watermarks.update(self._staged)
+            self._staged = {}
+            tmp_file = self.path.with_suffix(".tmp")
+            with open(tmp_file, "w") as f:
+                json.dump({
+                    "fingerprint": self.fingerprint,
+                    "sources": {key: wm.model_dump() for key, wm in self._watermarks.items()},
+                }, f)
+            tmp_file.replace(self.path)
@@ -0,0 +1,25 @@
+"""Shared test fixtures."""
+import pytest
+
+from jobminer.models import Job
+
+
+@pytest.fixture
+def make_job():
+    """
+    Factory for remote job postings.
+
+    ``make_job(title, n=0, **fields)``: ``n`` sets the URL, and with it the
+    job ID, so jobs with different ``n`` are distinct. Other fields
+    override the defaults.
+    """
+    def make(title: str = "Senior Data Engineer", n: int = 0, **fields) -> Job:
+        fields = {
+            "company": "Snowflake",
+            "url": f"https://example.com/jobs/{n}",
+            "location": "Remote",
+            "is_remote": True,
+            **fields,
+        }
+        return Job(title=title, **fields)
+    return make
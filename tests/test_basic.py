@@ -4,7 +4,7 @@ import pytest
 from jobminer.companies import (get_companies, get_company_info,
                                 is_established_company)
 from jobminer.config import settings
-from jobminer.models import Company, Job
+from jobminer.models import Company, Job, dump_jobs, load_jobs
 
 
 def test_company_database():
@@ -87,5 +87,26 @@ def test_target_roles():
             f"Expected role '{expected}' not found in target roles"
 
 
+def test_job_list_round_trip():
+    """Stored job lists load back into equal Job models."""
+    jobs = [
+        Job(
+            title="Senior Data Engineer",
+            company="Snowflake",
+            company_info=get_company_info("Snowflake"),
+            url=f"https://example.com/jobs/{i}",
+            location="Remote",
+            is_remote=True,
+            relevance_score=0.9,
+        )
+        for i in range(3)
+    ]
+
+    loaded = load_jobs(dump_jobs(jobs))
+
+    assert loaded == jobs
+    assert loaded[0].company_info.name == "Snowflake"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,74 @@
+"""Tests for the normalized company index."""
+from jobminer.companies import (CompanyMatcher, get_company_info, get_company_matcher,
+                                is_established_company, normalize_company_name)
+from jobminer.models import Job
+from jobminer.scrapers.base import BaseScraper
+
+
+class FakeBoard(BaseScraper):
+    """Scraper without sources, for the shared helpers."""
+
+
+def test_normalize_company_name():
+    """Case, punctuation and legal suffixes do not matter."""
+    assert normalize_company_name("Stripe, Inc.") == "stripe"
+    assert normalize_company_name("STRIPE Inc") == "stripe"
+    assert normalize_company_name("Delivery Hero SE") == "delivery hero"
+    assert normalize_company_name("Example Widgets GmbH") == "example widgets"
+    assert normalize_company_name("Acme Corp.") == "acme"
+    assert normalize_company_name("Inc") == "inc"  # Never normalize to nothing
+
+
+def test_lookup_variants_and_aliases():
+    """Differently written names and aliases find the curated company."""
+    assert get_company_info("Stripe, Inc.").name == "Stripe"
+    assert get_company_info("Amazon Web Services").name == "Amazon"
+    assert get_company_info("aws").name == "Amazon"
+    assert get_company_info("Booking.com B.V.").name == "Booking.com"
+    assert is_established_company("Palo Alto Networks, Inc.")
+    assert not is_established_company("Acme Corp")
+
+
+def test_lookups_share_company_instances():
+    """Lookups return the interned Company instead of building a new one."""
+    assert get_company_info("Snowflake") is get_company_info("snowflake inc.")
+
+
+def test_messy_board_company_strings():
+    """Parenthesized notes, separators and small typos still match."""
+    assert get_company_info("Datadog (Remote)").name == "Datadog"
+    assert get_company_info("Amazon Web Services (AWS)").name == "Amazon"
+    assert get_company_info("Stripe - Remote").name == "Stripe"
+    assert get_company_info("Palo Alto Network").name == "Palo Alto Networks"
+    assert get_company_info("Community") is None  # Shares most trigrams with "Unity"
+    assert get_company_info("Unity Software").name == "Unity"
+    assert get_company_info("Google DeepMind").name == "Google"
+    assert get_company_info("AirBnB").name == "Airbnb"
+    assert get_company_info("Snowflak").name == "Snowflake"
+
+
+def test_other_companies_with_similar_names_do_not_match():
+    """An extra distinctive word or a changed letter makes another company."""
+    assert get_company_info("Elastic Path") is None
+    assert get_company_info("Salesforge") is None
+    assert get_company_info("Square One") is None
+    assert get_company_info("Databricks Partner") is None
+
+
+def test_matcher_filter_by_company():
+    """filter_by_company keeps jobs whose company fuzzily matches the list."""
+    jobs = [Job(title="Engineer", company=company, url=f"https://example.com/{i}",
+                location="Remote", is_remote=True)
+            for i, company in enumerate(["Stripe, Inc.", "Acme Corp", "Datadog (Remote)"])]
+
+    filtered = FakeBoard("fake").filter_by_company(jobs, ["Stripe", "Datadog"])
+
+    assert [job.company for job in filtered] == ["Stripe, Inc.", "Datadog (Remote)"]
+    assert get_company_matcher(["Stripe", "Datadog"]) is get_company_matcher(("Stripe", "Datadog"))
+
+
+def test_matcher_memoizes_raw_strings():
+    """Repeated raw strings are answered from the memo."""
+    matcher = CompanyMatcher({"Snowflake": "snowflake"}, threshold=0.7)
+    assert matcher.match("Snowflake, Inc.") == "snowflake"
+    assert matcher._cache == {"Snowflake, Inc.": "snowflake"}
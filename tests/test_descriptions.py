@@ -0,0 +1,56 @@
+"""Tests for description cleanup."""
+from jobminer.descriptions import (DescriptionCleaner, estimate_tokens, extract_requirements,
+                                   fit_to_budget, html_to_lines, prompt_description)
+from jobminer.models import Job
+
+ABOUT = "<p>Acme builds widgets for thousands of companies around the world since 1999.</p>"
+
+
+def make_job(description: str, n: int = 0) -> Job:
+    return Job(
+        title="Senior Data Engineer",
+        company="Acme Inc",
+        url=f"https://example.com/jobs/{n}",
+        location="Remote",
+        is_remote=True,
+        description=description,
+    )
+
+
+def test_html_to_lines_strips_markup():
+    lines = html_to_lines("<div><h3>Requirements:</h3><ul><li>Python &amp; SQL</li>"
+                          "<li>  Spark\n\n  </li></ul><script>track()</script></div>")
+    assert lines == ["Requirements:", "- Python & SQL", "- Spark"]
+
+
+def test_extract_requirements_stops_at_next_section():
+    lines = ["About the role", "Build pipelines.", "What you'll need:", "- Python", "- 5+ years of SQL",
+             "Benefits", "- Remote"]
+    assert extract_requirements(lines) == ["Python", "5+ years of SQL"]
+    assert extract_requirements(["No sections here."]) == []
+
+
+def test_cleaner_drops_legal_and_repeated_boilerplate():
+    """Legal text always goes; company paragraphs go once repeated across postings."""
+    cleaner = DescriptionCleaner(min_postings=2)
+    legal = "<p>Acme is an equal opportunity employer.</p>"
+    first = make_job(ABOUT + "<p>Requirements</p><ul><li>Kafka</li></ul>" + legal, n=0)
+    second = make_job(ABOUT + "<p>We need an on-call data engineer for our platform team.</p>" + legal, n=1)
+
+    saved = cleaner.clean(first) + cleaner.clean(second)
+
+    assert "equal opportunity" not in first.description
+    assert "Acme builds widgets" in first.description
+    assert "Acme builds widgets" not in second.description
+    assert first.requirements == ["Kafka"]
+    assert second.requirements is None
+    assert saved > 0
+
+
+def test_prompt_description_fits_budget_with_requirements_first():
+    job = make_job("Intro sentence. " * 100)
+    job.requirements = ["Python", "Spark"]
+    text = prompt_description(job, 30)
+    assert text.startswith("Requirements: Python; Spark")
+    assert estimate_tokens(text) <= 30
+    assert fit_to_budget("short", 30) == "short"
@@ -0,0 +1,80 @@
+"""Tests for the conditional-request HTTP cache."""
+import httpx
+
+from jobminer.scrapers.http_cache import HttpCache
+from jobminer.scrapers.http_client import HttpClient, is_not_modified
+
+
+def test_revalidates_with_etag_and_skips_body(tmp_path):
+    """A 304 answer is served from the cache and flagged as not modified."""
+    body = b'[{"legal": "notice"}]'
+
+    def handler(request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, headers={"ETag": '"v1"'}, content=body)
+
+    cache = HttpCache(tmp_path, max_bytes=1024)
+    client = HttpClient(transport=httpx.MockTransport(handler), cache=cache)
+
+    first = client.get("https://remoteok.com/api")
+    assert not is_not_modified(first)
+    client.keep_cached("https://remoteok.com/api")
+    cache.commit()
+
+    index_written = cache.index_file.stat().st_mtime_ns
+    second = client.get("https://remoteok.com/api")
+    assert is_not_modified(second)
+    assert second.content == body
+    assert cache.index_file.stat().st_mtime_ns == index_written  # Hits are saved by the next commit
+
+    stats = client.stats.snapshot()
+    assert stats.cache_misses == 1
+    assert stats.cache_hits == 1
+    assert stats.cache_bytes_saved == len(body)
+
+
+def test_index_persists_and_config_change_discards(tmp_path):
+    """Validators survive restarts unless the scraping configuration changed."""
+    cache = HttpCache(tmp_path, max_bytes=1024, fingerprint="a")
+    cache.store("https://example.com", {"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}, b"x")
+    cache.keep("https://example.com")
+    cache.commit()
+
+    reloaded = HttpCache(tmp_path, max_bytes=1024, fingerprint="a")
+    assert reloaded.conditional_headers("https://example.com") == {
+        "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"
+    }
+
+    changed = HttpCache(tmp_path, max_bytes=1024, fingerprint="b")
+    assert len(changed) == 0
+
+
+def test_evicts_least_recently_used(tmp_path):
+    """Bodies beyond the size cap are evicted oldest-access first."""
+    cache = HttpCache(tmp_path, max_bytes=10)
+    for name in "ab":
+        cache.store(f"https://example.com/{name}", {"ETag": name}, name.encode() * 4)
+        cache.keep(f"https://example.com/{name}")
+        cache.commit()
+    cache.lookup("https://example.com/a")
+    cache.store("https://example.com/c", {"ETag": "c"}, b"cccc")
+    cache.keep("https://example.com/c")
+    cache.commit()
+
+    assert cache.read_body("https://example.com/a") == b"aaaa"
+    assert cache.read_body("https://example.com/b") is None
+    assert cache.size_bytes <= 10
+
+
+def test_only_kept_responses_are_committed(tmp_path):
+    """Staged validators of responses not kept, or never committed, are not used."""
+    cache = HttpCache(tmp_path, max_bytes=1024)
+    cache.store("https://example.com/a", {"ETag": "a"}, b"a")
+    cache.store("https://example.com/b", {"ETag": "b"}, b"b")
+    cache.keep("https://example.com/a")
+    assert cache.conditional_headers("https://example.com/a") == {}
+
+    cache.commit()
+    assert cache.conditional_headers("https://example.com/a") == {"If-None-Match": "a"}
+    assert cache.conditional_headers("https://example.com/b") == {}
@@ -0,0 +1,75 @@
+"""Tests for the shared scraper HTTP client."""
+import httpx
+
+from jobminer.scrapers.http_client import HttpClient
+from jobminer.scrapers.ratelimit import HostRateLimiter
+
+
+def make_client(handler, **kwargs):
+    return HttpClient(transport=httpx.MockTransport(handler), backoff_base=0.01, **kwargs)
+
+
+def test_retries_on_server_errors_then_succeeds():
+    """5xx responses are retried and counted."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) < 3:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"ok": True})
+
+    client = make_client(handler, max_retries=3)
+    response = client.get("https://example.com/api")
+
+    assert response.status_code == 200
+    assert response.json() == {"ok": True}
+    assert len(calls) == 3
+    stats = client.stats.snapshot()
+    assert stats.requests == 1
+    assert stats.retries == 2
+    assert stats.failures == 0
+    assert stats.bytes_received > 0
+
+
+def test_honours_retry_after_and_gives_up():
+    """Retry-After delays are respected and the last response is returned."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(429, headers={"Retry-After": "0"})
+
+    client = make_client(handler, max_retries=2)
+    response = client.get("https://example.com/api")
+
+    assert response.status_code == 429
+    assert len(calls) == 3
+    assert client.stats.snapshot().failures == 1
+
+
+def test_rate_limiter_slot_is_taken_for_every_attempt():
+    """Retries wait for the host's rate limit like the first attempt."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) < 3:
+            return httpx.Response(503)
+        return httpx.Response(200)
+
+    limiter = HostRateLimiter(rate=0.001, capacity=3)
+    client = make_client(handler, max_retries=3)
+    client.get("https://boards-api.greenhouse.io/v1/boards/x/jobs", rate_limiter=limiter)
+
+    assert len(calls) == 3
+    assert not limiter.bucket_for("boards-api.greenhouse.io").try_acquire(0.5)
+
+
+def test_sends_default_headers():
+    """Scrapers no longer set their own User-Agent."""
+    def handler(request):
+        assert "Mozilla" in request.headers["User-Agent"]
+        return httpx.Response(200)
+
+    assert make_client(handler).get("https://example.com").status_code == 200
@@ -0,0 +1,193 @@
+"""Offline tests for the job board scrapers using captured fixtures."""
+from pathlib import Path
+
+import httpx
+import pytest
+
+from jobminer.config import settings
+from jobminer.scrapers import job_boards
+from jobminer.scrapers.http_cache import HttpCache
+from jobminer.scrapers.http_client import HttpClient, set_http_client
+from jobminer.scrapers.job_boards import CompanyCareersPageScraper, RemoteOKScraper
+from jobminer.scrapers.parsing import iter_json_array, parse_listings
+from jobminer.watermarks import WatermarkStore
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+ROUTES = {
+    "boards-api.greenhouse.io": "greenhouse_jobs.json",
+    "api.lever.co": "lever_postings.json",
+}
+
+
+@pytest.fixture
+def fixture_http():
+    """Serve fixture files instead of hitting the network."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        body = (FIXTURES / ROUTES[request.url.host]).read_bytes()
+        return httpx.Response(200, content=body, headers={"Content-Type": "application/json"})
+
+    set_http_client(HttpClient(transport=httpx.MockTransport(handler)))
+    yield requests
+    set_http_client(None)
+
+
+def test_greenhouse_api_maps_to_jobs(fixture_http, monkeypatch):
+    """Greenhouse API jobs are filtered and mapped with dates and content."""
+    monkeypatch.setattr(settings, "ats_include_content", True)
+    scraper = CompanyCareersPageScraper()
+
+    jobs = scraper._scrape_greenhouse("Stripe", ["data engineer", "software engineer"], 10, "stripe")
+
+    assert fixture_http[0].url.path == "/v1/boards/stripe/jobs"
+    assert fixture_http[0].url.params["content"] == "true"
+    assert len(jobs) == 1  # On-site and non-matching titles are dropped
+    job = jobs[0]
+    assert job.title == "Senior Data Engineer"
+    assert job.matched_role == "data engineer"
+    assert str(job.url) == "https://boards.greenhouse.io/stripe/jobs/5012345"
+    assert job.location == "Remote - US"
+    assert job.description == "<p>Build and operate the data platform.</p>"
+    assert job.posted_date.isoformat() == "2024-03-01T09:00:00-05:00"
+    assert job.updated_at.isoformat() == "2024-03-18T10:15:42-04:00"
+    assert job.company_info.name == "Stripe"
+
+
+def test_lever_api_maps_to_jobs(fixture_http):
+    """Lever postings use workplaceType for remote detection."""
+    scraper = CompanyCareersPageScraper()
+
+    jobs = scraper._scrape_lever("Plaid", ["solutions architect", "software engineer"], 10, "plaid")
+
+    assert fixture_http[0].url.path == "/v0/postings/plaid"
+    assert [job.title for job in jobs] == ["Solutions Architect"]
+    assert jobs[0].is_remote
+    assert jobs[0].posted_date.year == 2024
+    assert jobs[0].description is None
+
+
+def test_parse_listings_only_keeps_targeted_elements():
+    """The strained parse yields listing elements with their children intact."""
+    listings = parse_listings((FIXTURES / "wwr_programming.html").read_bytes(), "li", "feature")
+
+    assert len(listings) == 3
+    assert listings[0].find("span", class_="title").text.strip() == "Senior Data Engineer"
+    assert listings[0].find("a")["href"] == "/remote-jobs/datadog-senior-data-engineer"
+
+
+def test_remotive_listings_with_multiple_classes():
+    """Elements carrying extra classes still match."""
+    listings = parse_listings((FIXTURES / "remotive_software_dev.html").read_bytes(), "li", "job-tile")
+
+    assert [li.find("span", class_="company").text for li in listings] == ["Elastic", "Twilio", "Twilio"]
+
+
+def test_iter_json_array_handles_split_chunks():
+    """Elements split across chunk boundaries decode correctly."""
+    body = b'[{"id": "1", "position": "Data ]Engineer"}, 12.5, "x", [1, 2]]'
+    for size in range(1, 8):
+        chunks = [body[i:i + size] for i in range(0, len(body), size)]
+        assert list(iter_json_array(chunks)) == [
+            {"id": "1", "position": "Data ]Engineer"}, 12.5, "x", [1, 2]
+        ]
+
+
+def test_remoteok_streams_and_stops_early(monkeypatch):
+    """The feed is decoded incrementally and reading stops at max_jobs."""
+    body = (FIXTURES / "remoteok_api.json").read_bytes()
+    chunk_size = 256
+    monkeypatch.setattr(job_boards, "STREAM_CHUNK_SIZE", chunk_size)
+    served = []
+
+    def chunks():
+        for i in range(0, len(body), chunk_size):
+            served.append(i)
+            yield body[i:i + chunk_size]
+
+    def handler(request):
+        return httpx.Response(200, content=chunks())
+
+    set_http_client(HttpClient(transport=httpx.MockTransport(handler)))
+    try:
+        scraper = RemoteOKScraper()
+        jobs = scraper.scrape(["data engineer", "software engineer"], max_jobs=1)
+    finally:
+        set_http_client(None)
+
+    assert [job.company for job in jobs] == ["Datadog"]
+    assert jobs[0].salary_range == "120000-180000"
+    assert jobs[0].location == "Remote"
+    assert len(served) < len(body) / chunk_size
+
+
+def test_lever_skips_postings_seen_in_earlier_runs(fixture_http, tmp_path):
+    """With a watermark store, a second run does no work for known postings."""
+    scraper = CompanyCareersPageScraper()
+    scraper.watermarks = WatermarkStore(tmp_path / "watermarks.json")
+    keywords = ["solutions architect"]
+
+    assert len(scraper._scrape_lever("Plaid", keywords, 10, "plaid")) == 1
+    scraper.watermarks.commit()
+
+    assert scraper._scrape_lever("Plaid", keywords, 10, "plaid") == []
+
+
+def test_careers_scraper_stages_watermarks_only_for_passed_on_jobs(tmp_path):
+    """Boards dropped after max_jobs is reached stay unprocessed for the next run."""
+    def handler(request):
+        slug = request.url.path.split("/")[-2]
+        return httpx.Response(200, json={"jobs": [
+            {"id": f"{slug}-{n}", "title": "Senior Data Engineer", "location": {"name": "Remote"},
+             "absolute_url": f"https://boards.greenhouse.io/{slug}/jobs/{n}",
+             "updated_at": "2024-10-01T12:00:00Z"}
+            for n in range(2)
+        ]})
+
+    set_http_client(HttpClient(transport=httpx.MockTransport(handler)))
+    try:
+        scraper = CompanyCareersPageScraper()
+        scraper.greenhouse_boards = [(f"Company {i}", f"co{i}") for i in range(6)]
+        scraper.lever_boards = []
+        scraper.watermarks = WatermarkStore(tmp_path / "watermarks.json")
+        jobs = scraper.scrape(["data engineer"], max_jobs=3)
+        scraper.watermarks.commit()
+    finally:
+        set_http_client(None)
+
+    assert len(jobs) == 3
+    seen = [scraper.watermarks.get(f"greenhouse:co{i}") for i in range(6)]
+    assert sum(len(watermark.seen) for watermark in seen[:3]) == 3
+    assert seen[3:] == [None, None, None]
+
+
+def test_partly_scanned_board_is_fetched_in_full_next_run(tmp_path):
+    """A 304 must not hide the postings a capped scan did not reach."""
+    def handler(request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, headers={"ETag": '"v1"'}, json={"jobs": [
+            {"id": n, "title": "Senior Data Engineer", "location": {"name": "Remote"},
+             "absolute_url": f"https://boards.greenhouse.io/stripe/jobs/{n}",
+             "updated_at": "2024-10-01T12:00:00Z"}
+            for n in range(6)
+        ]})
+
+    client = HttpClient(transport=httpx.MockTransport(handler),
+                        cache=HttpCache(tmp_path / "http_cache", max_bytes=1024 * 1024))
+    set_http_client(client)
+    try:
+        scraper = CompanyCareersPageScraper()
+        scraper.watermarks = WatermarkStore(tmp_path / "watermarks.json")
+        runs = []
+        for _ in range(4):
+            runs.append([job.url.path.rsplit("/", 1)[-1]
+                         for job in scraper._scrape_greenhouse("Stripe", ["data engineer"], 2, "stripe")])
+            scraper.watermarks.commit()
+            client.cache.commit()
+    finally:
+        set_http_client(None)
+
+    assert runs == [["0", "1"], ["2", "3"], ["4", "5"], []]
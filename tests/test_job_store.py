@@ -0,0 +1,79 @@
+"""Tests for the append-only job store."""
+import json
+
+from jobminer.job_store import JobStore
+from jobminer.models import Job, dump_jobs, load_jobs
+
+
+def make_job(number: int, score: float = 0.8) -> Job:
+    return Job(
+        title=f"Senior Data Engineer {number}",
+        company="Snowflake",
+        url=f"https://example.com/jobs/{number}",
+        location="Remote",
+        is_remote=True,
+        relevance_score=score,
+    )
+
+
+def test_append_writes_only_new_or_changed_jobs(tmp_path):
+    store = JobStore(tmp_path / "jobs.jsonl")
+    jobs = [make_job(1), make_job(2)]
+    assert store.append(jobs) == 2
+    assert store.append(jobs) == 0
+
+    jobs[1].relevance_score = 0.6
+    assert store.append(jobs + [make_job(3)]) == 2
+    assert len(store.path.read_text().splitlines()) == 4
+
+    reloaded = JobStore(store.path)
+    loaded = {job.id: job for job in reloaded.load()}
+    assert len(reloaded) == 3
+    assert reloaded.records == 4
+    assert loaded[jobs[1].id].relevance_score == 0.6  # Last record wins
+    assert reloaded.append(loaded.values()) == 0
+
+
+def test_load_skips_torn_last_line(tmp_path):
+    """A write cut short by a crash loses only that record."""
+    store = JobStore(tmp_path / "jobs.jsonl")
+    store.append([make_job(1), make_job(2)])
+    with open(store.path, "a") as f:
+        f.write(make_job(3).model_dump_json()[:40])
+
+    reloaded = JobStore(store.path)
+    assert [job.title for job in reloaded.load()] == ["Senior Data Engineer 1", "Senior Data Engineer 2"]
+    assert reloaded.append([make_job(4)]) == 1
+    assert len(JobStore(store.path).load()) == 3
+
+
+def test_compact_keeps_latest_record_of_each_job(tmp_path):
+    store = JobStore(tmp_path / "jobs.jsonl")
+    job = make_job(1)
+    store.append([job, make_job(2)])
+    for score in (0.5, 0.6, 0.7):
+        job.relevance_score = score
+        store.append([job])
+    assert store.needs_compaction(1.5)
+
+    assert store.compact() == 3
+    assert not store.needs_compaction(1.5)
+    assert len(store.path.read_text().splitlines()) == 2
+
+    reloaded = JobStore(store.path)
+    reloaded.load()
+    reloaded.compact()
+    assert len(store.path.read_text().splitlines()) == 2
+    loaded = {job.id: job for job in JobStore(store.path).load()}
+    assert loaded[job.id].relevance_score == 0.7
+
+
+def test_json_view_matches_stored_jobs(tmp_path):
+    store = JobStore(tmp_path / "jobs.jsonl")
+    jobs = [make_job(1), make_job(2)]
+    store.append(jobs)
+    view = tmp_path / "jobs_latest.json"
+    store.write_json_view(view, [jobs[1].id, jobs[0].id])
+
+    assert json.loads(view.read_text()) == json.loads(dump_jobs([jobs[1], jobs[0]]))
+    assert load_jobs(view.read_bytes()) == [jobs[1], jobs[0]]
@@ -0,0 +1,258 @@
+"""Tests for concurrent LLM scoring."""
+import json
+import re
+import threading
+import time
+
+from jobminer import llm_cache
+from jobminer.config import settings
+from jobminer.llm_cache import VerdictCache
+from jobminer.llm_calls import AdaptiveThrottle, CircuitBreaker, RateLimitedError, parse_duration
+from jobminer.llm_filter import (FailoverFilter, LLMFilter, build_batch_prompt, estimate_tokens,
+                                 pack_prompt_batches, parse_batch_response)
+from jobminer.models import Job
+
+
+class FakeLLM(LLMFilter):
+    """Backend that sleeps like a network call and scores by title."""
+
+    def __init__(self, delay: float = 0.1, rate_limit_first: int = 0):
+        super().__init__()
+        self.delay = delay
+        self.rate_limit_first = rate_limit_first
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def analyze_job(self, job, user_criteria):
+        with self.lock:
+            self.calls += 1
+            limited = self.calls <= self.rate_limit_first
+        time.sleep(self.delay)
+        if limited:
+            raise RateLimitedError("429", retry_after=0.05)
+        return int(job.title) / 100, f"job {job.title}"
+
+
+class DownLLM(LLMFilter):
+    """Backend whose calls all time out."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def analyze_job(self, job, user_criteria):
+        self.calls += 1
+        raise TimeoutError("timed out")
+
+
+def make_jobs(count):
+    return [Job(title=str(i), company="Snowflake", url=f"https://example.com/{i}",
+                location="Remote", is_remote=True) for i in range(count)]
+
+
+def test_batch_analyze_is_concurrent_and_ordered(monkeypatch):
+    """Calls overlap, and results keep the input order."""
+    monkeypatch.setattr(settings, "llm_workers", 8)
+    llm = FakeLLM(delay=0.1)
+
+    start = time.monotonic()
+    jobs = llm.batch_analyze(make_jobs(16), "criteria")
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 0.8  # 1.6s if run one at a time
+    assert [job.relevance_score for job in jobs] == [i / 100 for i in range(16)]
+    stats = llm.stats.snapshot()
+    assert stats.calls == 16
+    assert stats.p50_latency_ms >= 100
+
+
+def test_rate_limited_calls_are_retried(monkeypatch):
+    """429s shrink concurrency and are retried after Retry-After."""
+    monkeypatch.setattr(settings, "llm_workers", 4)
+    llm = FakeLLM(delay=0.01, rate_limit_first=2)
+
+    jobs = llm.batch_analyze(make_jobs(4), "criteria")
+
+    assert [job.llm_analysis for job in jobs] == [f"job {i}" for i in range(4)]
+    stats = llm.stats.snapshot()
+    assert stats.rate_limited == 2
+    assert stats.calls == 6
+    assert llm.throttle.limit < 4
+
+
+def test_throttle_pauses_when_quota_is_used_up():
+    """Exhausted rate-limit headers delay the next call until the reset."""
+    throttle = AdaptiveThrottle(2)
+    throttle.update({"x-ratelimit-remaining-requests": "0", "x-ratelimit-reset-requests": "200ms"})
+
+    start = time.monotonic()
+    throttle.acquire()
+    throttle.release()
+
+    assert time.monotonic() - start >= 0.15
+    assert parse_duration("6m0.5s") == 360.5
+    assert parse_duration("2") == 2.0
+
+
+def test_verdict_cache_skips_unchanged_jobs(tmp_path):
+    """Jobs scored before are answered from the cache; changed ones are rescored."""
+    cache = VerdictCache(tmp_path / "llm_cache.sqlite", ttl_seconds=3600, max_entries=100)
+    llm = FakeLLM(delay=0)
+    llm.cache = cache
+    llm.batch_analyze(make_jobs(3), "criteria")
+    assert llm.calls == 3
+
+    llm.stats.reset()
+    jobs = make_jobs(3)
+    jobs[2].description = "Now with a description"
+    jobs = llm.batch_analyze(jobs, "criteria")
+
+    assert llm.calls == 4
+    assert [job.relevance_score for job in jobs] == [0.0, 0.01, 0.02]
+    stats = llm.stats.snapshot()
+    assert (stats.cache_hits, stats.cache_misses) == (2, 1)
+
+    llm.batch_analyze(make_jobs(1), "other criteria")
+    assert llm.calls == 5
+
+
+def test_verdict_cache_expiry_and_eviction(tmp_path, monkeypatch):
+    """Expired verdicts miss, and the least recently used ones are evicted."""
+    monkeypatch.setattr(llm_cache, "EVICT_EVERY", 1)
+    cache = VerdictCache(tmp_path / "llm_cache.sqlite", ttl_seconds=3600, max_entries=2)
+    cache.put("a", 0.1, "a")
+    cache.put("b", 0.2, "b")
+    assert cache.get("a") == (0.1, "a")  # "b" is now least recently used
+    cache.put("c", 0.3, "c")
+
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+    cache.ttl_seconds = 0
+    assert cache.get("a") is None
+
+
+class FakeBatchLLM(FakeLLM):
+    """Backend answering multi-job prompts, dropping and mangling some items."""
+
+    supports_batch_prompts = True
+
+    def __init__(self):
+        super().__init__(delay=0)
+        self.prompts = []
+
+    def _generate(self, prompt):
+        self.prompts.append(prompt)
+        titles = re.findall(r"- Title: (\d+)", prompt)
+        self.stats.record_tokens(len(prompt) // 4, 20 * len(titles))
+        results = [{"id": n, "score": int(t) / 100, "analysis": f"job {t}"}
+                   for n, t in enumerate(titles, start=1) if t != "3"]  # Job 3 missing
+        if results:
+            results[0]["score"] = "high"  # Malformed, so the first job falls back too
+        return json.dumps({"results": results})
+
+
+def test_batch_prompts_with_per_job_fallback(monkeypatch):
+    """Jobs are scored several per prompt; missing or malformed items are rescored alone."""
+    monkeypatch.setattr(settings, "llm_batch_size", 4)
+    llm = FakeBatchLLM()
+
+    jobs = llm.batch_analyze(make_jobs(8), "criteria")
+
+    assert len(llm.prompts) == 2
+    assert [job.relevance_score for job in jobs] == [i / 100 for i in range(8)]
+    assert llm.calls == 3  # Jobs 0 and 4 (malformed) and 3 (missing) scored one by one
+    stats = llm.stats.snapshot()
+    assert stats.batch_fallbacks == 3
+    assert stats.jobs_scored == 8
+    assert stats.tokens_per_job > 0
+
+
+def test_prompt_batches_fit_the_context(monkeypatch):
+    """Smaller context windows mean fewer jobs per prompt."""
+    monkeypatch.setattr(settings, "llm_batch_size", 50)
+    jobs = make_jobs(20)
+    for job in jobs:
+        job.description = "x" * 600
+
+    monkeypatch.setattr(settings, "llm_context_tokens", 8192)
+    large = pack_prompt_batches(jobs, "criteria")
+    monkeypatch.setattr(settings, "llm_context_tokens", 2048)
+    small = pack_prompt_batches(jobs, "criteria")
+
+    assert len(large) < len(small)
+    assert [job for group in small for job in group] == jobs
+    assert all(estimate_tokens(build_batch_prompt(group, "criteria")) < 2048 for group in small)
+
+
+def test_parse_batch_response_skips_invalid_items():
+    """Only well-formed verdicts for known job numbers are accepted."""
+    text = json.dumps([
+        {"id": 1, "score": 0.9, "analysis": "good"},
+        {"id": 1, "score": 0.1, "analysis": "repeated"},
+        {"id": 2, "score": 1.5, "analysis": "out of range"},
+        {"id": 7, "score": 0.5, "analysis": "unknown job"},
+        {"id": "3", "score": "0.4", "analysis": "numbers as strings"},
+        {"score": 0.5, "analysis": "no id"},
+    ])
+    assert parse_batch_response(text, 3) == {1: (0.9, "good"), 3: (0.4, "numbers as strings")}
+
+
+def test_circuit_breaker_opens_and_leaves_jobs_unscored(monkeypatch):
+    """After repeated failures the backend is not called again; jobs stay unscored."""
+    monkeypatch.setattr(settings, "llm_workers", 1)
+    monkeypatch.setattr(settings, "llm_breaker_failures", 3)
+    llm = DownLLM()
+
+    jobs = llm.batch_analyze(make_jobs(10), "criteria")
+
+    assert llm.calls == 3
+    assert all(job.relevance_score is None for job in jobs)
+    assert all(job.llm_analysis.startswith("Unscored: ") for job in jobs)
+
+
+def test_circuit_breaker_half_open_trial():
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=0.05)
+    breaker.record_failure()
+    assert not breaker.allow()
+    time.sleep(0.06)
+    assert breaker.allow()  # The trial call
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.allow()
+
+
+def test_failover_scores_with_next_backend(monkeypatch):
+    """Jobs a failing backend could not score go to the next one."""
+    monkeypatch.setattr(settings, "llm_workers", 1)
+    monkeypatch.setattr(settings, "llm_breaker_failures", 2)
+    down, up = DownLLM(), FakeLLM(delay=0)
+    llm = FailoverFilter([down, up])
+
+    jobs = llm.batch_analyze(make_jobs(4), "criteria")
+    assert [job.relevance_score for job in jobs] == [0.0, 0.01, 0.02, 0.03]
+    assert down.calls == 2
+
+    llm.batch_analyze(make_jobs(4), "criteria")
+    assert down.calls == 2  # Circuit open, skipped
+    assert llm.stats.snapshot().failures == 2
+
+
+def test_failover_looks_up_and_stores_verdicts_once(tmp_path, monkeypatch):
+    """A job failing over is one cache miss, and its verdict is found next time whichever backend gave it."""
+    monkeypatch.setattr(settings, "llm_workers", 1)
+    monkeypatch.setattr(settings, "llm_breaker_failures", 10)
+    down, up = DownLLM(), FakeLLM(delay=0)
+    llm = FailoverFilter([down, up])
+    llm.cache = VerdictCache(tmp_path / "llm_cache.sqlite", ttl_seconds=3600, max_entries=100)
+
+    llm.batch_analyze(make_jobs(3), "criteria")
+    stats = llm.stats.snapshot()
+    assert (stats.cache_hits, stats.cache_misses) == (0, 3)
+
+    llm.stats.reset()
+    jobs = llm.batch_analyze(make_jobs(3), "criteria")
+    stats = llm.stats.snapshot()
+    assert (stats.cache_hits, stats.cache_misses) == (3, 0)
+    assert (down.calls, up.calls) == (3, 3)
+    assert [job.relevance_score for job in jobs] == [0.0, 0.01, 0.02]
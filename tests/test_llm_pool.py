@@ -0,0 +1,79 @@
+"""Tests for load-balanced scoring across LLM endpoints."""
+import threading
+import time
+
+from jobminer.config import settings
+from jobminer.llm_filter import LLMFilter
+from jobminer.llm_pool import PooledFilter
+from jobminer.models import Job
+
+
+class FakeEndpoint(LLMFilter):
+    """Endpoint that takes ``delay`` seconds per call."""
+
+    def __init__(self, name: str, delay: float = 0.05, up: bool = True):
+        super().__init__()
+        self.base_url = name
+        self.model = "fake"
+        self.delay = delay
+        self.up = up
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def ping(self):
+        if not self.up:
+            raise ConnectionError("refused")
+
+    def analyze_job(self, job, user_criteria):
+        with self.lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return 0.9, self.base_url
+
+
+def make_jobs(count):
+    return [Job(title=f"Data Engineer {i}", company="Snowflake", url=f"https://example.com/{i}",
+                location="Remote", is_remote=True) for i in range(count)]
+
+
+def timed_run(llm, count):
+    start = time.monotonic()
+    jobs = llm.batch_analyze(make_jobs(count), "criteria")
+    return time.monotonic() - start, jobs
+
+
+def test_pool_throughput_grows_with_endpoints(monkeypatch):
+    """Three endpoints score about three times as fast as one, sharing the work evenly."""
+    monkeypatch.setattr(settings, "llm_workers", 2)
+    single, _ = timed_run(FakeEndpoint("a"), 24)
+    endpoints = [FakeEndpoint(name) for name in "abc"]
+    pooled, jobs = timed_run(PooledFilter(endpoints), 24)
+
+    assert pooled < single / 2
+    assert all(job.relevance_score == 0.9 for job in jobs)
+    assert all(6 <= endpoint.calls <= 10 for endpoint in endpoints)
+
+
+def test_pool_skips_unhealthy_endpoints(monkeypatch):
+    monkeypatch.setattr(settings, "llm_workers", 2)
+    down = FakeEndpoint("down", up=False)
+    up = FakeEndpoint("up")
+
+    _, jobs = timed_run(PooledFilter([down, up]), 6)
+
+    assert down.calls == 0
+    assert up.calls == 6
+    assert all(job.llm_analysis == "up" for job in jobs)
+
+
+def test_pool_drops_slow_endpoints(monkeypatch):
+    """An endpoint far slower than the others stops getting calls."""
+    monkeypatch.setattr(settings, "llm_workers", 1)
+    fast = [FakeEndpoint("fast1", delay=0.01), FakeEndpoint("fast2", delay=0.01)]
+    slow = FakeEndpoint("slow", delay=0.1)
+    pool = PooledFilter(fast + [slow])
+
+    timed_run(pool, 150)
+
+    assert pool.endpoints[2].slow
+    assert slow.calls < 10
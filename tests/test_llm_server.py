@@ -0,0 +1,63 @@
+"""Tests for the stand-in LLM server, and the LLM backends against it."""
+import json
+
+import httpx
+import pytest
+
+from benchmarks.llm_server import StandInLLMServer
+from jobminer.config import settings
+from jobminer.llm_filter import build_batch_prompt
+from jobminer.models import Job
+
+
+def make_jobs(count):
+    titles = ["Senior Data Engineer", "Product Designer"]
+    return [Job(title=titles[i % 2], company="Stripe", url=f"https://example.com/{i}",
+                location="Remote", is_remote=True) for i in range(count)]
+
+
+def test_server_speaks_ollama_and_openai():
+    with StandInLLMServer() as server:
+        prompt = build_batch_prompt(make_jobs(2), "criteria")
+        ollama = httpx.post(f"{server.url}/api/generate", json={"model": server.model, "prompt": prompt}).json()
+        openai = httpx.post(f"{server.url}/v1/chat/completions", json={
+            "model": server.model, "messages": [{"role": "user", "content": "- Title: Data Engineer\n"}],
+        }).json()
+
+    results = json.loads(ollama["response"])["results"]
+    assert [item["score"] for item in results] == [0.8, 0.2]
+    assert ollama["eval_count"] > 0
+    assert json.loads(openai["choices"][0]["message"]["content"])["score"] == 0.8
+    assert openai["usage"]["total_tokens"] > 0
+
+
+def test_server_injects_errors_and_rate_limits():
+    with StandInLLMServer(error_rate=0.5, rate_limit_rate=0.5, seed=1) as server, httpx.Client() as client:
+        statuses = [client.post(f"{server.url}/api/generate", json={"prompt": ""}).status_code
+                    for _ in range(20)]
+    assert set(statuses) == {429, 500}
+    assert server.errors + server.rate_limited == 20
+
+
+@pytest.mark.parametrize("backend", ["ollama", "openai"])
+def test_backends_score_against_stand_in(backend, monkeypatch):
+    """The real client libraries score single- and multi-job prompts end to end."""
+    pytest.importorskip(backend)
+    from jobminer.llm_filter import OllamaFilter, OpenAICompatibleFilter
+
+    monkeypatch.setattr(settings, "llm_batch_size", 4)
+    monkeypatch.setattr(settings, "llm_workers", 1)  # Calls in a fixed order, so the seeded 429s repeat
+    monkeypatch.setattr(settings, "llm_max_retries", 5)
+    monkeypatch.setattr(settings, "llm_backoff_base", 0.01)
+    monkeypatch.setattr(settings, "ollama_model", "stand-in")
+    with StandInLLMServer(rate_limit_rate=0.5, retry_after=0.01, seed=1) as server:
+        if backend == "ollama":
+            llm = OllamaFilter(base_url=server.url)
+        else:
+            llm = OpenAICompatibleFilter(api_key="test", base_url=f"{server.url}/v1", model="stand-in")
+        jobs = llm.batch_analyze(make_jobs(9), "criteria")
+
+    assert [job.relevance_score for job in jobs] == [0.8, 0.2] * 4 + [0.8]
+    stats = llm.stats.snapshot()
+    assert stats.rate_limited > 0
+    assert stats.prompt_tokens > 0
@@ -0,0 +1,98 @@
+"""Tests for LLM-free scoring by TF-IDF similarity."""
+import socket
+
+import pytest
+
+from jobminer import llm_filter
+from jobminer.config import settings
+from jobminer.llm_filter import build_user_criteria
+from jobminer.local_filter import LocalSimilarityFilter, hash_tokens, tokenize
+from jobminer.models import Job
+
+
+def make_job(title: str, description: str = None, n: int = 0) -> Job:
+    return Job(
+        title=title,
+        company="Example",
+        url=f"https://example.com/jobs/{n}",
+        location="Remote",
+        is_remote=True,
+        description=description,
+    )
+
+
+def test_batch_analyze_scores_matching_jobs_higher():
+    """Jobs resembling the criteria score above the keep cutoff; unrelated ones score 0."""
+    jobs = [
+        make_job("Senior Data Engineer", "Build cloud data platforms with Python and Spark.", n=0),
+        make_job("Registered Nurse", "Patient care and night shifts.", n=1),
+        make_job("Solutions Architect", n=2),
+    ]
+
+    LocalSimilarityFilter().batch_analyze(jobs, build_user_criteria())
+
+    assert jobs[0].relevance_score > 0.5
+    assert jobs[1].relevance_score == 0.0
+    assert jobs[2].relevance_score > 0.0
+    assert "matched: " in jobs[0].llm_analysis
+    assert jobs[1].llm_analysis.endswith("no matching terms")
+
+
+def test_score_does_not_depend_on_the_rest_of_the_batch():
+    """Other jobs in the batch, relevant or not, leave a job's score unchanged."""
+    llm = LocalSimilarityFilter()
+    criteria = build_user_criteria()
+    job = make_job("Senior Data Engineer", "Build cloud data platforms with Python and Spark.")
+    alone = llm.score_jobs([job], criteria)
+
+    others = [make_job("Data Engineer", "Spark and Python data pipelines.", n=n) for n in range(1, 13)]
+    others.append(make_job("Registered Nurse", "Patient care and night shifts.", n=13))
+    assert llm.score_jobs([job] + others, criteria)[0] == alone[0]
+    assert llm.score_jobs(others[:4] + [job], criteria)[4] == alone[0]
+
+
+def test_tokenize_and_hashing_are_stable():
+    assert tokenize("Senior Data Engineer at the company") == [
+        "senior", "data", "engineer", "senior data", "data engineer",
+    ]
+    assert hash_tokens(["python"], 2 ** 20).tolist() == hash_tokens(["python"], 2 ** 20).tolist()
+    assert hash_tokens([], 2 ** 20).size == 0
+
+
+def test_get_llm_filter_falls_back_to_local(monkeypatch):
+    monkeypatch.setattr(settings, "groq_api_key", None)
+    monkeypatch.setattr(settings, "openai_api_key", None)
+    monkeypatch.setattr(llm_filter, "OllamaFilter", _unavailable)
+
+    monkeypatch.setattr(settings, "local_filter_fallback", True)
+    assert isinstance(llm_filter.get_llm_filter(), LocalSimilarityFilter)
+
+    monkeypatch.setattr(settings, "local_filter_fallback", False)
+    assert llm_filter.get_llm_filter() is None
+
+
+def test_jobs_are_scored_locally_when_every_llm_is_down(monkeypatch):
+    """Backends that construct but cannot be reached fail over to local scoring."""
+    pytest.importorskip("ollama")
+    pytest.importorskip("openai")
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        down = f"http://127.0.0.1:{sock.getsockname()[1]}"  # Nothing listens here once closed
+    monkeypatch.setattr(settings, "groq_api_key", None)
+    monkeypatch.setattr(settings, "ollama_endpoints", "")
+    monkeypatch.setattr(settings, "ollama_base_url", down)
+    monkeypatch.setattr(settings, "openai_endpoints", "")
+    monkeypatch.setattr(settings, "openai_api_key", "unused")
+    monkeypatch.setattr(settings, "openai_base_url", f"{down}/v1")
+    monkeypatch.setattr(settings, "local_filter_fallback", True)
+    monkeypatch.setattr(settings, "llm_workers", 1)
+    jobs = [make_job("Senior Data Engineer", "Build data pipelines in Python.", n=n) for n in range(3)]
+
+    llm_filter.get_llm_filter().batch_analyze(jobs, build_user_criteria())
+
+    assert all(job.relevance_score is not None for job in jobs)
+    assert all(job.llm_analysis.startswith("Local similarity") for job in jobs)
+
+
+def _unavailable():
+    raise ImportError("ollama not installed")
@@ -0,0 +1,40 @@
+"""Tests for near-duplicate detection across boards."""
+from jobminer.models import Job
+from jobminer.near_duplicates import NearDuplicateIndex
+
+DESCRIPTION = (
+    "<p>Stripe is looking for a senior data engineer to build and operate the "
+    "data platform that powers financial reporting, fraud detection and "
+    "analytics for millions of businesses. You will design batch and streaming "
+    "pipelines with Spark, Kafka and Airflow.</p>"
+)
+
+
+def make_job(url: str, title: str = "Senior Data Engineer", company: str = "Stripe",
+             description: str = DESCRIPTION) -> Job:
+    return Job(title=title, company=company, url=url, location="Remote",
+               is_remote=True, description=description)
+
+
+def test_same_posting_on_other_board_is_clustered():
+    """Copies on other boards are dropped and recorded as alternate URLs."""
+    index = NearDuplicateIndex(threshold=0.8)
+    canonical = make_job("https://boards.greenhouse.io/stripe/jobs/1")
+    copy = make_job("https://remoteok.com/remote-jobs/99", company="Stripe, Inc.",
+                    description=DESCRIPTION.replace("<p>", "").replace("</p>", " Apply now."))
+
+    assert index.add(canonical) is None
+    assert index.add(copy) is canonical
+    assert canonical.alternate_urls == ["https://remoteok.com/remote-jobs/99"]
+    assert index.duplicates == 1
+
+
+def test_different_postings_are_kept():
+    """Other roles, other companies and same-board listings are not clustered."""
+    index = NearDuplicateIndex(threshold=0.8)
+    assert index.add(make_job("https://boards.greenhouse.io/stripe/jobs/1")) is None
+    assert index.add(make_job("https://remoteok.com/remote-jobs/1", company="Plaid")) is None
+    assert index.add(make_job("https://remoteok.com/remote-jobs/2", title="Product Designer",
+                              description="Design the Stripe dashboard experience.")) is None
+    assert index.add(make_job("https://boards.greenhouse.io/stripe/jobs/2")) is None
+    assert index.duplicates == 0
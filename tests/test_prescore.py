@@ -0,0 +1,38 @@
+"""Tests for pre-scoring jobs before the LLM."""
+from jobminer.prescore import PreScorer, select_for_llm
+
+
+def test_prescore_ranks_senior_matching_roles_first(make_job):
+    """Seniority, role, keywords and company metadata raise the score."""
+    scorer = PreScorer()
+    strong, _ = scorer.score(make_job(
+        "Senior Data Engineer", description="Python, Spark, Kafka, Airflow and AWS at scale.",
+    ))
+    weak, _ = scorer.score(make_job("Office Manager", company="Tiny Startup", description="Plan events."))
+
+    assert strong > 0.8
+    assert weak < 0.5
+
+
+def test_prescore_rejects_junior_titles(make_job):
+    score, explanation = PreScorer().score(make_job("Junior Data Engineer"))
+    assert score == 0.0
+    assert explanation == "junior title"
+
+
+def test_select_for_llm_applies_threshold_and_top_k(make_job):
+    """Only the best jobs above the threshold are escalated; the rest get a 0.0 verdict."""
+    jobs = [
+        make_job("Senior Data Engineer", description="python spark kafka", n=0),
+        make_job("Office Manager", company="Tiny Startup", n=1),
+        make_job("Staff Data Engineer", description="python spark kafka airflow dbt aws", n=2),
+        make_job("Data Engineer", n=3),
+    ]
+
+    escalated, skipped = select_for_llm(jobs, PreScorer(), threshold=0.5, top_k=2)
+
+    assert [job.title for job in escalated] == ["Senior Data Engineer", "Staff Data Engineer"]
+    assert len(skipped) == 2
+    assert all(job.relevance_score == 0.0 for job in skipped)
+    assert all(job.llm_analysis.startswith("Not sent to the LLM") for job in skipped)
+    assert all(job.prescore is not None for job in jobs)
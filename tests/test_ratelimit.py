@@ -0,0 +1,53 @@
+"""Tests for per-host rate limiting and concurrent ATS board fetching."""
+import time
+
+from jobminer.models import Job
+from jobminer.scrapers.job_boards import BoardScan, CompanyCareersPageScraper
+from jobminer.scrapers.ratelimit import HostRateLimiter, TokenBucket
+
+
+def test_token_bucket_allows_burst_then_throttles():
+    """A bucket hands out its burst immediately and then refills at its rate."""
+    bucket = TokenBucket(rate=20.0, capacity=2)
+    assert bucket.try_acquire()
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+
+    waited = bucket.acquire()
+    assert 0.0 < waited < 0.2
+
+
+def test_host_rate_limiter_uses_separate_budgets():
+    """Each host gets its own bucket."""
+    limiter = HostRateLimiter(rate=1.0, capacity=1)
+    greenhouse = limiter.bucket_for("https://boards.greenhouse.io/stripe")
+    lever = limiter.bucket_for("https://jobs.lever.co/plaid")
+
+    assert greenhouse is not lever
+    assert greenhouse is limiter.bucket_for("boards.greenhouse.io")
+    assert greenhouse.try_acquire()
+    assert lever.try_acquire()
+
+
+def test_careers_scraper_fetches_boards_concurrently(monkeypatch):
+    """Boards are fetched in parallel and results keep board order."""
+    scraper = CompanyCareersPageScraper()
+    scraper.greenhouse_boards = [("Stripe", "stripe"), ("GitLab", "gitlab")]
+    scraper.lever_boards = [("Plaid", "plaid")]
+
+    def fake_fetch(company, keywords, max_jobs, company_slug=None):
+        time.sleep(0.3)
+        scan = BoardScan(company_slug, scraper.watermark_tracker(company_slug), "https://example.com")
+        scan.jobs.append(Job(title="Data Engineer", company=company,
+                             url=f"https://example.com/{company_slug}", location="Remote", is_remote=True))
+        scan.listing_ids.append("1")
+        return scan
+
+    monkeypatch.setattr(scraper, "_scan_greenhouse", fake_fetch)
+    monkeypatch.setattr(scraper, "_scan_lever", fake_fetch)
+
+    start = time.monotonic()
+    jobs = scraper.scrape(["data engineer"], max_jobs=50)
+
+    assert time.monotonic() - start < 0.8
+    assert [job.company for job in jobs] == ["Stripe", "GitLab", "Plaid"]
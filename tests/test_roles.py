@@ -0,0 +1,34 @@
+"""Tests for the compiled role matcher."""
+from jobminer.roles import RoleMatcher, get_role_matcher
+
+ROLES = ["data engineer", "senior data engineer", "software engineer", "solutions architect"]
+
+
+def test_reports_matched_role():
+    """The most specific configured role is reported."""
+    matcher = RoleMatcher(ROLES)
+    assert matcher.match("Senior Data Engineer") == "senior data engineer"
+    assert matcher.match("Data Engineer II") == "data engineer"
+    assert matcher.match("Product Manager") is None
+
+
+def test_synonyms():
+    """Abbreviations and alternative phrasings match the configured role."""
+    matcher = RoleMatcher(ROLES)
+    assert matcher.match("Sr. Data Engineer") == "senior data engineer"
+    assert matcher.match("Sr Data-Engineer (Remote)") == "senior data engineer"
+    assert matcher.match("SWE II, Payments") == "software engineer"
+    assert matcher.match("Software Developer") == "software engineer"
+    assert matcher.match("Solution Architect - AWS") == "solutions architect"
+
+
+def test_word_boundaries():
+    """Roles only match whole words."""
+    matcher = RoleMatcher(ROLES)
+    assert matcher.match("Metadata Engineer") is None
+    assert matcher.match("Answer Engineer") is None  # "swe" inside a word
+
+
+def test_matcher_is_shared():
+    """Scrapers asking for the same roles get the same compiled matcher."""
+    assert get_role_matcher(ROLES) is get_role_matcher(list(ROLES))
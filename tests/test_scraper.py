@@ -0,0 +1,276 @@
+"""Tests for the scraper orchestrator."""
+import threading
+import time
+
+from jobminer.config import settings
+from jobminer.models import Job, ScrapingResult, dump_jobs, load_jobs
+from jobminer.scraper import JobScraperOrchestrator
+from jobminer.scrapers.base import BaseScraper
+from jobminer.watermarks import WatermarkStore
+
+
+class FakeScraper(BaseScraper):
+    """Scraper returning canned jobs after an optional delay."""
+
+    def __init__(self, name: str, delay: float = 0.0, fail: bool = False):
+        super().__init__(name)
+        self.delay = delay
+        self.fail = fail
+
+    def scrape(self, keywords, max_jobs=50):
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("boom")
+        return [
+            Job(
+                title="Senior Data Engineer",
+                company="Snowflake",
+                url=f"https://example.com/{self.name}/1",
+                location="Remote",
+                is_remote=True,
+            )
+        ]
+
+
+def make_orchestrator(tmp_path, scrapers):
+    orchestrator = JobScraperOrchestrator(data_dir=tmp_path)
+    orchestrator.scrapers = scrapers
+    return orchestrator
+
+
+def test_scrape_all_runs_sources_concurrently(tmp_path, monkeypatch):
+    """Sources run in parallel and results keep scraper order."""
+    monkeypatch.setattr(settings, "scrape_concurrency", 4)
+    scrapers = [FakeScraper(f"src{i}", delay=0.3) for i in range(4)]
+    orchestrator = make_orchestrator(tmp_path, scrapers)
+    result = ScrapingResult(run_id="test")
+
+    start = time.monotonic()
+    jobs = orchestrator._scrape_all(["data engineer"], result)
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 1.0
+    assert [str(job.url) for job in jobs] == [f"https://example.com/src{i}/1" for i in range(4)]
+    assert sorted(result.sources) == ["src0", "src1", "src2", "src3"]
+    assert result.errors == []
+
+
+def test_scrape_all_records_errors_and_timeouts(tmp_path, monkeypatch):
+    """Failing and slow sources are reported without losing the others."""
+    monkeypatch.setattr(settings, "scrape_timeout_seconds", 0.5)
+    scrapers = [
+        FakeScraper("ok"),
+        FakeScraper("broken", fail=True),
+        FakeScraper("slow", delay=3.0),
+    ]
+    orchestrator = make_orchestrator(tmp_path, scrapers)
+    result = ScrapingResult(run_id="test")
+
+    jobs = orchestrator._scrape_all(["data engineer"], result)
+
+    assert len(jobs) == 1
+    assert result.sources == ["ok"]
+    assert any("broken" in error for error in result.errors)
+    assert any("slow" in error and "timed out" in error for error in result.errors)
+
+
+class StreamingScraper(BaseScraper):
+    """Scraper yielding jobs one at a time with a delay between them."""
+
+    def __init__(self, name: str, count: int, delay: float):
+        super().__init__(name)
+        self.count = count
+        self.delay = delay
+
+    def iter_jobs(self, keywords, max_jobs=50):
+        for i in range(self.count):
+            time.sleep(self.delay)
+            yield Job(title="Data Engineer", company="Snowflake",
+                      url=f"https://example.com/{self.name}/{i}", location="Remote", is_remote=True)
+
+
+class WatermarkedScraper(StreamingScraper):
+    """Streaming scraper recording its listings in a watermark, staged when it stops."""
+
+    def iter_jobs(self, keywords, max_jobs=50):
+        tracker = self.watermark_tracker(self.name)
+        try:
+            for job in super().iter_jobs(keywords, max_jobs):
+                if tracker.is_new(str(job.url)):
+                    yield job
+        finally:
+            self.stage_watermark(self.name, tracker)
+
+
+def test_scrape_all_does_not_hold_sources_while_one_is_blocked(tmp_path, monkeypatch):
+    """A source whose emit blocks on a full queue neither stalls the others nor its timeout."""
+    monkeypatch.setattr(settings, "scrape_concurrency", 2)
+    monkeypatch.setattr(settings, "scrape_timeout_seconds", 0.5)
+    orchestrator = make_orchestrator(tmp_path, [
+        StreamingScraper("blocked", count=2, delay=0),
+        StreamingScraper("free", count=1, delay=0.1),
+    ])
+    result = ScrapingResult(run_id="test")
+    drained = threading.Event()
+    free_emitted_at = []
+    errors_before_drain = []
+
+    def emit(job):
+        if job.url.path.startswith("/blocked/"):
+            drained.wait(3)  # Stands in for a full queue drained only later
+        else:
+            free_emitted_at.append(time.monotonic() - start)
+
+    def drain():
+        errors_before_drain.extend(result.errors)
+        drained.set()
+
+    start = time.monotonic()
+    threading.Timer(1.0, drain).start()
+    orchestrator._scrape_all(["data engineer"], result, emit=emit)
+
+    assert free_emitted_at[0] < 0.5
+    assert any("blocked" in error and "timed out" in error for error in errors_before_drain)
+
+
+def test_abandoned_source_keeps_its_dropped_listing_new(tmp_path, monkeypatch):
+    """The job an abandoned source had in hand is not watermarked, so the next run sees it."""
+    monkeypatch.setattr(settings, "scrape_timeout_seconds", 0.5)
+    watermarks = WatermarkStore(tmp_path / "watermarks.json")
+    scraper = WatermarkedScraper("slow", count=3, delay=0.4)
+    scraper.watermarks = watermarks
+    orchestrator = make_orchestrator(tmp_path, [scraper])
+    emitted = []
+
+    orchestrator._scrape_all(["data engineer"], ScrapingResult(run_id="test"), emit=emitted.append)
+    time.sleep(0.5)  # Let the abandoned worker reach its next job and stop
+    watermarks.commit()
+
+    tracker = WatermarkStore(tmp_path / "watermarks.json").tracker("slow")
+    assert len(emitted) == 1
+    assert all(tracker.is_new(f"https://example.com/slow/{i}") for i in range(1, 3))
+
+
+class RecordingFilter:
+    """Stand-in LLM filter recording when each batch was scored."""
+
+    def __init__(self):
+        self.scored_at = []
+
+    def batch_analyze(self, jobs, user_criteria):
+        self.scored_at.append(time.monotonic())
+        for job in jobs:
+            job.relevance_score = 0.0 if job.url.path.endswith("/0") else 0.9
+        return jobs
+
+
+def test_run_streams_jobs_through_scoring(tmp_path, monkeypatch):
+    """Scoring starts before the slowest source finishes; duplicates are dropped."""
+    monkeypatch.setattr(settings, "pipeline_batch_size", 2)
+    monkeypatch.setattr(settings, "pipeline_flush_seconds", 0.05)
+    monkeypatch.setattr(settings, "output_format", "json")
+    llm_filter = RecordingFilter()
+    orchestrator = make_orchestrator(tmp_path, [
+        StreamingScraper("fast", count=2, delay=0.01),
+        StreamingScraper("fast", count=2, delay=0.01),  # Same URLs again
+        StreamingScraper("slow", count=3, delay=0.3),
+    ])
+    orchestrator.llm_filter = llm_filter
+
+    start = time.monotonic()
+    result = orchestrator.run()
+    finished = time.monotonic()
+
+    assert result.jobs_found == 7
+    assert result.jobs_filtered == 3  # Unique jobs scoring >= 0.5
+    assert result.jobs_saved == 3
+    assert llm_filter.scored_at[0] - start < (finished - start) / 2
+    assert (tmp_path / "jobs_latest.json").exists()
+    assert (tmp_path / "http_cache" / "index.json").exists()  # Cache kept in the run's data dir
+
+
+def test_run_skips_scoring_known_jobs(tmp_path, monkeypatch):
+    """Jobs already stored are not sent to the LLM again."""
+    monkeypatch.setattr(settings, "output_format", "json")
+    orchestrator = make_orchestrator(tmp_path, [StreamingScraper("src", count=2, delay=0)])
+    orchestrator.llm_filter = None
+    orchestrator.run()
+
+    llm_filter = RecordingFilter()
+    orchestrator.llm_filter = llm_filter
+    result = orchestrator.run()
+
+    assert result.jobs_found == 2
+    assert llm_filter.scored_at == []
+    assert result.jobs_saved == 2
+
+
+class FailingFilter:
+    """Stand-in LLM filter whose calls all fail."""
+
+    def batch_analyze(self, jobs, user_criteria):
+        raise RuntimeError("LLM down")
+
+
+def test_run_rescores_jobs_saved_unscored(tmp_path, monkeypatch):
+    """Jobs saved unscored during an outage are scored on the next run."""
+    monkeypatch.setattr(settings, "output_format", "json")
+    monkeypatch.setattr(settings, "prescore_enabled", False)
+    orchestrator = make_orchestrator(tmp_path, [StreamingScraper("src", count=2, delay=0)])
+    orchestrator.llm_filter = FailingFilter()
+    result = orchestrator.run()
+
+    assert result.unscored == 2
+    assert result.jobs_saved == 2
+    assert all(job.llm_analysis.startswith("Unscored: ") for job in orchestrator.job_store.load())
+
+    orchestrator.scrapers = []  # Nothing new; the stored jobs are requeued anyway
+    llm_filter = RecordingFilter()
+    orchestrator.llm_filter = llm_filter
+    result = orchestrator.run()
+
+    assert len(llm_filter.scored_at) == 1
+    assert result.unscored == 0
+    assert result.jobs_saved == 1  # The job scoring 0.0 leaves the results
+    assert sorted(job.relevance_score for job in orchestrator.job_store.load()) == [0.0, 0.9]
+
+    result = orchestrator.run()
+    assert len(llm_filter.scored_at) == 1
+    assert result.jobs_saved == 0
+
+
+def test_run_skips_near_duplicates_dropped_before(tmp_path, monkeypatch):
+    """A URL stored as another job's alternate is not scored and saved as a new job."""
+    monkeypatch.setattr(settings, "output_format", "json")
+    stored = Job(title="Data Engineer", company="Snowflake", url="https://example.com/other/0",
+                 location="Remote", is_remote=True, relevance_score=0.9,
+                 alternate_urls=["https://example.com/src/0"])
+    orchestrator = make_orchestrator(tmp_path, [StreamingScraper("src", count=1, delay=0)])
+    orchestrator.job_store.append([stored])
+    llm_filter = RecordingFilter()
+    orchestrator.llm_filter = llm_filter
+    result = orchestrator.run()
+
+    assert result.jobs_found == 1
+    assert llm_filter.scored_at == []
+    assert [job.id for job in orchestrator.job_store.load()] == [stored.id]
+
+
+def test_run_imports_legacy_history_and_appends_only_new_jobs(tmp_path, monkeypatch):
+    """History in jobs_latest.json moves into the job store; runs append to it."""
+    monkeypatch.setattr(settings, "output_format", "json,csv")
+    legacy = Job(title="Staff Data Engineer", company="Snowflake", url="https://example.com/old/1",
+                 location="Remote", is_remote=True, relevance_score=0.9)
+    (tmp_path / "jobs_latest.json").write_bytes(dump_jobs([legacy]))
+    orchestrator = make_orchestrator(tmp_path, [StreamingScraper("src", count=2, delay=0)])
+    orchestrator.llm_filter = None
+    result = orchestrator.run()
+
+    assert result.jobs_saved == 3
+    assert len((tmp_path / "jobs.jsonl").read_text().splitlines()) == 3
+    assert len(load_jobs((tmp_path / f"jobs_{result.run_id}.json").read_bytes())) == 2
+    assert {job.id for job in load_jobs((tmp_path / "jobs_latest.json").read_bytes())} == \
+        {job.id for job in orchestrator.job_store.load()}
+
+    orchestrator.run()
+    assert len((tmp_path / "jobs.jsonl").read_text().splitlines()) == 3
@@ -0,0 +1,30 @@
+"""Tests for canonical job URLs and IDs."""
+from jobminer.models import Job
+from jobminer.urls import canonical_url, job_id
+
+
+def test_canonical_url_removes_variants():
+    """Scheme, host case, www, slashes, tracking parameters and fragments are normalized."""
+    assert canonical_url("http://www.Example.com//jobs/1/?utm_source=x&b=2&a=1#apply") == \
+        "https://example.com/jobs/1?a=1&b=2"
+    assert canonical_url("https://remoteok.com/remote-jobs/123?ref=feed") == \
+        "https://remoteok.com/remote-jobs/123"
+    # Parameters that identify the posting are kept
+    assert canonical_url("https://example.com/careers?gh_jid=42&gh_src=li") == \
+        "https://example.com/careers?gh_jid=42"
+
+
+def test_job_ids_are_stable():
+    """URL variants of one posting share an ID; different postings do not."""
+    assert job_id("https://example.com/jobs/1") == job_id("http://www.example.com/jobs/1/?utm_medium=email")
+    assert job_id("https://example.com/jobs/1") != job_id("https://example.com/jobs/2")
+
+
+def test_job_id_derived_and_legacy_ids_replaced():
+    """Jobs get their ID from the URL, including ones stored with timestamp IDs."""
+    fields = dict(title="Data Engineer", company="Snowflake", location="Remote", is_remote=True)
+    job = Job(url="https://example.com/jobs/1?utm_source=feed", **fields)
+    legacy = Job(id="1712345678.123", url="https://example.com/jobs/1", **fields)
+
+    assert job.id == legacy.id == job_id("https://example.com/jobs/1")
+    assert Job(id=job.id, url="https://example.com/moved", **fields).id == job.id
@@ -0,0 +1,73 @@
+"""Tests for per-source incremental scraping watermarks."""
+from jobminer.watermarks import Watermark, WatermarkStore, WatermarkTracker
+
+
+def test_ordered_feed_complete_scan_raises_high_water():
+    """After a full scan only listings above the mark are new."""
+    tracker = WatermarkTracker()
+    assert all(tracker.is_new(str(i), f"{i:04d}") for i in (30, 20, 10))
+    tracker.complete()
+    watermark = tracker.result()
+    assert watermark.high_water == "0030"
+    assert watermark.seen == {}
+
+    next_run = WatermarkTracker(watermark)
+    assert next_run.is_new("40", "0040")
+    assert not next_run.is_new("30", "0030")
+    assert not next_run.is_new("20", "0020")
+    assert next_run.consecutive_known == 2
+
+
+def test_partial_scan_keeps_unprocessed_listings_new():
+    """Stopping early must not hide older listings that were never looked at."""
+    tracker = WatermarkTracker(Watermark(high_water="0010"))
+    assert tracker.is_new("30", "0030")  # Stopped after this one
+    watermark = tracker.result()
+    assert watermark.high_water == "0010"
+
+    next_run = WatermarkTracker(watermark)
+    assert not next_run.is_new("30", "0030")
+    assert next_run.is_new("20", "0020")
+
+
+def test_updated_listing_is_new_again():
+    """A posting whose ordering value changed is processed again."""
+    tracker = WatermarkTracker(Watermark(seen={"7": "2024-01-01T00:00:00+00:00"}))
+    assert not tracker.is_new("7", "2024-01-01T00:00:00+00:00")
+    assert tracker.is_new("7", "2024-02-01T00:00:00+00:00")
+
+
+def test_unordered_source_prunes_removed_postings():
+    """Seen ids of postings that disappeared are dropped after a full scan."""
+    tracker = WatermarkTracker(Watermark(seen={"a": "", "gone": ""}))
+    assert not tracker.is_new("a")
+    assert tracker.is_new("b")
+    tracker.complete()
+    assert tracker.result().seen == {"a": "", "b": ""}
+
+
+def test_store_commits_and_resets_on_config_change(tmp_path):
+    """Staged progress is written on commit and discarded for new settings."""
+    path = tmp_path / "watermarks.json"
+    store = WatermarkStore(path, fingerprint="roles-a")
+    tracker = store.tracker("lever:plaid")
+    tracker.is_new("p1")
+    tracker.complete()
+    store.stage("lever:plaid", tracker)
+    assert WatermarkStore(path, fingerprint="roles-a").get("lever:plaid") is None
+
+    store.commit()
+    assert WatermarkStore(path, fingerprint="roles-a").get("lever:plaid").seen == {"p1": ""}
+    assert WatermarkStore(path, fingerprint="roles-b").get("lever:plaid") is None
+
+
+def test_forgotten_listing_stays_new():
+    """Listings whose jobs were not passed on are not recorded as processed."""
+    tracker = WatermarkTracker()
+    assert tracker.is_new("a") and tracker.is_new("b")
+    tracker.complete()
+    tracker.forget("b")
+
+    next_run = WatermarkTracker(tracker.result())
+    assert not next_run.is_new("a")
+    assert next_run.is_new("b")